@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*
+
+"""
+Benchmarks of the hot paths of ECCW.
+
+Run from the sources folder, results are saved as JSON and optionally compared
+with the results of a previous run::
+
+    $ python benchmarks/run.py -o before.json
+    $ python benchmarks/run.py -o after.json --compare before.json --threshold 0.1
+
+Comparison exits with status 1 if any benchmark is slower than the reference by
+more than the threshold (relative, on the best time per call).
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from math import pi
+from statistics import median
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+
+import eccw
+from eccw.eccw_compute import EccwCompute
+from eccw.eccw_plot import EccwPlot
+from eccw.eccw_explore import EccwExplore
+
+
+CASES = {
+    "compression": dict(phiB=30, phiD=10, beta=0, context="c"),
+    "extension": dict(phiB=30, phiD=10, beta=20, context="e"),
+    "fluids": dict(
+        phiB=30,
+        phiD=10,
+        beta=0,
+        context="c",
+        rho_f=1000,
+        rho_sr=3500,
+        delta_lambdaB=0.5,
+        delta_lambdaD=0.3,
+    ),
+}
+
+
+## Benchmarks #################################################################
+# Each benchmark makes its setup and returns the callable to time.
+
+
+def _on_solution(params: dict) -> EccwCompute:
+    """Return an EccwCompute set on the first alpha solution of params."""
+    foo = EccwCompute(**params)
+    inverse, normal = foo.compute("alpha")
+    foo.alpha = (inverse + normal)[0]
+    return foo
+
+
+def _compute(params: dict, solve_for: str) -> "function":
+    foo = _on_solution(params)
+    return lambda: foo.compute(solve_for)
+
+
+def _init_plot(params: dict) -> "function":
+    return lambda: EccwPlot(**params)
+
+
+def _add_curve(params: dict) -> "function":
+    foo = EccwPlot(**params)
+
+    def run():
+        foo.reset_figure()
+        foo.add_curve()
+
+    return run
+
+
+def _add_sketch(params: dict) -> "function":
+    foo = EccwPlot(**params)
+    foo.alpha = _on_solution(params).alpha
+    foo.add_curve()
+
+    def run():
+        foo.reset_figure()
+        foo.add_sketch()
+
+    return run
+
+
+def _update_curve(params: dict, blit: bool) -> "function":
+    foo = EccwPlot(**params)
+    foo.reset_figure()
+    foo.add_curve(id="curve")
+    foo.figure.canvas.draw()
+    return lambda: foo.update_curve("curve", blit=blit)
+
+
+def _matrix_of_function_to_root(params: dict, N: int) -> "function":
+    foo = EccwExplore(**params)
+    X = np.linspace(-pi / 2, pi / 2, N)
+    return lambda: foo._matrix_of_function_to_root(X, X, X, foo._runtime_alpha)
+
+
+def _import_eccw() -> "function":
+    code = (
+        "from time import perf_counter; t = perf_counter(); import eccw; "
+        "print(perf_counter() - t)"
+    )
+    # Timed in a fresh interpreter: the returned value replaces timeit's one.
+    return lambda: float(subprocess.check_output([sys.executable, "-c", code]))
+
+
+def benchmarks() -> dict:
+    """Return the setups of all benchmarks, by name."""
+    out = {}
+    for case, params in CASES.items():
+        for solve_for in ("alpha", "beta", "phiB", "phiD"):
+            name = f"compute_{solve_for}[{case}]"
+            out[name] = lambda p=params, s=solve_for: _compute(p, s)
+    out["init_plot"] = lambda: _init_plot(CASES["compression"])
+    out["add_curve"] = lambda: _add_curve(CASES["compression"])
+    out["add_sketch"] = lambda: _add_sketch(CASES["compression"])
+    out["update_curve"] = lambda: _update_curve(CASES["compression"], False)
+    out["update_curve[blit]"] = lambda: _update_curve(CASES["compression"], True)
+    for N in (32, 64, 128):
+        out[f"matrix_of_function_to_root[N={N}]"] = (
+            lambda N=N: _matrix_of_function_to_root(CASES["compression"], N)
+        )
+    out["import_eccw"] = _import_eccw
+    return out
+
+
+## Runner #####################################################################
+
+
+def measure(func: "function", repeat: int, budget: float, timed: bool) -> dict:
+    """Time func, calling it enough times per repeat to fill 'budget' seconds.
+
+    With timed=True, func returns its own duration which is used instead.
+    """
+    if timed:
+        times = [func() for _ in range(repeat)]
+        number = 1
+    else:
+        timer = timeit.Timer(func)
+        number, elapsed = timer.autorange()
+        number = max(1, int(number * budget / max(elapsed, 1e-9)))
+        times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "best": min(times),
+        "median": median(times),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def compare(results: dict, reference: dict, threshold: float) -> list:
+    """Print ratios of results to reference, return names of regressions."""
+    regressions = []
+    for name, result in results.items():
+        if name not in reference:
+            continue
+        ratio = result["best"] / reference[name]["best"]
+        flag = ""
+        if ratio > 1.0 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:45s} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def metadata() -> dict:
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "eccw": eccw.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", help="JSON file to save results in")
+    parser.add_argument("--compare", help="JSON file of reference results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown counted as a regression (default: 0.1)",
+    )
+    parser.add_argument(
+        "-k", dest="select", default="", help="only run benchmarks containing this"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=0.2, help="seconds per repeat (default: 0.2)"
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, setup in benchmarks().items():
+        if args.select not in name:
+            continue
+        func = setup()
+        try:
+            func()
+        except RuntimeError as error:
+            # Known non-converging cases are reported, not timed.
+            print(f"{name:45s} {'failed':>12s}  ({str(error).splitlines()[0]})")
+            continue
+        result = measure(func, args.repeat, args.budget, name == "import_eccw")
+        results[name] = result
+        print(f"{name:45s} {result['best'] * 1e6:12.1f} µs")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"metadata": metadata(), "results": results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            reference = json.load(file)["results"]
+        print()
+        if compare(results, reference, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,25 +36,47 @@ Exact Critical Coulomb Wedge
 
 """
 
-import pkg_resources
+from importlib import import_module, metadata
 from os import path
-from setuptools.config import read_configuration
 
-from eccw.eccw_compute import EccwCompute
-from eccw.eccw_plot import EccwPlot
 
+# Public objects, imported from their submodule only when first accessed.
+_lazy_objects = {
+    "EccwCompute": "eccw.eccw_compute",
+    "ConvergenceError": "eccw.eccw_compute",
+    "EccwPlot": "eccw.eccw_plot",
+    "EccwExplore": "eccw.eccw_explore",
+    "collect_stats": "eccw.stats",
+}
 
-def _extract_metadata(metadata_name):
-    """Get metadata from pip installation."""
-    return getattr(pkg_resources.get_distribution("eccw"), metadata_name)
 
-try:
-    __version__ = _extract_metadata("version")
-except pkg_resources.DistributionNotFound:
-    _conf = read_configuration(path.join(
-        path.dirname(path.dirname(__file__)), 'setup.cfg')
-        )
-    __version__ = _conf['metadata']["version"]
+def __getattr__(name):
+    try:
+        module = import_module(_lazy_objects[name])
+    except KeyError:
+        raise AttributeError(f"module 'eccw' has no attribute '{name}'") from None
+    obj = getattr(module, name)
+    globals()[name] = obj  # Next accesses do not go through __getattr__.
+    return obj
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_objects))
+
+
+def _extract_version():
+    """Get version from pip installation, or from setup.cfg of sources."""
+    try:
+        return metadata.version("eccw")
+    except metadata.PackageNotFoundError:
+        from configparser import ConfigParser
+
+        conf = ConfigParser()
+        conf.read(path.join(path.dirname(path.dirname(__file__)), "setup.cfg"))
+        return conf["metadata"]["version"]
+
+
+__version__ = _extract_version()
 
 __authors__ = [
     'BCL Mary',
@@ -71,6 +93,9 @@ __contact__ = "baptiste.mary@u-cergy.fr"
 
 __all__ = [
     'EccwCompute',
+    'ConvergenceError',
     'EccwPlot',
+    'EccwExplore',
+    'collect_stats',
     ]
 
@@ -6,8 +6,155 @@ Elements dedicated to solve physics.
 """
 
 import numpy as np
-from math import pi, cos, sin, tan, atan, asin, nan, inf, degrees, radians
-from collections import OrderedDict
+from math import pi, cos, sin, tan, atan, asin, nan, inf, degrees, radians, remainder
+from collections import OrderedDict, deque, namedtuple
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+from eccw import feasibility, stats
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class ConvergenceError(RuntimeError):
+    """A solve of the "function to root" did not converge.
+
+    'X' is the last iterate (var, psiD, psi0) [rad], 'iterations' the number
+    of iterations made, and 'reason' tells why the solve was given up:
+
+    * 'max_iterations': too many iterations;
+    * 'nan': the residual is not a number;
+    * 'divergence': the residual grew far beyond the initial one;
+    * 'stagnation': the residual stopped decreasing.
+    """
+
+    def __init__(self, message: str, X: tuple, reason: str, iterations: int):
+        RuntimeError.__init__(self, message)
+        self.X = tuple(X)
+        self.reason = reason
+        self.iterations = iterations
+
+    def __reduce__(self):
+        return self.__class__, (str(self), self.X, self.reason, self.iterations)
+
+
+def _cached(solved: str) -> "function":
+    """Decorate a compute_* method to look up results in the instance cache.
+
+    'solved' is the name of the parameter computed by the method. Does nothing
+    more than calling the method while the cache is disabled (see
+    BaseEccwCompute.enable_cache).
+    """
+
+    def decorator(method: "function") -> "function":
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self._cache
+            if cache is None:
+                return method(self, *args, **kwargs)
+            key = self._cache_key(method.__name__, solved, args, kwargs)
+            if key in cache:
+                self._cache_hits += 1
+                cache.move_to_end(key)
+                return cache[key]
+            self._cache_misses += 1
+            result = cache[key] = method(self, *args, **kwargs)
+            if len(cache) > self._cache_maxsize:
+                cache.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class Trajectory(object):
+    """Iterates (var, psiD, psi0) [rad] of the last solve of EccwCompute.
+
+    With maxlen=None, the full trace is stored into a preallocated array
+    (grown if ever needed), else only the last 'maxlen' iterates are kept.
+    """
+
+    def __init__(self, maxlen: "int or None" = None, size: int = 1024):
+        self.maxlen = maxlen
+        self._ring = None if maxlen is None else deque(maxlen=maxlen)
+        self._array = np.empty((size, 3)) if maxlen is None else None
+        self.count = 0  # Number of iterates appended since last reset.
+
+    def __len__(self):
+        return len(self._ring) if self._ring is not None else self.count
+
+    def reset(self) -> None:
+        self.count = 0
+        if self._ring is not None:
+            self._ring.clear()
+
+    def append(self, X: tuple) -> None:
+        if self._ring is not None:
+            self._ring.append(tuple(X))
+        else:
+            if self.count == len(self._array):
+                self._array = np.resize(self._array, (2 * self.count, 3))
+            self._array[self.count] = X
+        self.count += 1
+
+    def iterates(self) -> np.array:
+        """Return recorded iterates as a (n, 3) array, oldest first."""
+        if self._ring is not None:
+            return np.array(self._ring, dtype=float).reshape(-1, 3)
+        return self._array[: self.count].copy()
+
+
+class BetaBranches(namedtuple("BetaBranches", ["dl", "ur", "dr", "ul", "valid"])):
+    """Fixed-shape result of BaseEccwCompute.compute_beta_many.
+
+    dl, ur, dr, ul are arrays of beta for the four branches of the critical
+    enveloppe (down-left, up-right, down-right, up-left), NaN where the branch
+    has no physical solution. valid is a boolean array of shape (4, ...)
+    stacking the validity masks in the same order.
+    """
+
+    __slots__ = ()
+
+    @property
+    def inverse(self) -> np.ndarray:
+        """Tectonic (inverse faults) branches stacked as (dl, dr)."""
+        return np.stack((self.dl, self.dr))
+
+    @property
+    def normal(self) -> np.ndarray:
+        """Collapsing (normal faults) branches stacked as (ul, ur)."""
+        return np.stack((self.ul, self.ur))
+
+
+class EccwState(
+    namedtuple(
+        "EccwState",
+        [
+            "sign",
+            "alpha",
+            "beta",
+            "phiB",
+            "phiD",
+            "rho_f",
+            "rho_sr",
+            "delta_lambdaB",
+            "delta_lambdaD",
+            "precision",
+        ],
+        defaults=("exact",),
+    )
+):
+    """Compact and picklable set of parameters of BaseEccwCompute.
+
+    Angles are in radians and phiD is unsigned, sign being +1 in compression
+    and -1 in extension. precision is the tier of solvers, 'exact' if omitted.
+    See BaseEccwCompute.state and from_state.
+    """
+
+    __slots__ = ()
 
 
 class BaseEccwCompute(object):
@@ -17,10 +164,36 @@ class BaseEccwCompute(object):
     Based on [Yuan, 2015], https://doi.org/10.1002/2014JB011612
     """
 
-    # _numtol = 1e-12  # Convergence with 5 digits after degrees conversion.
-    _numtol = 1e-15  # Convergence with 8 digits after degrees conversion.
+    _numtol = 1e-15  # Tolerance on bounds of physical solutions.
+    # Tolerance on residuals of solvers by precision tier (see precision).
+    _precisions = {"fast": 1e-8, "standard": 1e-12, "exact": 1e-15}
     _h = 1e-6  # Arbitrary small value
     _main_params_list = ["alpha", "beta", "phiB", "phiD"]
+    _many_params_list = [
+        "alpha",
+        "beta",
+        "phiB",
+        "phiD",
+        "rho_f",
+        "rho_sr",
+        "delta_lambdaB",
+        "delta_lambdaD",
+    ]
+
+    _cache = None  # Results cache, disabled by default.
+    _cache_state = (
+        "_sign",
+        "_alpha",
+        "_beta",
+        "_phiB",
+        "_phiD",
+        "_density_ratio",
+        "_delta_lambdaB",
+        "_delta_lambdaD",
+        "_numtol",
+        "_restol",
+        "_h",
+    )
 
     def reset(self):
         """Set all parameters to an (meaningless) initial state."""
@@ -41,12 +214,16 @@ class BaseEccwCompute(object):
         self._lambdaD_D2 = 0.0  # lambdaD parametrized as Dahlen, 1984
         self._taper_min = -self._numtol
         self._taper_max = +inf
+        self.precision = "exact"
 
     def __init__(self, **kwargs):
         """See 'Data descriptors' section of help for available named parameters."""
         self.reset()
         self.set_params(**kwargs)
 
+    def __reduce__(self):
+        return self.__class__.from_state, (self.state(),)
+
     def __repr__(self):
         out = self.__class__.__name__ + "("
         for key, value in self.params_table().items():
@@ -211,6 +388,25 @@ class BaseEccwCompute(object):
         except TypeError:
             raise TypeError(self._error_message("delta_lambdaD", "type", "a float"))
 
+    @property
+    def precision(self):
+        """Precision tier of solvers: 'fast', 'standard' or 'exact' (default).
+
+        Returned angles are accurate within 1e-4° with 'fast', 1e-8° with
+        'standard' and 1e-11° with 'exact', the latter being close to round-off
+        and so more likely to stall.
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, value):
+        try:
+            self._restol = self._precisions[value]
+        except (KeyError, TypeError):
+            tiers = "'fast', 'standard' or 'exact'"
+            raise ValueError(self._error_message("precision", "value", tiers))
+        self._precision = value
+
     ## 'Private' methods ######################################################
 
     def _check_params_with_raise(self) -> None:
@@ -280,6 +476,21 @@ class BaseEccwCompute(object):
         """Compute alpha prime as [Yuan, 2015], equation (B6)."""
         return atan((1 - self._density_ratio) / (1 - lambdaB_D2) * tan(alpha))
 
+    def _d_convert_lambda(self, alpha, lambdaX, density_ratio):
+        """Derivative of _convert_lambda with respect to alpha."""
+        return 2.0 * (lambdaX - density_ratio) * np.tan(alpha) / np.cos(alpha) ** 2.0
+
+    def _d_convert_alpha(self, alpha, lambdaB_D2, d_lambdaB_D2, density_ratio):
+        """Derivative of _convert_alpha with respect to alpha.
+
+        d_lambdaB_D2 is the derivative of lambdaB_D2 with respect to alpha.
+        """
+        k = (1 - density_ratio) / (1 - lambdaB_D2)
+        u = k * np.tan(alpha)
+        du = k / np.cos(alpha) ** 2.0
+        du = du + np.tan(alpha) * k * d_lambdaB_D2 / (1 - lambdaB_D2)
+        return du / (1.0 + u ** 2.0)
+
     def _PSI_D(
         self,
         psi0: float,
@@ -302,12 +513,142 @@ class BaseEccwCompute(object):
         tmp = sin(alpha_prime) / sin(phiB)
         return (asin(tmp) - alpha_prime) * 0.5, (pi - asin(tmp) - alpha_prime) * 0.5
 
+    def _get_alphamax(self) -> float:
+        """Maximum surface slope of the critical enveloppe [rad]."""
+        alphamax = feasibility.alphamax(self._phiB, self._density_ratio, self._lambdaB)
+        return float(alphamax)
+
     def _is_valid_taper(self, a: float, b: float) -> bool:
         return self._taper_min < a + b < self._taper_max
 
     def _degrees_if_not_none(self, value: "float or None") -> "float or None":
         return degrees(value) if value is not None else None
 
+    def _params_domain(self, phiB, phiD, density_ratio, delta_lambdaB, delta_lambdaD):
+        """Vectorized counterpart of check_params: True where parameters are sane."""
+        return feasibility.params_domain(
+            phiB, phiD, density_ratio, delta_lambdaB, delta_lambdaD
+        )
+
+    def _beta_branches(self, alpha, phiB, phiD, density_ratio, lambdaB, lambdaD):
+        """Vectorized computation of the 4 branches of beta [rad].
+
+        All parameters are arrays (or floats) broadcast together, angles in
+        radians, phiD signed by context. Return a tuple (dl, ur, dr, ul) of
+        arrays, NaN where the branch has no physical solution.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            alpha, phiB, phiD = np.broadcast_arrays(
+                *(np.asarray(x, dtype=float) for x in (alpha, phiB, phiD))
+            )
+            cos2 = np.cos(alpha) ** 2.0
+            lambdaB_D2 = density_ratio + (lambdaB - density_ratio) / cos2
+            lambdaD_D2 = density_ratio + (lambdaD - density_ratio) / cos2
+            alpha_prime = np.arctan(
+                (1 - density_ratio) / (1 - lambdaB_D2) * np.tan(alpha)
+            )
+            # Weird mask because asin in PSI_D is your ennemy !
+            in_domain = (-phiB <= alpha_prime) & (alpha_prime <= phiB)
+            asin0 = np.arcsin(np.sin(alpha_prime) / np.sin(phiB))
+            psi0_1 = (asin0 - alpha_prime) * 0.5
+            psi0_2 = (pi - asin0 - alpha_prime) * 0.5
+            sinD = np.sin(phiD)
+            ratio = (1.0 - lambdaD_D2) * sinD / (1.0 - lambdaB_D2) / np.sin(phiB)
+            shift = (lambdaD_D2 - lambdaB_D2) * sinD / (1.0 - lambdaB_D2)
+            psiDs = []
+            for psi0 in (psi0_1, psi0_2):
+                tmp = ratio + shift * np.cos(2.0 * psi0)
+                asinD = np.arcsin(tmp)
+                # Same fallback as _PSI_D.
+                over = tmp > 1
+                psiD_1 = np.where(over, 0.0, (asinD - phiD) * 0.5)
+                psiD_2 = np.where(over, 0.0, (pi - asinD - phiD) * 0.5)
+                psiDs.append((psiD_1, psiD_2))
+            (psiD_11, psiD_12), (psiD_21, psiD_22) = psiDs
+            betas = (
+                psiD_11 - psi0_1 - alpha,  # dl
+                psiD_12 - psi0_1 - alpha,  # ur
+                psiD_21 - psi0_2 - alpha + pi,  # dr, don't ask why +pi
+                psiD_22 - psi0_2 - alpha,  # ul
+            )
+            taper_max = pi / 2.0 - phiD + self._numtol
+            out = []
+            for beta in betas:
+                valid = in_domain & (self._taper_min < alpha + beta)
+                valid &= alpha + beta < taper_max
+                out.append(np.where(valid, beta, nan))
+        return tuple(out)
+
+    def _beta_branch(self, alpha: float, branch: int) -> float:
+        """Scalar value of one branch of beta [rad], NaN if no physical solution.
+
+        Branches are indexed as returned by _beta_branches: 0, 1, 2, 3 for
+        dl, ur, dr, ul.
+        """
+        lambdaB_D2 = self._convert_lambda(alpha, self._lambdaB)
+        lambdaD_D2 = self._convert_lambda(alpha, self._lambdaD)
+        alpha_prime = self._convert_alpha(alpha, lambdaB_D2)
+        if not -self._phiB <= alpha_prime <= self._phiB:
+            return nan
+        try:
+            psi0 = self._PSI_0(alpha_prime, self._phiB)[branch // 2]
+            psiD = self._PSI_D(psi0, self._phiB, self._phiD, lambdaB_D2, lambdaD_D2)
+        except ValueError:
+            return nan
+        beta = psiD[branch % 2] - psi0 - alpha + (pi if branch == 2 else 0.0)
+        return beta if self._is_valid_taper(alpha, beta) else nan
+
+    def _params_many(self, names: set, solve_for: str = None, **kwargs) -> dict:
+        """Return a dict of broadcast arrays of internal parameters.
+
+        Named parameters are given with the same units as the data descriptors,
+        as floats or arrays, and must belong to 'names'. Missing ones are taken
+        from self. Angles are returned in radians, phiD signed by context, along
+        with density_ratio, lambdaB, lambdaD and a 'sane' mask (see check_params).
+        The parameter 'solve_for' is unknown: it is set to NaN and does not
+        constrain the 'sane' mask.
+        """
+        unknown = set(kwargs) - set(names)
+        if unknown:
+            raise TypeError(
+                self._error_message(unknown.pop(), "name", f"among {sorted(names)}")
+            )
+
+        def get(name, internal, angle=False):
+            if kwargs.get(name) is None:
+                return internal
+            value = np.asarray(kwargs[name], dtype=float)
+            return np.radians(value) if angle else value
+
+        p = {
+            "alpha": get("alpha", self._alpha, angle=True),
+            "beta": get("beta", self._beta, angle=True),
+            "phiB": get("phiB", self._phiB, angle=True),
+            "phiD": get("phiD", self._sign * self._phiD, angle=True) * self._sign,
+            "rho_f": get("rho_f", self._rho_f),
+            "rho_sr": get("rho_sr", self._rho_sr),
+            "delta_lambdaB": get("delta_lambdaB", self._delta_lambdaB),
+            "delta_lambdaD": get("delta_lambdaD", self._delta_lambdaD),
+        }
+        if solve_for is not None:
+            p[solve_for] = nan
+        arrays = np.broadcast_arrays(*(np.asarray(v, float) for v in p.values()))
+        p = dict(zip(p, arrays))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p["density_ratio"] = np.where(
+                p["rho_sr"] != 0.0, np.divide(p["rho_f"], p["rho_sr"]), 0.0
+            )
+        p["lambdaB"] = p["delta_lambdaB"] + p["density_ratio"]
+        p["lambdaD"] = p["delta_lambdaD"] + p["density_ratio"]
+        p["sane"] = self._params_domain(
+            p["phiB"],
+            p["phiD"],
+            p["density_ratio"],
+            p["delta_lambdaB"],
+            p["delta_lambdaD"],
+        )
+        return p
+
     ## 'Public' methods #######################################################
 
     def compute_beta_old(self, deg=True) -> tuple:
@@ -343,6 +684,7 @@ class BaseEccwCompute(object):
         else:
             return None, None
 
+    @_cached("beta")
     def compute_beta(self, deg=True) -> tuple:
         """Get critical basal slope beta as ECCW.
 
@@ -394,6 +736,81 @@ class BaseEccwCompute(object):
         else:
             return tuple(), tuple()
 
+    def compute_beta_many(self, deg=True, **kwargs) -> BetaBranches:
+        """Get critical basal slope beta as ECCW for arrays of parameters.
+
+        Accepted named parameters are alpha, phiB, phiD, rho_f, rho_sr,
+        delta_lambdaB and delta_lambdaD, with the same units as the
+        corresponding data descriptors. Given values may be floats or arrays and
+        are broadcast together, missing ones are taken from self.
+
+        Return a BetaBranches named tuple of fixed-shape arrays: one per branch
+        (dl, ur, dr, ul), NaN where there is no physical solution, plus the
+        stacked validity masks. Unlike compute_beta, insane parameters are not
+        raised but masked.
+        """
+        names = set(self._many_params_list) - {"beta"}
+        p = self._params_many(names, **kwargs)
+        betas = self._beta_branches(
+            p["alpha"],
+            p["phiB"],
+            p["phiD"],
+            p["density_ratio"],
+            p["lambdaB"],
+            p["lambdaD"],
+        )
+        betas = tuple(np.where(p["sane"], b, nan) for b in betas)
+        if deg:
+            betas = tuple(np.degrees(b) for b in betas)
+        valid = ~np.isnan(np.stack(betas))
+        return BetaBranches(*betas, valid)
+
+    def enable_cache(self, maxsize: int = 128) -> None:
+        """Memoize results of compute_* methods, keeping at most 'maxsize' of them.
+
+        Results are keyed on the internal (radian) parameters, so values set
+        again in degrees hit the cache. Least recently used results are
+        evicted first. Enabling again resizes the cache and keeps counters.
+        """
+        if maxsize < 1:
+            raise ValueError(self._error_message("maxsize", "value", ">= 1"))
+        if self._cache is None:
+            self._cache = OrderedDict()
+            self._cache_hits = self._cache_misses = 0
+        self._cache_maxsize = maxsize
+        while len(self._cache) > maxsize:
+            self._cache.popitem(last=False)
+
+    def disable_cache(self) -> None:
+        """Stop memoizing results of compute_* methods and drop the cache."""
+        self._cache = None
+
+    def cache_info(self) -> CacheInfo:
+        """Return hits, misses, maxsize and current size of the cache.
+
+        All are zero while the cache is disabled.
+        """
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return CacheInfo(
+            self._cache_hits, self._cache_misses, self._cache_maxsize, len(self._cache)
+        )
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset its counters."""
+        if self._cache is not None:
+            self._cache.clear()
+            self._cache_hits = self._cache_misses = 0
+
+    def _cache_key(self, name: str, solved: str, args: tuple, kwargs: dict) -> tuple:
+        """Key of a call to method 'name' in the current state.
+
+        The solved parameter is left out of the state, since it is not an input.
+        """
+        ignored = "_" + solved
+        state = tuple(getattr(self, a) for a in self._cache_state if a != ignored)
+        return name, state, args, tuple(sorted(kwargs.items()))
+
     def show_params(self) -> None:
         out = self.__class__.__name__ + "(\n"
         for key, value in self.params_table().items():
@@ -437,57 +854,123 @@ class BaseEccwCompute(object):
         except TypeError:
             raise
 
+    @contextmanager
+    def _with_precision(self, precision: "str or None"):
+        """Set precision tier within a with statement, if not None."""
+        if precision is None:
+            yield
+            return
+        initial = self._precision
+        self.precision = precision
+        try:
+            yield
+        finally:
+            self.precision = initial
+
+    def state(self) -> EccwState:
+        """Return the parameters as a compact and picklable EccwState."""
+        return EccwState(
+            self._sign,
+            self._alpha,
+            self._beta,
+            self._phiB,
+            self._sign * self._phiD,
+            self._rho_f,
+            self._rho_sr,
+            self._delta_lambdaB,
+            self._delta_lambdaD,
+            self._precision,
+        )
+
+    def set_state(self, state: EccwState) -> None:
+        """Set all parameters at once from an EccwState, without any check."""
+        self._sign, self._alpha, self._beta, self._phiB = state[:4]
+        self._phiD = state.phiD * state.sign
+        self._rho_f, self._rho_sr = state.rho_f, state.rho_sr
+        self._delta_lambdaB = state.delta_lambdaB
+        self._delta_lambdaD = state.delta_lambdaD
+        self.precision = state.precision
+        self._set_density_ratio()
+        self._set_lambdaB()
+        self._set_lambdaD()
+        self._phiD_related_changes()
+
+    @classmethod
+    def from_state(cls, state: EccwState) -> "BaseEccwCompute":
+        """Build a new instance from an EccwState."""
+        new = cls()
+        new.set_state(state)
+        return new
+
     def set_no_fluids(self) -> None:
         """Shortcut of set_params method with all fluid parameters set to zero."""
         self.set_params(rho_f=0, rho_sr=0, delta_lambdaB=0, delta_lambdaD=0)
 
 
-class EmbeddedEccwCompute(BaseEccwCompute):
+class EccwCompute(BaseEccwCompute):
+
+    _bracket_points = 128  # Sampling of alpha when bracketing roots of branches.
+    _trajectory = None  # Recording of solver iterates, disabled by default.
+    _stagnation = 5  # Iterations without halving the residual before giving up.
+    _divergence = 1e6  # Growth of the residual from the initial one to give up.
+    _damped_stagnation = 30  # Same as _stagnation, for damped solves.
+    _roundoff = 1e-13  # Residual of a stalled solve taken as converged.
+
     def __init__(self, **kwargs):
         """See 'Data descriptors' section of help for available named parameters."""
         self.reset()
         self.set_params(**kwargs)
 
-    def _categorize_result(
-        self, value: float, inverse: list, normal: list, deg: bool = True
-    ) -> (list, list):
-        """Dirty way of categorize a result value using another instance of EccwCompute.
-        
-        Category is its membership of a result between tectonic or collapsing solutions.
+    ## Trajectory recording ##################################################
 
-        'value' parameter MUST be another parameter than beta. This value MUST be already
-        setted in this instance, and is used to compute the possible beta values according
-        with the other parameters. Since beta categories are well known, we can compare the
-        new computed betas with the reference one (the attribute of this instance). If the 
-        reference beta match one of the new betas, the matching category IS the category of
-        the given parameter 'value'.
+    def enable_trajectory(self, maxlen: "int or None" = None) -> None:
+        """Record the iterates of each solve of the "function to root".
+
+        With maxlen=None the full trace of the last solve is recorded, else only
+        its last 'maxlen' iterates. Recording is reset at the start of each
+        solve. See path and iter_conv.
         """
-        value = degrees(value) if deg else value
-        for (iolist, reflist) in zip(
-            (inverse, normal), self.compute_beta(deg=False)
-        ):
-            if any(abs(self._beta - beta) < self._h for beta in reflist):
-                # Is thre any duplicated result ?
-                if all(abs(value - other) > self._h for other in iolist):
-                    iolist.append(value)
-        return inverse, normal
+        if maxlen is not None and maxlen < 1:
+            raise ValueError(self._error_message("maxlen", "value", ">= 1"))
+        self._trajectory = Trajectory(maxlen)
 
+    def disable_trajectory(self) -> None:
+        """Stop recording iterates of solves."""
+        self._trajectory = None
 
-class EccwCompute(BaseEccwCompute):
-    def __init__(self, **kwargs):
-        """See 'Data descriptors' section of help for available named parameters."""
-        self.reset()
-        self.set_params(**kwargs)
-        self._embedded_compute = EmbeddedEccwCompute(**kwargs)
+    @property
+    def trajectory(self) -> "Trajectory or None":
+        """Recorded iterates of the last solve, None if recording is disabled."""
+        return self._trajectory
+
+    @property
+    def path(self) -> "list or None":
+        """Recorded iterates (var, psiD, psi0) [rad] of the last solve."""
+        if self._trajectory is None:
+            return None
+        return [tuple(X) for X in self._trajectory.iterates()]
+
+    @property
+    def iter_conv(self) -> "int or None":
+        """Number of iterations of the last recorded solve."""
+        if self._trajectory is None:
+            return None
+        return max(self._trajectory.count - 1, 0)
 
     def _test_alpha(self, a: float) -> "float or None":
         """Test if an alpha solution is physically meaningfull."""
         return a if self._is_valid_taper(a, self._beta) else None
 
     def _test_phiB(self, phiB: float) -> "float or None":
-        """Test if a phiB solution is physically meaningfull."""
-        # return phiB if -pi < phiB < pi else None
-        return phiB if -self._numtol < phiB < pi + self._numtol else None
+        """Test if a phiB solution is physically meaningfull.
+
+        Equations only depend on sin(phiB): aliases of a solution (modulo 2pi,
+        and pi - phiB) are brought back to [0, pi/2] before testing.
+        """
+        phiB = remainder(phiB, 2.0 * pi)
+        if phiB > pi / 2.0:
+            phiB = pi - phiB
+        return phiB if -self._numtol < phiB < pi / 2.0 + self._numtol else None
 
     def _test_phiD(self, phiD: float) -> "float or None":
         """Test if a phiD solution is physically meaningfull."""
@@ -495,6 +978,41 @@ class EccwCompute(BaseEccwCompute):
         # return phiD if phiD is not nan else None
         return phiD if -self._numtol < phiD < self._phiB + self._numtol else None
 
+    def _categorize(self, X: tuple, runtime_var: "function") -> (bool, bool):
+        """Tell if a solution is tectonic and/or collapsing.
+
+        X is the converged (var, psiD, psi0) of the solve of runtime_var. The
+        solution is on the tectonic (dl, dr) branches of psiD if
+        cos(2psiD + phiD) > 0, on the collapsing (ul, ur) ones if it is < 0
+        (see _PSI_D), and on both within _h of a double solution.
+        Return two booleans (is_inverse, is_normal), both False if the
+        solution is not physical, or if phiD has not the sign of the context.
+        """
+        var, psiD, psi0 = X
+        alpha, phiB, phiD, _, _, alpha_prime = runtime_var(var)
+        if self._sign * phiD < 0.0:
+            return False, False
+        if abs(phiD) > phiB or not -phiB <= alpha_prime <= phiB:
+            return False, False
+        if not self._taper_min < alpha + self._beta < pi / 2.0 - phiD + self._numtol:
+            return False, False
+        cos_D = cos(2.0 * psiD + phiD)
+        return cos_D > -self._h, cos_D < self._h
+
+    def _store_result(
+        self, value: float, categories: tuple, inverse: list, normal: list, deg: bool
+    ) -> (list, list):
+        """Append value to inverse and/or normal lists as told by categories.
+
+        'categories' are the two booleans returned by _categorize. Duplicated
+        results are skipped.
+        """
+        value = degrees(value) if deg else value
+        for iolist, is_in in zip((inverse, normal), categories):
+            if is_in and all(abs(value - other) > self._h for other in iolist):
+                iolist.append(value)
+        return inverse, normal
+
     def _runtime_alpha(self, alpha: float) -> tuple:
         """return a set of values disconnected from self's attributes.
 
@@ -540,6 +1058,32 @@ class EccwCompute(BaseEccwCompute):
             self._alpha_prime,
         )
 
+    def _runtime_alpha_derivative(self, alpha: float) -> tuple:
+        """Derivatives with respect to alpha of the values of _runtime_alpha."""
+        ratio = self._density_ratio
+        lambdaB_D2 = self._convert_lambda(alpha, self._lambdaB)
+        d_lambdaB_D2 = self._d_convert_lambda(alpha, self._lambdaB, ratio)
+        d_lambdaD_D2 = self._d_convert_lambda(alpha, self._lambdaD, ratio)
+        d_alpha_prime = self._d_convert_alpha(alpha, lambdaB_D2, d_lambdaB_D2, ratio)
+        return (1.0, 0.0, 0.0, d_lambdaB_D2, d_lambdaD_D2, d_alpha_prime)
+
+    def _runtime_phiB_derivative(self, phiB: float) -> tuple:
+        """Derivatives with respect to phiB of the values of _runtime_phiB."""
+        return (0.0, 1.0, 0.0, 0.0, 0.0, 0.0)
+
+    def _runtime_phiD_derivative(self, phiD: float) -> tuple:
+        """Derivatives with respect to phiD of the values of _runtime_phiD."""
+        return (0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+
+    def _runtime_derivative(self, runtime_var: "function") -> "function":
+        """Return the derivative counterpart of a _runtime_* method."""
+        parser = {
+            self._runtime_alpha: self._runtime_alpha_derivative,
+            self._runtime_phiB: self._runtime_phiB_derivative,
+            self._runtime_phiD: self._runtime_phiD_derivative,
+        }
+        return parser[runtime_var]
+
     def _function1(self, alpha: float, beta: float, psiD: float, psi0: float) -> float:
         """First sub-function of function to root."""
         return alpha + beta - psiD + psi0
@@ -585,208 +1129,860 @@ class EccwCompute(BaseEccwCompute):
             )
         )
 
-    def _initial_jacobian(
-        self, F: np.array, X: np.array, runtime_var: "function"
-    ) -> np.array:
-        """Return an approximation of initial Jacobian using finite differences."""
-        J = np.zeros((3, 3))
-        for j in range(3):
-            Y = X.copy()
-            Y[j] += self._h
-            DF = self._function_to_root(Y, runtime_var)
-            J[:, j] = DF - F
-        return J / self._h
-
-    def _iter_inverse_jacobian(self, invJ, dF, dX):
-        """Bad Broyden's method.
-        
-                            dX - invJ . dF
-        new_invJ = inJ +  --------------------- dF^T
-                                || dX || ^2
-        """
-        return invJ + np.outer(dX - invJ.dot(dF), dF) / np.linalg.norm(dF) ** 2.0
-
-    def _solve_Broyden(self, X: tuple, runtime_var: "function") -> float:
-        """
-        Solve the "function to root" iteratively using a generalized Newton/Raphson's method,
-        also called Broyden's method (the bad version)
-        
-        Broyden's method: https://en.wikipedia.org/wiki/Broyden%27s_method
-        About bad version : https://link.springer.com/article/10.1007%2FBF01931297
-
-        Solve is made accordingly with parameter X (array of size 3).
-        Function to root takes X as an input and return an array of same size.
-        """
-        count, countmax = 0, 99
-        X = np.array(X)
-        F = self._function_to_root(X, runtime_var)
-        J = self._initial_jacobian(F, X, runtime_var)
-        invJ = np.linalg.inv(J)
-        if __debug__:
-            self.path = [X]
-            self.iter_conv = 0
-        while not (abs(F) < self._numtol).all():
-            count += 1
-            newX = X - invJ.dot(F)  # Newton-Raphson iteration.
-            newF = self._function_to_root(newX, runtime_var)
-            invJ = self._iter_inverse_jacobian(invJ, newF - F, newX - X)
-            X, F = newX, newF
-            if __debug__:
-                self.path.append(newX)
-                self.iter_conv = count
-            if count > countmax:
-                raise RuntimeError(
-                    f"""Error in {self.__class__.__name__}._solve
-                    More than {countmax} iterations to converge.
-                    Current values (in rad) are: 
-                      var  = {X[0]}
-                      psiD = {X[1]}
-                      psi0 = {X[2]}
-                    """
-                )
-        return X[0] if abs(X[0]) > self._numtol else 0.0
+    def _jacobian_rows(self, psiD, psi0, values: tuple, d_values: tuple) -> tuple:
+        """Exact Jacobian of the function to root, by chain rule.
+
+        values are the runtime values (alpha, phiB, phiD, lambdaB_D2, lambdaD_D2,
+        alpha_prime), d_values their derivatives with respect to the variable.
+        Works with floats as well as with arrays.
+        Return 3 rows of derivatives with respect to (variable, psiD, psi0).
+        """
+        alpha, phiB, phiD, lambdaB_D2, lambdaD_D2, alpha_prime = values
+        d_alpha, d_phiB, d_phiD, d_lambdaB_D2, d_lambdaD_D2, d_alpha_prime = d_values
+        sinB, cosB = np.sin(phiB), np.cos(phiB)
+        sinD, cosD = np.sin(phiD), np.cos(phiD)
+        cos2_0, sin2_0 = np.cos(2 * psi0), np.sin(2 * psi0)
+        cos2_D = np.cos(2 * psiD + phiD)
+        sin2_0a = np.sin(2 * psi0 + alpha_prime)
+        cos2_0a = np.cos(2 * psi0 + alpha_prime)
+        one_B, one_D = 1 - lambdaB_D2, 1 - lambdaD_D2
+        # Partial derivatives of the second sub-function.
+        f2_phiB = one_D * sinD * cosB / one_B / sinB ** 2.0
+        f2_phiD = cos2_D - one_D * cosD / one_B / sinB
+        f2_phiD = f2_phiD - (lambdaD_D2 - lambdaB_D2) * cosD * cos2_0 / one_B
+        f2_lambdaB = one_D * sinD * (cos2_0 - 1.0 / sinB) / one_B ** 2.0
+        f2_lambdaD = sinD * (1.0 / sinB - cos2_0) / one_B
+        # Partial derivatives of the third sub-function.
+        f3_phiB = sin2_0a * cosB
+        f3_alpha_prime = cos2_0a * sinB - np.cos(alpha_prime)
+        return (
+            (d_alpha, -1.0, 1.0),
+            (
+                f2_phiB * d_phiB
+                + f2_phiD * d_phiD
+                + f2_lambdaB * d_lambdaB_D2
+                + f2_lambdaD * d_lambdaD_D2,
+                2.0 * cos2_D,
+                2.0 * (lambdaD_D2 - lambdaB_D2) * sinD * sin2_0 / one_B,
+            ),
+            (
+                f3_phiB * d_phiB + f3_alpha_prime * d_alpha_prime,
+                0.0,
+                2.0 * cos2_0a * sinB,
+            ),
+        )
 
-    def _derivative_matrix(
-        self, F: np.array, X: np.array, runtime_var: "function"
-    ) -> np.array:
-        """Approximation of derivative of F.
-        Return a 3×3 matrix of approx. of partial derivatives.
+    def _jacobian(self, X: np.array, runtime_var: "function") -> np.array:
+        """Return the exact 3×3 Jacobian matrix of the function to root at X."""
+        variable, psiD, psi0 = X
+        values = runtime_var(variable)
+        d_values = self._runtime_derivative(runtime_var)(variable)
+        return np.array(self._jacobian_rows(psiD, psi0, values, d_values), dtype=float)
+
+    def _convergence_error(self, X: tuple, reason: str, count: int):
+        """Return the ConvergenceError of a solve given up for 'reason'."""
+        explanation = {
+            "max_iterations": "Too many iterations to converge",
+            "nan": "Residual is not a number",
+            "divergence": "Residual diverges",
+            "stagnation": "Residual stagnates",
+        }[reason]
+        return ConvergenceError(
+            f"""Error in {self.__class__.__name__}._solve
+            {explanation} after {count} iterations.
+            Current values (in rad) are: 
+              var  = {X[0]}
+              psiD = {X[1]}
+              psi0 = {X[2]}
+            """,
+            X,
+            reason,
+            count,
+        )
+
+    def _check_progress(
+        self,
+        X: tuple,
+        residual: float,
+        limit: float,
+        stall: int,
+        count: int,
+        stagnation: int = None,
+    ) -> bool:
+        """Give up a solve whose residual did not halve during the last iteration.
+
+        'stall' is the number of such iterations in a row, 'limit' the residual
+        beyond which the solve diverges, 'stagnation' the number of stalls to
+        give up (default is _stagnation). Raise a ConvergenceError if needed.
+        Return True if the solve stalls at round-off level of the residual,
+        below the tolerance of "exact" precision: it is then converged.
         """
-        M = np.zeros((3, 3))
-        for j in range(3):
-            Y = X.copy()
-            Y[j] += self._h
-            DF = self._function_to_root(Y, runtime_var)
-            # for i in range(3):
-            #    M[i][j] = DF[i] - F[i]
-            M[:, j] = DF - F
-        return M / self._h
+        if residual != residual:
+            raise self._convergence_error(X, "nan", count)
+        if residual > limit:
+            raise self._convergence_error(X, "divergence", count)
+        if stall >= (self._stagnation if stagnation is None else stagnation):
+            if residual < self._roundoff:
+                return True
+            raise self._convergence_error(X, "stagnation", count)
+        return False
+
+    def _kernel_alpha(self) -> "function":
+        """Return a plain float kernel of the function to root for alpha.
+
+        The kernel takes (alpha, psiD, psi0) and returns the 3 sub-functions
+        followed by the 9 terms of the exact Jacobian, row by row.
+        Values which do not depend on alpha are computed once here.
+        """
+        beta, phiD, ratio = self._beta, self._phiD, self._density_ratio
+        one_ratio = 1 - ratio
+        d_lambdaB, d_lambdaD = self._lambdaB - ratio, self._lambdaD - ratio
+        sinB, sinD = sin(self._phiB), sin(phiD)
+        inv_sinB = 1.0 / sinB
+
+        def kernel(alpha, psiD, psi0):
+            tan_a = tan(alpha)
+            sec2 = 1.0 / cos(alpha) ** 2.0
+            one_B = 1.0 - ratio - d_lambdaB * sec2
+            one_D = 1.0 - ratio - d_lambdaD * sec2
+            k = one_ratio / one_B
+            u = k * tan_a
+            alpha_prime = atan(u)
+            dl_B = 2.0 * d_lambdaB * tan_a * sec2
+            dl_D = 2.0 * d_lambdaD * tan_a * sec2
+            da_prime = (k * sec2 + tan_a * k * dl_B / one_B) / (1.0 + u * u)
+            angle_D = 2.0 * psiD + phiD
+            cos2_0, angle_0a = cos(2.0 * psi0), 2.0 * psi0 + alpha_prime
+            cos_0a = cos(angle_0a)
+            shift = (one_B - one_D) / one_B * sinD
+            f2_lambdaB = one_D * sinD * (cos2_0 - inv_sinB) / one_B ** 2.0
+            f2_lambdaD = sinD * (inv_sinB - cos2_0) / one_B
+            return (
+                alpha + beta - psiD + psi0,
+                sin(angle_D) - one_D * sinD / one_B * inv_sinB - shift * cos2_0,
+                sin(angle_0a) * sinB - sin(alpha_prime),
+                1.0,
+                -1.0,
+                1.0,
+                f2_lambdaB * dl_B + f2_lambdaD * dl_D,
+                2.0 * cos(angle_D),
+                2.0 * shift * sin(2.0 * psi0),
+                (cos_0a * sinB - cos(alpha_prime)) * da_prime,
+                0.0,
+                2.0 * cos_0a * sinB,
+            )
+
+        return kernel
+
+    def _kernel_phiB(self) -> "function":
+        """Return a plain float kernel of the function to root for phiB.
 
-    def _solve_Newton(self, X: tuple, runtime_var: "function") -> float:
+        See _kernel_alpha.
         """
-        Solve the "function to root" iteratively using a naive generalized Newton/Raphson's method.
+        alpha_beta, phiD = self._alpha + self._beta, self._phiD
+        alpha_prime = self._alpha_prime
+        one_B, one_D = 1.0 - self._lambdaB_D2, 1.0 - self._lambdaD_D2
+        sinD = sin(phiD)
+        ratio = one_D * sinD / one_B
+        shift = (one_B - one_D) / one_B * sinD
+        sin_a_prime = sin(alpha_prime)
+
+        def kernel(phiB, psiD, psi0):
+            sinB, cosB = sin(phiB), cos(phiB)
+            angle_D = 2.0 * psiD + phiD
+            angle_0a = 2.0 * psi0 + alpha_prime
+            sin_0a, cos_0a = sin(angle_0a), cos(angle_0a)
+            return (
+                alpha_beta - psiD + psi0,
+                sin(angle_D) - ratio / sinB - shift * cos(2.0 * psi0),
+                sin_0a * sinB - sin_a_prime,
+                0.0,
+                -1.0,
+                1.0,
+                ratio * cosB / sinB ** 2.0,
+                2.0 * cos(angle_D),
+                2.0 * shift * sin(2.0 * psi0),
+                sin_0a * cosB,
+                0.0,
+                2.0 * cos_0a * sinB,
+            )
+
+        return kernel
 
-        Solve is made accordingly with parameter X (array of size 3).
-        Function to root takes X as an input and return an array of same size.
+    def _kernel_phiD(self) -> "function":
+        """Return a plain float kernel of the function to root for phiD.
+
+        See _kernel_alpha.
         """
+        alpha_beta, alpha_prime = self._alpha + self._beta, self._alpha_prime
+        one_B, one_D = 1.0 - self._lambdaB_D2, 1.0 - self._lambdaD_D2
+        sinB = sin(self._phiB)
+        ratio = one_D / one_B / sinB
+        shift = (one_B - one_D) / one_B
+        sin_a_prime = sin(alpha_prime)
+
+        def kernel(phiD, psiD, psi0):
+            sinD, cosD = sin(phiD), cos(phiD)
+            angle_D = 2.0 * psiD + phiD
+            cos_D = cos(angle_D)
+            cos2_0 = cos(2.0 * psi0)
+            angle_0a = 2.0 * psi0 + alpha_prime
+            return (
+                alpha_beta - psiD + psi0,
+                sin(angle_D) - ratio * sinD - shift * sinD * cos2_0,
+                sin(angle_0a) * sinB - sin_a_prime,
+                0.0,
+                -1.0,
+                1.0,
+                cos_D - ratio * cosD - shift * cosD * cos2_0,
+                2.0 * cos_D,
+                2.0 * shift * sinD * sin(2.0 * psi0),
+                0.0,
+                0.0,
+                2.0 * cos(angle_0a) * sinB,
+            )
+
+        return kernel
+
+    def _kernel(self, runtime_var: "function") -> "function":
+        """Return the scalar kernel matching a _runtime_* method."""
+        parser = {
+            self._runtime_alpha: self._kernel_alpha,
+            self._runtime_phiB: self._kernel_phiB,
+            self._runtime_phiD: self._kernel_phiD,
+        }
+        return parser[runtime_var]()
+
+    def _solve_Newton_kernel(self, X: tuple, runtime_var: "function") -> tuple:
+        """
+        Solve the "function to root" with Newton/Raphson's method in plain floats.
+
+        Solve is made accordingly with initial values X (var, psiD, psi0), using
+        the scalar kernel matching runtime_var and Cramer's rule to solve the
+        3×3 linear system of each iteration. Return the converged values.
+        """
+        kernel, cramer = self._kernel(runtime_var), self._cramer
+        restol = self._restol
         count = 0
-        X = np.array(X)
-        F = self._function_to_root(X, runtime_var)
-        if __debug__:
-            self.path = [X]
-            self.iter_conv = 0
-        while not (abs(F) < self._numtol).all():
-            count += 1
-            M = self._derivative_matrix(F, X, runtime_var)  # Approx. of derivative.
-            invM = np.linalg.inv(M)
-            X = X - invM.dot(F)  # Newton-Raphson iteration.
-            if __debug__:
-                self.path.append(X)
-                self.iter_conv = count
-            F = self._function_to_root(X, runtime_var)
-            if count > 999:
-                raise RuntimeError(
-                    f"""Error in {self.__class__.__name__}._solve
-                    More than 99 iterations to converge.
-                    Current values (in rad) are: 
-                      var  = {X[0]}
-                      psiD = {X[1]}
-                      psi0 = {X[2]}
-                    """
-                )
-        return X[0] if abs(X[0]) > self._numtol else 0.0
+        x1, x2, x3 = X
+        f1 = f2 = f3 = nan
+        trajectory = self._trajectory
+        if trajectory is not None:
+            trajectory.reset()
+            trajectory.append((x1, x2, x3))
+        try:
+            f1, f2, f3, a, b, c, d, e, f, g, h, i = kernel(x1, x2, x3)
+            best = max(abs(f1), abs(f2), abs(f3))
+            limit, stall = self._divergence * max(best, 1.0), 0
+            while not (abs(f1) < restol and abs(f2) < restol and abs(f3) < restol):
+                count += 1
+                dx1, dx2, dx3 = cramer(a, b, c, d, e, f, g, h, i, f1, f2, f3)
+                x1, x2, x3 = x1 - dx1, x2 - dx2, x3 - dx3
+                if trajectory is not None:
+                    trajectory.append((x1, x2, x3))
+                f1, f2, f3, a, b, c, d, e, f, g, h, i = kernel(x1, x2, x3)
+                residual = max(abs(f1), abs(f2), abs(f3))
+                if residual < 0.5 * best:
+                    best, stall = residual, 0
+                else:
+                    # Only checked when the residual did not halve.
+                    stall += 1
+                    if self._check_progress((x1, x2, x3), residual, limit, stall, count):
+                        break
+                if count > 999:
+                    raise self._convergence_error((x1, x2, x3), "max_iterations", count)
+        finally:
+            # Residual and Jacobian are evaluated together by the kernel.
+            residual = max(abs(f1), abs(f2), abs(f3))
+            self._solve_counts = (count, count + 1, count + 1, residual)
+        return x1 if abs(x1) > restol else 0.0, x2, x3
+
+    @staticmethod
+    def _cramer(a, b, c, d, e, f, g, h, i, f1, f2, f3) -> tuple:
+        """Solve [[a, b, c], [d, e, f], [g, h, i]] . dX = F by Cramer's rule."""
+        ei_fh, fg_di, dh_eg = e * i - f * h, f * g - d * i, d * h - e * g
+        det = a * ei_fh + b * fg_di + c * dh_eg
+        if det == 0.0:
+            raise np.linalg.LinAlgError("Singular matrix")
+        return (
+            (f1 * ei_fh + b * (f3 * f - f2 * i) + c * (f2 * h - f3 * e)) / det,
+            (a * (f2 * i - f3 * f) + f1 * fg_di + c * (f3 * d - f2 * g)) / det,
+            (a * (f3 * e - f2 * h) + b * (f2 * g - f3 * d) + f1 * dh_eg) / det,
+        )
+
+    def _solve_Newton_damped(self, X: tuple, runtime_var: "function") -> tuple:
+        """
+        Solve the "function to root" with a damped Newton/Raphson's method.
+
+        Newton's step is halved (down to 1/1024) until the residual decreases,
+        so that iterates can not wander away from a root as full steps may do.
+        As the residual may decrease slowly far from roots, the solve gives up
+        after more iterations without halving it (_damped_stagnation). Same as
+        _solve_Newton_kernel otherwise.
+        """
+        kernel = self._kernel(runtime_var)
+        restol = self._restol
+        count, evaluations = 0, 1
+        x1, x2, x3 = X
+        f1 = f2 = f3 = nan
+        trajectory = self._trajectory
+        if trajectory is not None:
+            trajectory.reset()
+            trajectory.append((x1, x2, x3))
+        try:
+            f1, f2, f3, *J = kernel(x1, x2, x3)
+            residual = best = max(abs(f1), abs(f2), abs(f3))
+            limit, stall = self._divergence * max(best, 1.0), 0
+            stagnation = self._damped_stagnation
+            while not (abs(f1) < restol and abs(f2) < restol and abs(f3) < restol):
+                count += 1
+                dx1, dx2, dx3 = self._cramer(*J, f1, f2, f3)
+                previous, t = residual, 1.0
+                while True:
+                    y1, y2, y3 = x1 - t * dx1, x2 - t * dx2, x3 - t * dx3
+                    f1, f2, f3, *J = kernel(y1, y2, y3)
+                    evaluations += 1
+                    residual = max(abs(f1), abs(f2), abs(f3))
+                    if residual < (1.0 - 1e-4 * t) * previous or t < 1e-3:
+                        break
+                    t *= 0.5
+                x1, x2, x3 = y1, y2, y3
+                if trajectory is not None:
+                    trajectory.append((x1, x2, x3))
+                if residual < 0.5 * best:
+                    best, stall = residual, 0
+                else:
+                    stall += 1
+                    if self._check_progress(
+                        (x1, x2, x3), residual, limit, stall, count, stagnation
+                    ):
+                        break
+                if count > 999:
+                    raise self._convergence_error((x1, x2, x3), "max_iterations", count)
+        finally:
+            residual = max(abs(f1), abs(f2), abs(f3))
+            self._solve_counts = (count, evaluations, evaluations, residual)
+        return x1 if abs(x1) > restol else 0.0, x2, x3
+
+    def _solve_damped(self, X: tuple, runtime_var: "function", counts: tuple) -> tuple:
+        """Run _solve_Newton_damped after a first attempt of given '_solve_counts'.
+
+        Iterations and evaluations of both attempts are added up.
+        """
+        try:
+            return self._solve_Newton_damped(X, runtime_var)
+        finally:
+            iterations, residuals, jacobians, residual = self._solve_counts
+            self._solve_counts = (
+                counts[0] + iterations,
+                counts[1] + residuals,
+                counts[2] + jacobians,
+                residual,
+            )
 
     def _solve(self, X, runtime_var):
-        return self._solve_Newton(X, runtime_var)
-        # return self._solve_Broyden(X, runtime_var)
-        # TODO
-        # https://fr.wikipedia.org/wiki/M%C3%A9thode_de_Muller
-        # https://en.wikipedia.org/wiki/Root-finding_algorithm
-        # https://en.wikipedia.org/wiki/Sidi%27s_generalized_secant_method#cite_ref-1
+        """Solve the "function to root" from initial values X.
 
-    ## 'Public' methods #######################################################
+        Newton's method is damped from the same initial values if it fails with
+        full steps, or reaches a value of alpha or phiD out of range (the latter
+        is kept if the damped solve fails). Aliases of phiB are not retried but
+        folded by _test_phiB. Statistics of the solve, counting all attempts,
+        are kept in last_stats, and gathered by stats.collect_stats when enabled.
+        """
+        start, reason = perf_counter(), None
+        try:
+            try:
+                solution = self._solve_Newton_kernel(X, runtime_var)
+            except (ConvergenceError, np.linalg.LinAlgError):
+                return self._solve_damped(X, runtime_var, self._solve_counts)
+            parser = {
+                self._runtime_alpha: self._test_alpha,
+                self._runtime_phiD: self._test_phiD,
+            }
+            test = parser.get(runtime_var)
+            if test is not None and test(solution[0]) is None:
+                counts = self._solve_counts
+                try:
+                    return self._solve_damped(X, runtime_var, counts)
+                except (ConvergenceError, np.linalg.LinAlgError):
+                    # The first root is kept, with its residual.
+                    self._solve_counts = self._solve_counts[:3] + counts[3:]
+            return solution
+        except np.linalg.LinAlgError:
+            reason = "singular_jacobian"
+            raise
+        except ConvergenceError as error:
+            reason = error.reason
+            raise
+        except ArithmeticError:
+            reason = "arithmetic_error"
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            self._last_solve = (runtime_var, X, elapsed, reason)
+            if stats._collector is not None:
+                stats._collector.add(self.last_stats)
+
+    @property
+    def last_stats(self) -> "stats.SolveStats or None":
+        """Statistics of the last solve of the "function to root" (see _solve).
+
+        The state is built from the parameters when read, so that solves do not
+        pay for it: it is the state of the solve until parameters are changed.
+        """
+        try:
+            runtime_var, X, elapsed, reason = self._last_solve
+        except AttributeError:
+            return None
+        return stats.SolveStats(
+            runtime_var.__name__[len("_runtime_") :],
+            self.state(),
+            tuple(X),
+            *self._solve_counts,
+            elapsed,
+            reason,
+        )
+
+    def _solve_Brent(self, f: "function", a: float, b: float) -> float:
+        """Find a root of f in the bracket [a, b] using Brent's method.
+
+        Brent's method: https://en.wikipedia.org/wiki/Brent%27s_method
+        Implementation follows brentq from SciPy.
+        """
+        xtol, rtol = self._restol, 4.0 * np.finfo(float).eps
+        xpre, xcur = a, b
+        fpre, fcur = f(xpre), f(xcur)
+        xblk = fblk = spre = scur = 0.0
+        if fpre == 0.0:
+            return xpre
+        if fcur == 0.0:
+            return xcur
+        if fpre * fcur > 0.0:
+            raise ValueError(self._error_message("bracket", "value", "a sign change"))
+        for _ in range(100):
+            if fpre * fcur < 0.0:
+                xblk, fblk = xpre, fpre
+                spre = scur = xcur - xpre
+            if abs(fblk) < abs(fcur):
+                xpre, xcur, xblk = xcur, xblk, xcur
+                fpre, fcur, fblk = fcur, fblk, fcur
+            delta = (xtol + rtol * abs(xcur)) / 2.0
+            sbis = (xblk - xcur) / 2.0
+            if fcur == 0.0 or abs(sbis) < delta:
+                return xcur
+            if abs(spre) > delta and abs(fcur) < abs(fpre):
+                if xpre == xblk:  # Interpolate.
+                    stry = -fcur * (xcur - xpre) / (fcur - fpre)
+                else:  # Extrapolate.
+                    dpre = (fpre - fcur) / (xpre - xcur)
+                    dblk = (fblk - fcur) / (xblk - xcur)
+                    stry = -fcur * (fblk * dblk - fpre * dpre)
+                    stry /= dblk * dpre * (fblk - fpre)
+                if 2.0 * abs(stry) < min(abs(spre), 3.0 * abs(sbis) - delta):
+                    spre, scur = scur, stry  # Good short step.
+                else:
+                    spre = scur = sbis  # Bisect.
+            else:
+                spre = scur = sbis  # Bisect.
+            xpre, fpre = xcur, fcur
+            xcur += scur if abs(scur) > delta else (delta if sbis > 0 else -delta)
+            fcur = f(xcur)
+        return xcur
 
-    def _compute_alpha(self, alpha, psiD, psi0, inverse, normal, deg):
-        embedded = self._embedded_compute
-        alpha = self._solve([alpha, psiD, psi0], self._runtime_alpha)
-        alpha = self._test_alpha(alpha)
-        # print("yo", degrees(alpha))
-        if alpha is not None:
-            embedded._alpha = alpha
-            embedded._alpha_related_changes()
-            # print("yo", embedded._beta, embedded.compute_beta() )
-            inverse, normal = embedded._categorize_result(
-                alpha, inverse, normal, deg
+    def _valid_edge(self, branch: int, a: float, b: float) -> float:
+        """Bisect between a valid and an invalid alpha of a beta branch.
+
+        Return the valid alpha closest to where the branch vanishes [rad].
+        """
+        valid, invalid = (b, a) if np.isnan(self._beta_branch(a, branch)) else (a, b)
+        for _ in range(60):
+            middle = (valid + invalid) / 2.0
+            if middle in (valid, invalid):
+                break
+            if np.isnan(self._beta_branch(middle, branch)):
+                invalid = middle
+            else:
+                valid = middle
+        return valid
+
+    def _alpha_roots(self) -> list:
+        """Find all the alpha solutions by bracketing roots of beta branches.
+
+        Beta is explicit in alpha (see _beta_branches), so each branch is
+        sampled on [-alphamax, alphamax], then any sign change of
+        branch(alpha) - beta is refined by Brent's method. Where a branch
+        vanishes between two samples, its edge is located by bisection and
+        used as a sample too.
+        Return a sorted list of (alpha, branch index) [rad].
+        """
+        alphamax = np.nextafter(self._get_alphamax(), 0.0)
+        alphas = np.linspace(-alphamax, alphamax, self._bracket_points)
+        with np.errstate(invalid="ignore"):
+            gaps = np.array(
+                self._beta_branches(
+                    alphas,
+                    self._phiB,
+                    self._phiD,
+                    self._density_ratio,
+                    self._lambdaB,
+                    self._lambdaD,
+                )
+            ) - self._beta
+            valid = ~np.isnan(gaps)
+            roots = []
+            for branch in range(4):
+                gap = lambda alpha: self._beta_branch(alpha, branch) - self._beta
+                samples, values = alphas, gaps[branch]
+                cuts = np.flatnonzero(valid[branch, :-1] != valid[branch, 1:])
+                if cuts.size:
+                    edges = [
+                        self._valid_edge(branch, *bounds)
+                        for bounds in alphas[np.c_[cuts, cuts + 1]].tolist()
+                    ]
+                    samples = np.insert(samples, cuts + 1, edges)
+                    values = np.insert(values, cuts + 1, [gap(e) for e in edges])
+                changes = values[:-1] * values[1:] <= 0.0
+                for i in np.flatnonzero(changes):
+                    if values[i] == 0.0 and i > 0 and changes[i - 1]:
+                        continue  # Already found as end of previous bracket.
+                    alpha = self._solve_Brent(gap, *samples[i : i + 2].tolist())
+                    alpha = alpha if abs(alpha) > self._restol else 0.0
+                    roots.append((alpha, branch))
+        return sorted(roots)
+
+    def _seeds(self, variable: str, alpha, beta, phiD) -> tuple:
+        """Return the two sets of initial values (variable, psiD, psi0).
+
+        'variable' is the name of the value to solve: 'alpha', 'phiB' or 'phiD'.
+        Works with floats as well as with arrays of parameters.
+        """
+        if variable == "alpha":
+            return (
+                (0.0, 0.0, 0.0),
+                (0.0, self._sign * pi / 2.0, self._sign * pi / 4.0),
+            )
+        if variable == "phiB":
+            ab = alpha + beta
+            return (
+                (phiD, ab, alpha),
+                (-phiD, -pi / 2 + ab, -pi / 2 + alpha),
             )
+        if variable == "phiD":
+            apb = alpha + beta
+            # Former seeds: (apb, apb, 0.0) and (0.0, pi/2, pi/2 - apb).
+            return (
+                (-apb, -pi / 2, -pi / 2),
+                (0.0, apb, 0.0),
+            )
+        raise ValueError(
+            self._error_message("variable", "value", "'alpha', 'phiB' or 'phiD'")
+        )
+
+    ## Batched solve ##########################################################
+
+    def _runtime_many(self, variable: str, value, p: dict) -> tuple:
+        """Vectorized counterpart of _runtime_alpha, _runtime_phiB and _runtime_phiD.
+
+        'p' is a dict of parameters as returned by _params_many, 'value' the
+        runtime value(s) of 'variable'. Return the same set of values, as arrays.
+        """
+        alpha = value if variable == "alpha" else p["alpha"]
+        phiB = value if variable == "phiB" else p["phiB"]
+        phiD = value if variable == "phiD" else p["phiD"]
+        ratio = p["density_ratio"]
+        cos2 = np.cos(alpha) ** 2.0
+        lambdaB_D2 = ratio + (p["lambdaB"] - ratio) / cos2
+        lambdaD_D2 = ratio + (p["lambdaD"] - ratio) / cos2
+        alpha_prime = np.arctan((1 - ratio) / (1 - lambdaB_D2) * np.tan(alpha))
+        return alpha, phiB, phiD, lambdaB_D2, lambdaD_D2, alpha_prime
+
+    def _function_to_root_many(self, variable, psiD, psi0, name: str, p: dict):
+        """Vectorized counterpart of _function_to_root.
+
+        variable, psiD and psi0 are broadcast together with the parameters of
+        'p', 'name' is the name of the variable. Return the 3 sub-functions.
+        """
+        alpha, phiB, phiD, lambdaB_D2, lambdaD_D2, alpha_prime = self._runtime_many(
+            name, variable, p
+        )
+        sinD, sinB = np.sin(phiD), np.sin(phiB)
+        f1 = alpha + p["beta"] - psiD + psi0
+        f2 = np.sin(2 * psiD + phiD)
+        f2 = f2 - (1 - lambdaD_D2) * sinD / (1 - lambdaB_D2) / sinB
+        f2 = f2 - (lambdaD_D2 - lambdaB_D2) * sinD * np.cos(2 * psi0) / (
+            1 - lambdaB_D2
+        )
+        f3 = np.sin(2 * psi0 + alpha_prime) * sinB - np.sin(alpha_prime)
+        return f1, f2, f3
+
+    def _residual_many(self, X: np.ndarray, name: str, p: dict) -> np.ndarray:
+        """Stacked residuals of N systems: X and returned array are (N, 3)."""
+        F = self._function_to_root_many(X[:, 0], X[:, 1], X[:, 2], name, p)
+        return np.stack(F, axis=-1)
+
+    def _runtime_derivative_many(self, name: str, value, p: dict) -> tuple:
+        """Vectorized counterpart of _runtime_*_derivative methods."""
+        if name == "phiB":
+            return (0.0, 1.0, 0.0, 0.0, 0.0, 0.0)
+        if name == "phiD":
+            return (0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+        ratio = p["density_ratio"]
+        lambdaB_D2 = ratio + (p["lambdaB"] - ratio) / np.cos(value) ** 2.0
+        d_lambdaB_D2 = self._d_convert_lambda(value, p["lambdaB"], ratio)
+        d_lambdaD_D2 = self._d_convert_lambda(value, p["lambdaD"], ratio)
+        d_alpha_prime = self._d_convert_alpha(value, lambdaB_D2, d_lambdaB_D2, ratio)
+        return (1.0, 0.0, 0.0, d_lambdaB_D2, d_lambdaD_D2, d_alpha_prime)
+
+    def _jacobian_many(self, X: np.ndarray, name: str, p: dict) -> np.ndarray:
+        """Stacked exact Jacobian matrices of N systems: return a (N, 3, 3) array."""
+        values = self._runtime_many(name, X[:, 0], p)
+        d_values = self._runtime_derivative_many(name, X[:, 0], p)
+        rows = self._jacobian_rows(X[:, 1], X[:, 2], values, d_values)
+        rows = [
+            np.stack(np.broadcast_arrays(*row, X[:, 0])[:3], axis=-1) for row in rows
+        ]
+        return np.stack(rows, axis=-2)
+
+    def _solve_Newton_many(
+        self, X, name: str, p: dict, countmax: int = 1000, damped: bool = False
+    ):
+        """Solve N independent systems together with Newton/Raphson's method.
+
+        X is a (N, 3) array of initial values, 'p' a dict of (N,) arrays of
+        parameters. Each system stops iterating as soon as it converges, or
+        fails if it is singular, not finite or exceeds 'countmax' iterations.
+        If 'damped', steps are halved as in _solve_Newton_damped.
+
+        Return the (N, 3) array of last iterates, the (N,) boolean array of
+        convergence and the (N,) array of iteration counts.
+        """
+        X = np.array(X, dtype=float)
+        count = np.zeros(len(X), dtype=int)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            F = self._residual_many(X, name, p)
+            converged = (abs(F) < self._restol).all(axis=1)
+            active = ~converged & np.isfinite(F).all(axis=1)
+            for _ in range(countmax):
+                idx = np.flatnonzero(active)
+                if not idx.size:
+                    break
+                sub = {k: v[idx] for k, v in p.items()}
+                M = self._jacobian_many(X[idx], name, sub)
+                solvable = np.isfinite(M).all(axis=(1, 2))
+                solvable[solvable] = abs(np.linalg.det(M[solvable])) > 1e-300
+                active[idx[~solvable]] = False
+                idx, M = idx[solvable], M[solvable]
+                sub = {k: v[solvable] for k, v in sub.items()}
+                step = np.linalg.solve(M, F[idx][..., None])[..., 0]
+                if damped:
+                    X[idx], F[idx] = self._damped_step_many(
+                        X[idx], F[idx], step, name, sub
+                    )
+                else:
+                    X[idx] -= step
+                    F[idx] = self._residual_many(X[idx], name, sub)
+                count[idx] += 1
+                done = (abs(F[idx]) < self._restol).all(axis=1)
+                converged[idx[done]] = True
+                active[idx] = ~done & np.isfinite(F[idx]).all(axis=1)
+        return X, converged, count
+
+    def _damped_step_many(self, X, F, step, name: str, p: dict) -> tuple:
+        """Return new iterates and residuals of N systems, with damped steps."""
+        previous = np.max(abs(F), axis=1)
+        t = np.ones(len(X))
+        new_X = X - step
+        new_F = self._residual_many(new_X, name, p)
+        for _ in range(10):
+            residual = np.max(abs(new_F), axis=1)
+            worse = ~(residual < (1.0 - 1e-4 * t) * previous)
+            if not worse.any():
+                break
+            t[worse] *= 0.5
+            new_X[worse] = X[worse] - t[worse, None] * step[worse]
+            sub = {k: v[worse] for k, v in p.items()}
+            new_F[worse] = self._residual_many(new_X[worse], name, sub)
+        return new_X, new_F
+
+    def _test_many(self, name: str, value, p: dict):
+        """Vectorized _test_alpha, _test_phiB and _test_phiD: NaN if not meaningfull."""
+        if name == "alpha":
+            taper = value + p["beta"]
+            taper_max = pi / 2.0 - p["phiD"] + self._numtol
+            valid = (self._taper_min < taper) & (taper < taper_max)
+        elif name == "phiB":
+            value = np.remainder(value + pi, 2.0 * pi) - pi
+            value = np.where(value > pi / 2.0, pi - value, value)
+            valid = (-self._numtol < value) & (value < pi / 2.0 + self._numtol)
+        else:
+            valid = (-self._numtol < value) & (value < p["phiB"] + self._numtol)
+        return np.where(valid, value, nan)
+
+    def _categorize_many(self, name: str, X: np.ndarray, p: dict) -> tuple:
+        """Vectorized counterpart of _categorize.
+
+        X is the (N, 3) array of converged (var, psiD, psi0), NaN where there is
+        no solution. Return two boolean arrays telling if solutions are tectonic
+        (inverse) or collapsing (normal).
+        """
+        alpha, phiB, phiD, _, _, alpha_prime = self._runtime_many(name, X[:, 0], p)
+        taper = alpha + p["beta"]
+        valid = (self._sign * phiD >= 0.0) & (abs(phiD) <= phiB)
+        valid &= (-phiB <= alpha_prime) & (alpha_prime <= phiB)
+        valid &= (self._taper_min < taper) & (taper < pi / 2.0 - phiD + self._numtol)
+        cos_D = np.cos(2.0 * X[:, 1] + phiD)
+        return valid & (cos_D > -self._h), valid & (cos_D < self._h)
+
+    def _compute_many(self, name: str, deg: bool, precision, **kwargs) -> tuple:
+        """Solve 'name' for arrays of parameters: see compute_alpha_many."""
+        p = self._params_many(set(self._many_params_list) - {name}, name, **kwargs)
+        shape = p["alpha"].shape
+        p = {k: np.ravel(v) for k, v in p.items()}
+        n = p["alpha"].size
+        inverse, normal = np.full((n, 2), nan), np.full((n, 2), nan)
+        # Only sets of parameters which may have a solution are solved.
+        with np.errstate(invalid="ignore"):
+            feasible = p["sane"] & feasibility.feasible_many(
+                name, p, self._sign, self._taper_min, self._numtol
+            )
+        idx = np.flatnonzero(feasible)
+        sub = {k: v[idx] for k, v in p.items()}
+        seeds = self._seeds(name, sub["alpha"], sub["beta"], sub["phiD"])
+        for k, seed in enumerate(seeds):
+            X = np.stack(np.broadcast_arrays(*seed, sub["alpha"])[:3], axis=-1)
+            with self._with_precision(precision):
+                X0 = X
+                X, converged, _ = self._solve_Newton_many(X0, name, sub)
+                # Systems without a meaningful solution are solved again with
+                # damped steps (aliases of phiB are folded by _test_many).
+                meaningful = converged
+                if name != "phiB":
+                    test = self._test_many(name, X[:, 0], sub)
+                    meaningful = meaningful & ~np.isnan(test)
+                failed = np.flatnonzero(~meaningful)
+                if failed.size:
+                    retry = {k: v[failed] for k, v in sub.items()}
+                    Y, done, _ = self._solve_Newton_many(
+                        X0[failed], name, retry, damped=True
+                    )
+                    X[failed], converged[failed] = Y, done
+                solved = np.full((n, 3), nan)
+                solved[idx[converged]] = X[converged]
+                value = solved[:, 0]
+                value = np.where(abs(value) > self._restol, value, value * 0.0)
+            solved[:, 0] = value = self._test_many(name, value, p)
+            with np.errstate(invalid="ignore"):
+                is_inverse, is_normal = self._categorize_many(name, solved, p)
+            value = np.degrees(value) if deg else value
+            for out, is_in in ((inverse, is_inverse), (normal, is_normal)):
+                # Is there any duplicated result ?
+                duplicate = abs(value - out[:, 0]) <= self._h if k else False
+                out[:, k] = np.where(is_in & ~duplicate, value, nan)
+        results = []
+        for out in (inverse, normal):
+            # Push NaN at the end, keeping order of solutions.
+            order = np.argsort(np.isnan(out), axis=1, kind="stable")
+            out = np.take_along_axis(out, order, axis=1)
+            results.append(out.reshape(shape + (2,)))
+        return tuple(results)
+
+    ## 'Public' methods #######################################################
+
+    def _compute_alpha(self, alpha, psiD, psi0, inverse, normal, deg) -> tuple:
+        X = self._solve([alpha, psiD, psi0], self._runtime_alpha)
+        if self._test_alpha(X[0]) is not None:
+            categories = self._categorize(X, self._runtime_alpha)
+            inverse, normal = self._store_result(X[0], categories, inverse, normal, deg)
         return inverse, normal
 
-    def compute_alpha(self, deg=True) -> tuple:
+    @_cached("alpha")
+    def compute_alpha(self, deg=True, method="newton", precision=None) -> tuple:
         """Get critical topographic slope alpha as ECCW.
         Return the 2 possible solutions in tectonic or collapsing regime.
         Return two None if no physical solutions.
+
+        'method' selects the solver: 'newton' solves the full system from two
+        initial values, 'brent' brackets roots of the explicit branches of beta
+        (see compute_alpha_branches).
+
+        'precision' overrides the precision tier of this call (see precision).
         """
+        if method == "brent":
+            inverse, normal = [], []
+            with self._with_precision(precision):
+                branches = self.compute_alpha_branches(deg)
+            for alpha, branch in branches:
+                # dl and dr branches are tectonic, ur and ul are collapsing.
+                iolist = inverse if branch in ("dl", "dr") else normal
+                if all(abs(alpha - other) > self._h for other in iolist):
+                    iolist.append(alpha)
+            return tuple(inverse), tuple(normal)
+        if method != "newton":
+            raise ValueError(
+                self._error_message("method", "value", "'newton' or 'brent'")
+            )
         self._check_params_with_raise()
+        if not feasibility.feasible(self, "alpha"):
+            return (), ()
         inverse, normal = [], []
-        # Update with current parameters the embedded compute.
-        self._embedded_compute.set_params(**self.kwargs(), _h=self._h)
-        # Inital values for first solution.
-        alpha, psiD, psi0 = 0.0, 0.0, 0.0
-        inverse, normal = self._compute_alpha(
-            alpha, psiD, psi0, inverse, normal, deg
-        )
-        # Other inital values for second solution.
-        alpha, psiD, psi0 = 0.0, self._sign * pi / 2.0, self._sign * pi / 4.0
-        inverse, normal = self._compute_alpha(
-            alpha, psiD, psi0, inverse, normal, deg
-        )
+        seeds = self._seeds("alpha", self._alpha, self._beta, self._phiD)
+        with self._with_precision(precision):
+            for alpha, psiD, psi0 in seeds:
+                inverse, normal = self._compute_alpha(
+                    alpha, psiD, psi0, inverse, normal, deg
+                )
         return tuple(inverse), tuple(normal)
 
+    @_cached("alpha")
+    def compute_alpha_branches(self, deg=True) -> tuple:
+        """Get all critical topographic slopes alpha with their branch of origin.
+
+        Roots of beta_branch(alpha) - beta are bracketed on [-alphamax, alphamax]
+        and refined by Brent's method, with a bounded number of evaluations.
+        Return a tuple of (alpha, branch) pairs sorted by alpha, branch being
+        one of 'dl', 'dr' (tectonic) or 'ul', 'ur' (collapsing).
+
+        .. note:: tangent (double) roots do not change sign and may be missed.
+        """
+        self._check_params_with_raise()
+        names = ("dl", "ur", "dr", "ul")
+        return tuple(
+            (degrees(alpha) if deg else alpha, names[branch])
+            for alpha, branch in self._alpha_roots()
+        )
+
     def _compute_phiB(self, phiB, psiD, psi0, inverse, normal, deg) -> tuple:
-        embedded = self._embedded_compute
-        phiB = self._solve([phiB, psiD, psi0], self._runtime_phiB)
-        phiB = self._test_phiB(phiB)
+        X = self._solve([phiB, psiD, psi0], self._runtime_phiB)
+        phiB = self._test_phiB(X[0])
         if phiB is not None:
-            embedded._phiB = phiB
-            inverse, normal = embedded._categorize_result(
-                phiB, inverse, normal, deg
-            )
+            X = (phiB,) + tuple(X[1:])
+            categories = self._categorize(X, self._runtime_phiB)
+            inverse, normal = self._store_result(X[0], categories, inverse, normal, deg)
         return inverse, normal
 
-    def compute_phiB(self, deg=True) -> tuple:
+    @_cached("phiB")
+    def compute_phiB(self, deg=True, precision=None) -> tuple:
         self._check_params_with_raise()
+        if not feasibility.feasible(self, "phiB"):
+            return (), ()
         inverse, normal = [], []
-        # Update with current parameters the embedded compute.
-        self._embedded_compute.set_params(**self.kwargs(), _h=self._h)
-        ab = self._alpha + self._beta
-        # Inital values for first solution.
-        phiB = self._phiD  # pi / 7.0
-        psiD = ab  # pi
-        psi0 = self._alpha  # psiD - self._alpha - self._beta
-        inverse, normal = self._compute_phiB(
-            phiB, psiD, psi0, inverse, normal, deg
-        )
-        # Other inital values for second solution.
-        phiB = -self._phiD  # pi / 7.0
-        psiD = -pi / 2 + ab  # pi / 2.0
-        psi0 = -pi / 2 + self._alpha  # psiD - self._alpha - self._beta
-        inverse, normal = self._compute_phiB(
-            phiB, psiD, psi0, inverse, normal, deg
-        )
+        seeds = self._seeds("phiB", self._alpha, self._beta, self._phiD)
+        with self._with_precision(precision):
+            for phiB, psiD, psi0 in seeds:
+                inverse, normal = self._compute_phiB(
+                    phiB, psiD, psi0, inverse, normal, deg
+                )
         return tuple(inverse), tuple(normal)
 
     def _compute_phiD(self, phiD, psiD, psi0, inverse, normal, deg) -> tuple:
-        embedded = self._embedded_compute
-        phiD = self._solve([phiD, psiD, psi0], self._runtime_phiD)
-        phiD = self._test_phiD(phiD)
-        if phiD is not None:
-            embedded._phiD = phiD * embedded._sign
-            embedded._phiD_related_changes()
-            inverse, normal = embedded._categorize_result(
-                phiD, inverse, normal, deg
-            )
+        X = self._solve([phiD, psiD, psi0], self._runtime_phiD)
+        if self._test_phiD(X[0]) is not None:
+            categories = self._categorize(X, self._runtime_phiD)
+            inverse, normal = self._store_result(X[0], categories, inverse, normal, deg)
         return inverse, normal
 
-    def compute_phiD(self, deg=True) -> tuple:
+    @_cached("phiD")
+    def compute_phiD(self, deg=True, precision=None) -> tuple:
         """Get critical basal friction angle as ECCW.
 
         Return the 2 possible solutions in two tuples respectively representing
@@ -795,31 +1991,151 @@ class EccwCompute(BaseEccwCompute):
 
         Return two empty tuples if no physical solutions exist.
 
+        'precision' overrides the precision tier of this call (see precision).
+
         .. note:: double solutions (phiD == phiB) are not returned.
         """
         self._check_params_with_raise()
+        if not feasibility.feasible(self, "phiD"):
+            return (), ()
         inverse, normal = [], []
-        # Update with current parameters the embedded compute.
-        self._embedded_compute.set_params(**self.kwargs(), _h=self._h)
-        apb = self._alpha + self._beta
-        # Inital values for First solution.
-        # phiD, psiD, psi0 = apb, apb, 0.0
-        phiD, psiD, psi0 = -apb, -pi / 2, -pi / 2
-        inverse, normal = self._compute_phiD(
-            phiD, psiD, psi0, inverse, normal, deg
-        )
-        # Other inital values second solution.
-        # phiD, psiD, psi0 = 0.0, pi/2, pi/2 - apb
-        phiD, psiD, psi0 = 0.0, apb, 0.0
-        # Second solution of ECCW (upper).
-        inverse, normal = self._compute_phiD(
-            phiD, psiD, psi0, inverse, normal, deg
-        )
+        seeds = self._seeds("phiD", self._alpha, self._beta, self._phiD)
+        with self._with_precision(precision):
+            for phiD, psiD, psi0 in seeds:
+                inverse, normal = self._compute_phiD(
+                    phiD, psiD, psi0, inverse, normal, deg
+                )
+        return tuple(inverse), tuple(normal)
+
+    def compute_alpha_many(self, deg=True, precision=None, **kwargs) -> tuple:
+        """Get critical topographic slope alpha as ECCW for arrays of parameters.
+
+        Vectorized counterpart of compute_alpha. Accepted named parameters are
+        beta, phiB, phiD, rho_f, rho_sr, delta_lambdaB and delta_lambdaD, with the
+        same units as the data descriptors. Given values may be floats or arrays
+        and are broadcast together, missing ones are taken from self.
+
+        All parameter sets are solved together by a batched Newton's method, from
+        the same two initial values as compute_alpha. Unlike compute_alpha, a
+        failing initial value does not raise but only loses its own solution.
+        'precision' overrides the precision tier of this call (see precision).
+
+        Return two arrays (inverse, normal) of shape (..., 2) respectively
+        holding tectonic and collapsing solutions, padded with NaN. Parameter
+        sets without solution or with insane parameters give only NaN.
+        """
+        return self._compute_many("alpha", deg, precision, **kwargs)
+
+    def compute_phiB_many(self, deg=True, precision=None, **kwargs) -> tuple:
+        """Get critical bulk friction angle phiB as ECCW for arrays of parameters.
+
+        See compute_alpha_many: accepted named parameters are alpha, beta, phiD,
+        rho_f, rho_sr, delta_lambdaB and delta_lambdaD.
+        """
+        return self._compute_many("phiB", deg, precision, **kwargs)
+
+    def compute_phiD_many(self, deg=True, precision=None, **kwargs) -> tuple:
+        """Get critical basal friction angle phiD as ECCW for arrays of parameters.
+
+        See compute_alpha_many: accepted named parameters are alpha, beta, phiB,
+        rho_f, rho_sr, delta_lambdaB and delta_lambdaD.
+        """
+        return self._compute_many("phiD", deg, precision, **kwargs)
+
+    def _predict(self, track: list, value: float) -> "tuple or None":
+        """Secant prediction of (var, psiD, psi0) at 'value' along a track.
+
+        'track' holds the last (value, X) pairs converged along it, at most 2.
+        Return None for an empty track.
+        """
+        if not track:
+            return None
+        value1, X1 = track[-1]
+        if len(track) == 1 or value1 == track[0][0]:
+            return X1
+        value0, X0 = track[0]
+        t = (value - value1) / (value1 - value0)
+        return tuple(x1 + t * (x1 - x0) for x0, x1 in zip(X0, X1))
+
+    def _sweep_step(self, name: str, value: float, tracks: tuple, deg) -> tuple:
+        """Solve 'name' at one step of sweep, continuing the given tracks.
+
+        There is a track per initial value of compute_*, which are updated in
+        place. The initial value is used only when the continuation of its
+        track fails, or gives no new physical solution.
+        """
+        self._check_params_with_raise()
+        if not feasibility.feasible(self, name):
+            for track in tracks:
+                track.clear()
+            return (), ()
+        runtime_var = getattr(self, "_runtime_" + name)
+        test = getattr(self, "_test_" + name)
+        inverse, normal, found = [], [], []
+        seeds = self._seeds(name, self._alpha, self._beta, self._phiD)
+        for track, cold in zip(tracks, seeds):
+            warm = self._predict(track, value)
+            for seed in (cold,) if warm is None else (warm, cold):
+                try:
+                    X = self._solve(seed, runtime_var)
+                except (RuntimeError, ArithmeticError, np.linalg.LinAlgError):
+                    if seed is cold:
+                        raise
+                    continue
+                categories = (False, False)
+                if test(X[0]) is not None:
+                    categories = self._categorize(X, runtime_var)
+                is_new = all(abs(X[0] - other) > self._h for other in found)
+                if seed is cold or (any(categories) and is_new):
+                    break
+            if any(categories):
+                found.append(X[0])
+                track[:] = [(value, X)] if seed is cold else [track[-1], (value, X)]
+            else:
+                track.clear()
+            self._store_result(X[0], categories, inverse, normal, deg)
         return tuple(inverse), tuple(normal)
 
-    def compute(self, flag: str) -> tuple:
+    def sweep(
+        self, param: str, values, solve_for="alpha", deg=True, precision=None
+    ):
+        """Solve 'solve_for' for successive values of 'param'.
+
+        'param' is the name of any parameter of params_table but context and
+        'solve_for', and 'values' an iterable of its values, given with the same
+        unit as the data descriptor. Each solve starts from the solution of the
+        previous steps extrapolated by a secant, and falls back on the initial
+        values of compute_* only when this continuation fails.
+
+        This is a generator yielding for each value the same result as
+        compute_<solve_for>, as soon as it is solved. The value of 'param' is
+        restored once the generator is exhausted or closed, as well as the
+        precision tier if overridden by 'precision'.
+        """
+        solvables = self._main_params_list
+        if solve_for not in solvables:
+            message = self._error_message("solve_for", "value", f"in {solvables}")
+            raise ValueError(message)
+        names = [k for k in self.params_table() if k not in ("context", solve_for)]
+        if param not in names:
+            raise ValueError(self._error_message("param", "value", f"in {names}"))
+        initial = getattr(self, param)
+        tracks = ([], [])
+        try:
+            with self._with_precision(precision):
+                for value in values:
+                    setattr(self, param, value)
+                    if solve_for == "beta":
+                        yield self.compute_beta(deg)
+                    else:
+                        yield self._sweep_step(solve_for, value, tracks, deg)
+        finally:
+            setattr(self, param, initial)
+
+    def compute(self, flag: str, precision=None) -> tuple:
         """Compute solution for given parameter.
         Parameter is a string value among: 'alpha', 'beta', 'phiB' or 'phiD'.
+        'precision' overrides the precision tier of this call (see precision).
         """
         parser = {
             "alpha": self.compute_alpha,
@@ -827,7 +2143,8 @@ class EccwCompute(BaseEccwCompute):
             "phiB": self.compute_phiB,
             "phiD": self.compute_phiD,
         }
-        return parser[flag]()
+        with self._with_precision(precision):
+            return parser[flag]()
 
 
 if __name__ == "__main__":
@@ -836,16 +2153,16 @@ if __name__ == "__main__":
 
     print("ALPHA")
     foo = EccwCompute(phiB=30, beta=0)
-    for phiD in [x * 0.10000 for x in range(270, 301)]:
-        foo.phiD = phiD
-        print(f"phiD={round(foo.phiD,3)}", foo.compute_alpha())
+    phiDs = [x * 0.10000 for x in range(270, 301)]
+    for phiD, alphas in zip(phiDs, foo.sweep("phiD", phiDs, solve_for="alpha")):
+        print(f"phiD={round(phiD,3)}", alphas)
 
     print()
     print("PHI_D")
     foo = EccwCompute(phiB=30, beta=10, context="c")
-    for alpha in [x * 0.10000 for x in range(0, 50)]:
-        foo.alpha = alpha
-        print(f"alpha={round(foo.alpha,3)}", foo.compute_phiD())
+    alphas = [x * 0.10000 for x in range(0, 50)]
+    for alpha, phiDs in zip(alphas, foo.sweep("alpha", alphas, solve_for="phiD")):
+        print(f"alpha={round(alpha,3)}", phiDs)
 
     print()  # two solutions in tectonic and collapsing categories.
     foo = EccwCompute(phiB=30, alpha=11.6, beta=-1.5)
@@ -7,20 +7,70 @@ Elements dedicated to explore solutions.
 
 import numpy as np
 from matplotlib import pyplot as plt
-from matplotlib import ticker, cm
+from matplotlib import ticker, cm, colormaps
 from math import pi, degrees, radians, inf, nan
 from itertools import product
-
-# import multiprocessing   # fails at pickling the class
-# import concurrent.futures   # fail at pickling the class
-# import pathos   # <<<<< solution !
-
-
-from eccw import EccwCompute
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# Instances pickle through their EccwState: see eccw.parallel for process pools.
+
+
+from eccw.eccw_compute import EccwCompute
+
+
+def _slab_projections(explore, name, X, PSID, PSI0, argmin=False) -> list:
+    """Min-projections of a slab of the convergence cube along its 3 axes.
+
+    Return 3 couples (min, argmin), argmin being None unless asked.
+    """
+    runtime_var = getattr(explore, "_runtime_" + name)
+    matrix = explore._matrix_of_function_to_root(X, PSID, PSI0, runtime_var)
+    return [
+        (matrix.min(axis=k), matrix.argmin(axis=k) if argmin else None)
+        for k in range(3)
+    ]
+
+
+class SeedAtlas(
+    namedtuple(
+        "SeedAtlas",
+        [
+            "variable",
+            "axes",
+            "roots",
+            "inverse",
+            "normal",
+            "label",
+            "iterations",
+            "diverged",
+        ],
+    )
+):
+    """Basins of attraction of the solver over a grid of seeds.
+
+    * variable: name of the solved parameter, 'alpha', 'phiB' or 'phiD';
+    * axes: the 3 axes (variable, psiD, psi0) of the grid of seeds [rad];
+    * roots: (R, 3) array of the distinct converged (variable, psiD, psi0);
+    * inverse, normal: (R,) booleans telling the category of each root (see
+      _categorize), both False if the root is not physical;
+    * label: index in roots of the root reached from each seed, -1 if none;
+    * iterations: number of iterations made from each seed;
+    * diverged: True for seeds whose last iterate is not finite.
+    """
+
+    __slots__ = ()
+
+    @property
+    def converged(self) -> np.array:
+        return self.label >= 0
 
 
 class EccwExplore(EccwCompute):
 
+    _slab_size = 2 ** 21  # Max number of points of the convergence cube at once.
+
     ## compute elements #######################################################
 
     def _matrix_of_function_to_root(self, X, PSID, PSI0, runtime_var) -> np.array:
@@ -32,14 +82,64 @@ class EccwExplore(EccwCompute):
         
         This method feed _function_to_root with a grid of parameters, then normalise
         the result by using mean(abs(returned_triplet)).
+        The grid is evaluated in one pass by broadcasting (see
+        _function_to_root_many).
 
         This method returns a numpy 3D array.
         """
-        MAP = map(
-            lambda xyz: np.mean(np.abs(self._function_to_root(xyz, runtime_var))),
-            product(X, PSID, PSI0),
-        )
-        return np.reshape(tuple(MAP), (len(X), len(PSID), -1))
+        name = runtime_var.__name__[len("_runtime_") :]
+        p = self._params_many(set())
+        grid = np.meshgrid(X, PSID, PSI0, indexing="ij", sparse=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            F1, F2, F3 = self._function_to_root_many(*grid, name, p)
+            return (np.abs(F1) + np.abs(F2) + np.abs(F3)) / 3.0
+
+    def _projections_of_function_to_root(
+        self, X, PSID, PSI0, runtime_var, argmin=False, workers=1
+    ) -> tuple:
+        """Min-projections along axes 0, 1 and 2 of _matrix_of_function_to_root.
+
+        The cube is walked in slabs along X of at most _slab_size points, so
+        memory stays O(N²). Slabs are shared between 'workers' processes.
+
+        Return the 3 planes of minima, same as np.min(MATRIX, axis=k), and with
+        argmin=True, also the 3 planes of indices along the projected axes.
+        """
+        X, PSID, PSI0 = (np.asarray(v, dtype=float) for v in (X, PSID, PSI0))
+        name = runtime_var.__name__[len("_runtime_") :]
+        step = max(1, self._slab_size // (len(PSID) * len(PSI0)))
+        starts = range(0, len(X), step)
+        slab = partial(_slab_projections, self, name, PSID=PSID, PSI0=PSI0)
+        slabs = (X[start : start + step] for start in starts)
+        mins = [None, np.empty((len(X), len(PSI0))), np.empty((len(X), len(PSID)))]
+        args = [None] + [np.zeros(m.shape, dtype=int) for m in mins[1:]]
+        executor = None
+        if workers > 1 and len(starts) > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            results = (executor.map if executor else map)(
+                partial(slab, argmin=argmin), slabs
+            )
+            for start, ((m0, a0), (m1, a1), (m2, a2)) in zip(starts, results):
+                # Axis 0 runs along slabs: keep first minimum, nan winning as in
+                # np.min and np.argmin.
+                if start == 0:
+                    mins[0], args[0] = m0, a0
+                else:
+                    better = (m0 < mins[0]) | (np.isnan(m0) & ~np.isnan(mins[0]))
+                    mins[0] = np.where(better, m0, mins[0])
+                    if argmin:
+                        args[0] = np.where(better, a0 + start, args[0])
+                end = start + len(m1)
+                mins[1][start:end], mins[2][start:end] = m1, m2
+                if argmin:
+                    args[1][start:end], args[2][start:end] = a1, a2
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        if argmin:
+            return tuple(mins), tuple(args)
+        return tuple(mins)
 
     def _solve_for_map_solution(self, X, runtime_var):
         # self._set_at_runtime = self._runtime_alpha
@@ -50,6 +150,48 @@ class EccwExplore(EccwCompute):
         psi0_path = [degrees(x) for x in psi0_path]
         return (alpha_path, psiD_path, psi0_path), self.iter_conv
 
+    def seed_atlas(self, runtime_var, X, PSID, PSI0, countmax=100) -> SeedAtlas:
+        """Solve from every seed of the grid X × PSID × PSI0 [rad] at once.
+
+        Seeds are solved with the batched Newton's method, at most 'countmax'
+        iterations each. Converged iterates equal modulo π on psiD and psi0
+        together are the same root. Return a SeedAtlas.
+        """
+        X, PSID, PSI0 = (np.asarray(v, dtype=float) for v in (X, PSID, PSI0))
+        name = runtime_var.__name__[len("_runtime_") :]
+        shape = (len(X), len(PSID), len(PSI0))
+        seeds = np.stack(
+            [a.ravel() for a in np.meshgrid(X, PSID, PSI0, indexing="ij")], axis=-1
+        )
+        p = self._params_many(set())
+        many = {k: np.broadcast_to(v, len(seeds)) for k, v in p.items()}
+        last, converged, count = self._solve_Newton_many(seeds, name, many, countmax)
+        label = np.full(len(seeds), -1)
+        roots = np.empty((0, 3))
+        if converged.any():
+            turns = np.floor(last[converged, 2] / pi + self._h)
+            reduced = last[converged] - np.outer(turns, (0.0, pi, pi))
+            keys = np.round(reduced / self._h).astype(np.int64)
+            _, first, inverse = np.unique(
+                keys, axis=0, return_index=True, return_inverse=True
+            )
+            roots = reduced[first]
+            label[converged] = inverse.ravel()
+        categories = [self._categorize(root, runtime_var) for root in roots]
+        inverse, normal = np.array(categories, dtype=bool).reshape(-1, 2).T
+        valid = np.isfinite(self._test_many(name, roots[:, 0], p))
+        inverse, normal = inverse & valid, normal & valid
+        return SeedAtlas(
+            name,
+            (X, PSID, PSI0),
+            roots,
+            inverse,
+            normal,
+            label.reshape(shape),
+            count.reshape(shape),
+            ~np.isfinite(last).all(axis=1).reshape(shape),
+        )
+
     ## display elements #######################################################
 
     def _subplot_labels(self, xlabel, ylabel, title, axe):
@@ -79,11 +221,24 @@ class EccwExplore(EccwCompute):
         axe.plot(pathX2, pathY2, "-oy")
         axe.plot(pathX2[-1], pathY2[-1], "ob")
 
-    def draw_map_solution(self, runtime_var, X1, X2, N=32, vmin=-pi / 2, vmax=pi / 2):
+    def draw_map_solution(
+        self,
+        runtime_var,
+        X1,
+        X2,
+        N=32,
+        vmin=-pi / 2,
+        vmax=pi / 2,
+        workers=1,
+        figure=None,
+    ):
         """Draw a convergence map for the 3 parameters X, psiD and psi0.
         X can be {alpha, phiD, phiB}.
         Sélection of X is made through runtime_var parameter.
         X1 and X2 are 3 elements lists containig 2 sets of initial values.
+        Maps are computed on 'workers' processes (see
+        _projections_of_function_to_root).
+        Maps are drawn in 'figure' if given, else in a pyplot figure.
         """
         parser = {
             self._runtime_alpha: "$\\alpha$",
@@ -92,26 +247,35 @@ class EccwExplore(EccwCompute):
         }
         var_label = parser[runtime_var]
         #### SOLVE ####
+        trajectory = self._trajectory
+        self.enable_trajectory()
         try:
-            paths1, count1 = self._solve_for_map_solution(X1, runtime_var)
-        except RuntimeError:
-            paths1, count1 = [(nan, nan)] * 4, None
-        try:
-            paths2, count2 = self._solve_for_map_solution(X2, runtime_var)
-        except RuntimeError:
-            paths2, count2 = [(nan, nan)] * 4, None
+            try:
+                paths1, count1 = self._solve_for_map_solution(X1, runtime_var)
+            except RuntimeError:
+                paths1, count1 = [(nan, nan)] * 4, None
+            try:
+                paths2, count2 = self._solve_for_map_solution(X2, runtime_var)
+            except RuntimeError:
+                paths2, count2 = [(nan, nan)] * 4, None
+        finally:
+            self._trajectory = trajectory
 
         VARs = np.linspace(vmin, vmax, N)
         PSIDs = np.linspace(vmin, vmax, N)
         PSI0s = np.linspace(vmin, vmax, N)
-        MATRIX = self._matrix_of_function_to_root(VARs, PSIDs, PSI0s, runtime_var)
+        PMAPs = self._projections_of_function_to_root(
+            VARs, PSIDs, PSI0s, runtime_var, workers=workers
+        )
 
         ### PLOT ###
         VARs = [degrees(x) for x in VARs]
         PSIDs = [degrees(x) for x in PSIDs]
         PSI0s = [degrees(x) for x in PSI0s]
 
-        fig = plt.figure("convergence maps", figsize=(10, 9))
+        if figure is None:
+            figure = plt.figure("convergence maps", figsize=(10, 9))
+        fig = figure
         title = f"""
         Convergence maps for parameters
         $\\alpha$={round(self.alpha,2)}
@@ -127,12 +291,13 @@ class EccwExplore(EccwCompute):
         #   ├────┼────┤   2x2 subplot grid
         # 1 │ax10│ax11│
         #   └────┴────┘
-        ax00 = plt.subplot2grid((2, 2), (0, 0))
-        ax10 = plt.subplot2grid((2, 2), (1, 0), sharex=ax00)
-        ax01 = plt.subplot2grid((2, 2), (0, 1), sharey=ax00)
-        ax11 = plt.subplot2grid((2, 2), (1, 1), sharex=ax01, sharey=ax10)
+        grid = fig.add_gridspec(2, 2)
+        ax00 = fig.add_subplot(grid[0, 0])
+        ax10 = fig.add_subplot(grid[1, 0], sharex=ax00)
+        ax01 = fig.add_subplot(grid[0, 1], sharey=ax00)
+        ax11 = fig.add_subplot(grid[1, 1], sharex=ax01, sharey=ax10)
 
-        PMAP = np.transpose(np.min(MATRIX, axis=0))
+        PMAP = np.transpose(PMAPs[0])
         ax11.xaxis.set_ticks_position("both")
         ax11.yaxis.tick_right()
         ax11.yaxis.set_ticks_position("both")
@@ -142,14 +307,14 @@ class EccwExplore(EccwCompute):
         self._subplot_conv_path(paths1[1], paths1[2], paths2[1], paths2[2], ax11)
         ax11.grid()
 
-        PMAP = np.transpose(np.min(MATRIX, axis=1))
+        PMAP = np.transpose(PMAPs[1])
         ax10.yaxis.set_ticks_position("both")
         self._subplot_labels(var_label, "$\psi_0$", "", ax10)
         self._subplot_conv_map(VARs, PSI0s, PMAP, ax10)
         self._subplot_conv_path(paths1[0], paths1[2], paths2[0], paths2[2], ax10)
         ax10.grid()
 
-        PMAP = np.min(MATRIX, axis=2)
+        PMAP = PMAPs[2]
         ax01.xaxis.tick_top()
         ax01.xaxis.set_ticks_position("both")
         ax01.xaxis.set_label_position("top")
@@ -170,13 +335,70 @@ class EccwExplore(EccwCompute):
         cb = fig.colorbar(h1, cax=cbar_ax, orientation="horizontal")
         cb.ax.set_xlabel("convergence to zero")
 
-        plt.tight_layout()
-        plt.draw()
+        fig.tight_layout()
+        fig.canvas.draw_idle()
         # fig.savefig("/home/bmary/"+title+".png")
         # fig.savefig("/home/bmary/conv_map.png")
         # plt.close(fig)
         return count1, count2, fig
 
+    def draw_seed_atlas(self, atlas: SeedAtlas, index=None, figure=None):
+        """Draw reached roots and iteration counts of a SeedAtlas over (psiD, psi0).
+
+        Seeds are taken at 'index' along the variable axis (default is middle).
+        Atlas is drawn in 'figure' if given, else in a pyplot figure.
+        """
+        X, PSIDs, PSI0s = atlas.axes
+        index = len(X) // 2 if index is None else index
+        PSIDs = [degrees(x) for x in PSIDs]
+        PSI0s = [degrees(x) for x in PSI0s]
+        # Physical roots get a color each, other ones are gathered in the last.
+        physical = np.flatnonzero(atlas.inverse | atlas.normal)
+        classes = np.full(len(atlas.roots) + 1, float(len(physical)))
+        classes[physical] = np.arange(len(physical))
+        classes[-1] = nan  # Label -1: no root reached.
+        label = np.transpose(classes[atlas.label[index]])
+
+        if figure is None:
+            figure = plt.figure("seed atlas", figsize=(12, 5))
+        fig = figure
+        fig.clear()
+        ax0, ax1 = fig.subplots(1, 2)
+        fig.suptitle(
+            f"Seeds of {atlas.variable} = {round(degrees(X[index]), 2)}°, "
+            f"context: {self.context}"
+        )
+        n = len(physical) + 1
+        h = ax0.pcolormesh(
+            PSIDs,
+            PSI0s,
+            label,
+            cmap=colormaps["tab10"].resampled(n),
+            vmin=-0.5,
+            vmax=n - 0.5,
+            shading="nearest",
+        )
+        cb = fig.colorbar(h, ax=ax0, ticks=range(n))
+        ticklabels = []
+        for i in physical:
+            ticklabels.append(
+                f"{round(degrees(atlas.roots[i][0]), 2)}"
+                + (" inverse" if atlas.inverse[i] else "")
+                + (" normal" if atlas.normal[i] else "")
+            )
+        cb.ax.set_yticklabels(ticklabels + ["not physical"])
+        self._subplot_labels("$\\psi_D$", "$\\psi_0$", "reached root", ax0)
+
+        count = np.transpose(atlas.iterations[index]).astype(float)
+        count[np.transpose(~atlas.converged[index])] = nan
+        h = ax1.pcolormesh(PSIDs, PSI0s, count, cmap="viridis", shading="nearest")
+        fig.colorbar(h, ax=ax1)
+        self._subplot_labels("$\\psi_D$", "$\\psi_0$", "iterations", ax1)
+
+        fig.tight_layout()
+        fig.canvas.draw_idle()
+        return fig
+
 
 if __name__ == "__main__":
 
@@ -192,17 +414,27 @@ if __name__ == "__main__":
         plt.show()
 
     if do == "alpha" and loop:
+        from eccw.render import RenderSpec, render
+
         foo = EccwExplore(phiB=30, phiD=20, beta=10, context="c")
         phiDs, betas = range(0, 35, 5), range(-20, 20, 5)
+        specs = []
         for i, (phiD, beta) in enumerate(product(phiDs, betas)):
-            foo.set_params(phiD=phiD, beta=beta)
+            params = dict(phiB=30, phiD=phiD, beta=beta, context="c")
             X1 = [0.0, 0.0, 0.0]
             X2 = [0.0, foo._sign * pi / 2.0, foo._sign * pi / 4.0]
-            c1, c2, fig = foo.draw_map_solution(foo._runtime_alpha, X1, X2)
-            print(c1, c2, foo.compute_alpha())
+            call = dict(runtime_var="alpha", X1=X1, X2=X2)
             title = f"convergence_map_alpha_{i+1}"
-            fig.savefig("/home/bmary/tmp/" + title + ".png")
-            plt.close(fig)
+            specs.append(
+                RenderSpec(
+                    "/home/bmary/tmp/" + title + ".png",
+                    params,
+                    [("draw_map_solution", call)],
+                    "explore",
+                )
+            )
+        for path in render(specs):
+            print(path)
 
     if do == "phiD" and not loop:
         # TODO: extension donne même résultat que compression !!!
@@ -230,25 +462,29 @@ if __name__ == "__main__":
         plt.show()
 
     if do == "phiD" and loop:
-        foo = EccwExplore(phiB=30, alpha=0, beta=10, context="c")
+        from eccw.render import RenderSpec, render
+
         alphas, betas = range(-20, 20, 5), range(-20, 20, 5)
+        specs = []
         for i, (alpha, beta) in enumerate(product(alphas, betas)):
-            foo.set_params(alpha=alpha, beta=beta)
-            delta = foo._alpha + foo._beta
+            params = dict(phiB=30, alpha=alpha, beta=beta, context="c")
+            delta = radians(alpha + beta)
             X1 = [delta, delta, 0.0]
             X2 = [0.0, pi / 2, pi / 2 - delta]
-            c1, c2, fig = foo.draw_map_solution(
-                foo._runtime_phiD, X1, X2, vmin=-pi / 4, vmax=3 * pi / 4
+            call = dict(
+                runtime_var="phiD", X1=X1, X2=X2, vmin=-pi / 4, vmax=3 * pi / 4
             )
-            print(c1, c2)
-            try:
-                print(foo.compute_phiD())
-            except RuntimeError:
-                print("Error")
-                pass
             title = f"convergence_map_phiD_{i+1}"
-            fig.savefig("/home/bmary/tmp/" + title + ".png")
-            plt.close(fig)
+            specs.append(
+                RenderSpec(
+                    "/home/bmary/tmp/" + title + ".png",
+                    params,
+                    [("draw_map_solution", call)],
+                    "explore",
+                )
+            )
+        for path in render(specs):
+            print(path)
 
     if do == "phiB":
         foo = EccwExplore(phiD=15, alpha=20, beta=10, context="c")
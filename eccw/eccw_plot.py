@@ -7,16 +7,18 @@ Elements dedicated to plot physics.
 
 
 import numpy as np
-from math import pi, tan, atan, cos, sin, sqrt, asin, degrees
+from math import atan, cos, sin, degrees
 from matplotlib import pyplot as plt
 import matplotlib.patheffects as pe
 from matplotlib.offsetbox import DrawingArea, AnnotationBbox
 from matplotlib import patches, lines
+from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib import ticker, cm
 import warnings
 
 
-from eccw import EccwCompute
+from eccw import sketch
+from eccw.eccw_compute import EccwCompute
 
 
 warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
@@ -25,6 +27,17 @@ warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
 class EccwPlot(EccwCompute):
     """
     Plot critical enveloppes of the critical coulomb wedge.
+
+    Drawing goes to the pyplot figure named "ECCW", or to the matplotlib Figure
+    or Axes given as 'figure' or 'axe' named parameter, without any pyplot
+    state. Figure and axes are only set up at the first drawing, so that an
+    instance used for curve data costs no more than an EccwCompute.
+
+    Artists drawn by add_curve, add_point, add_refpoint and add_sketch can be
+    given an 'id', so that update_curve, update_point, update_refpoint and
+    update_sketch redraw them from current parameters without a reset of the
+    figure, optionally by blitting. Several ids can be updated with draw=False
+    and redrawn at once by redraw.
     """
 
     _point_center = (0.0, 0.0)
@@ -32,23 +45,35 @@ class EccwPlot(EccwCompute):
     _point_bottom = (0.0, 0.0)
     _point_left = (0.0, 0.0)
     _point_right = (0.0, 0.0)
-    _sketch_box_width = 0.0
-    _sketch_box_height = 0.0
     _padding = 10.0
     _sketch_size_factor = 1.0
-    _sketch_surface = 5000.0
-    _fault_gap = 1.0
-    _arrow_L = 1.0
-    _arrow_gap = 1.0
-    _arrow_head_width = 1.0
-    _arrow_head_length = 1.0
+    _curve_points = 65  # Initial sampling of alpha for curves.
+    _curve_depth = 32  # Maximum number of refinements of curves sampling.
+    _curve_tolerance = 1e-2  # Maximum chord error of curves [deg].
 
     def __init__(self, **kwargs):
+        self._figure = kwargs.pop("figure", None)
+        self._axe = kwargs.pop("axe", None)
         EccwCompute.__init__(self, **kwargs)
         self.sketch_size_factor = kwargs.get("sketch_size_factor", 1.0)
         self.legend = None
-        self._new_figure()
-        self.init_figure()
+        self._artists = dict()  # Artists by id: (kind, kwargs, list of artists).
+        self._background = None  # Canvas without animated artists, for blitting.
+        self._set_up = False  # Figure and axes set up by _new_figure.
+
+    @property
+    def figure(self):
+        """Figure drawn in, set up at first access."""
+        if not self._set_up:
+            self._new_figure()
+        return self._figure
+
+    @property
+    def axe(self):
+        """Axes drawn in, set up at first access."""
+        if not self._set_up:
+            self._new_figure()
+        return self._axe
 
     @property
     def sketch_size_factor(self):
@@ -57,57 +82,131 @@ class EccwPlot(EccwCompute):
     @sketch_size_factor.setter
     def sketch_size_factor(self, value):
         self._sketch_size_factor = float(value)
-        # Surface of sketeched prism :
-        # arbitrary set, allows a cst looking.
-        self._sketch_surface = 5000.0 * self._sketch_size_factor
-        self._fault_gap = self._sketch_surface / sqrt(self._sketch_surface) / 4.0
-        self._arrow_L = self._fault_gap * 2.0 / 3.0
-        self._arrow_gap = self._arrow_L / 2.0
-        self._arrow_head_width = self._arrow_L / 3.0
-        self._arrow_head_length = self._arrow_L / 2.0
 
     ## Private methods ########################################################
 
     def _new_figure(self):
-        self.figure = plt.figure("ECCW", figsize=(8, 6))
-        # self.axe = self.figure.add_subplot(111)
-        self.axe = self.figure.gca()
+        """Set up the given Axes or Figure, else the pyplot figure named ECCW."""
+        if self._axe is None:
+            if self._figure is None:
+                self._figure = plt.figure("ECCW", figsize=(8, 6))
+            # self._axe = self._figure.add_subplot(111)
+            self._axe = self._figure.gca()
+        self._figure = self._axe.figure
+        self._set_up = True
+        self._background = None
+        self._figure.canvas.mpl_connect("draw_event", self._on_draw)
+        self.init_figure()
 
-    def _get_alphamax(self):
-        return atan((1 - self._lambdaB) / (1 - self._density_ratio) * tan(self._phiB))
+    def _on_draw(self, event):
+        """Capture the background of blitting, and draw animated artists over it."""
+        if not hasattr(self.figure.canvas, "copy_from_bbox"):
+            return  # Canvas unable to blit, as FigureCanvasBase.
+        self._background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for kind, kwargs, artists in self._artists.values():
+            for artist in artists:
+                if artist.get_animated():
+                    self.figure.draw_artist(artist)
+
+    def _register(self, id, kind: str, kwargs: dict, artists: list):
+        """Keep artists drawn by an add_* method, if given an id."""
+        if id is not None:
+            self._artists[id] = (kind, kwargs, artists)
+
+    def _entry(self, id, kind: str) -> tuple:
+        """Return kwargs and artists of an id added by add_<kind>."""
+        try:
+            found, kwargs, artists = self._artists[id]
+        except KeyError:
+            raise KeyError(f"EccwPlot has no artists with id {id!r}")
+        if found != kind:
+            raise ValueError(f"EccwPlot artists with id {id!r} are a {found}")
+        return kwargs, artists
 
-    def _store_if_valid(self, beta, alpha, betas, alphas):
-        if self._is_valid_taper(alpha, beta):
-            betas.append(degrees(beta))
-            alphas.append(degrees(alpha))
+    def _refresh(self, artists: list, blit: bool):
+        """Redraw after an update of artists, only them if 'blit' is True.
+
+        Blitted artists become animated: they are drawn over a background
+        captured at the last full draw, so axes limits are not updated.
+        """
+        canvas = self.figure.canvas
+        if not blit:
+            self.axe.relim()
+            self.axe.autoscale_view()
+            canvas.draw_idle()
+            return
+        new = [artist for artist in artists if not artist.get_animated()]
+        for artist in new:
+            artist.set_animated(True)
+        if new or self._background is None:
+            canvas.draw()  # Background is captured by _on_draw.
+        else:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+            canvas.blit(self.figure.bbox)
+        canvas.flush_events()
+
+    def _sample_alphas(self, tolerance: float) -> np.ndarray:
+        """Return alphas [rad] sampling adaptively the critical enveloppe.
+
+        Starting from a coarse regular sampling of [-alphamax, alphamax], an
+        interval is halved while one of the beta branches deviates from its
+        chord by more than 'tolerance' [deg], or while a branch vanishes within
+        it. The deviation is checked at mid interval, where it is at least 0.8
+        times the maximum one: beta is smooth or, at tips of the curve, varies
+        as a square root of alpha.
+        """
+        alphamax = np.nextafter(self._get_alphamax(), 0.0)
+        alphas = np.linspace(-alphamax, alphamax, self._curve_points)
+        params = (self._phiB, self._phiD, self._density_ratio)
+        params += (self._lambdaB, self._lambdaD)
+        betas = np.array(self._beta_branches(alphas, *params))
+        tolerance = np.radians(tolerance)
+        threshold = 0.8 * tolerance
+        active = np.arange(alphas.size - 1)  # Intervals to check.
+        for _ in range(self._curve_depth):
+            mids = (alphas[active] + alphas[active + 1]) / 2.0
+            mid_betas = np.array(self._beta_branches(mids, *params))
+            left, right = betas[:, active], betas[:, active + 1]
+            with np.errstate(invalid="ignore"):
+                split = abs(mid_betas - (left + right) / 2.0) > threshold
+            # Ends of branches are located within a hundredth of tolerance.
+            edge = np.isnan(left) != np.isnan(right)
+            edge |= np.isnan(left) != np.isnan(mid_betas)
+            edge &= alphas[active + 1] - alphas[active] > tolerance / 100.0
+            split = np.flatnonzero((split | edge).any(axis=0))
+            if not split.size:
+                break
+            alphas = np.insert(alphas, active[split] + 1, mids[split])
+            betas = np.insert(betas, active[split] + 1, mid_betas[:, split], axis=1)
+            # Halves of split intervals are next to check, in the new indexing.
+            first = active[split] + np.arange(split.size)
+            active = np.stack((first, first + 1), axis=-1).ravel()
+        return alphas
 
     def _compute_betas_alphas(self, alphas):
         """Return nested lists of valid values of beta, alpha"""
+        alphas = np.asarray(alphas, dtype=float)
         # self._check_params()
-        betas_ul, betas_ur, betas_dr, betas_dl = [], [], [], []
-        alphas_ul, alphas_ur, alphas_dr, alphas_dl = [], [], [], []
-        for alpha in alphas:
-            lambdaB_D2 = self._convert_lambda(alpha, self._lambdaB)
-            lambdaD_D2 = self._convert_lambda(alpha, self._lambdaD)
-            alpha_prime = self._convert_alpha(alpha, lambdaB_D2)
-            # Weird if statement because asin in PSI_D is your ennemy !
-            if -self._phiB <= alpha_prime <= self._phiB:
-                psi0_1, psi0_2 = self._PSI_0(alpha_prime, self._phiB)
-                psiD_11, psiD_12 = self._PSI_D(
-                    psi0_1, self._phiB, self._phiD, lambdaB_D2, lambdaD_D2
-                )
-                psiD_21, psiD_22 = self._PSI_D(
-                    psi0_2, self._phiB, self._phiD, lambdaB_D2, lambdaD_D2
-                )
-                beta_dl = psiD_11 - psi0_1 - alpha
-                beta_ur = psiD_12 - psi0_1 - alpha
-                beta_dr = psiD_21 - psi0_2 - alpha + pi  # Don't ask why +pi
-                beta_ul = psiD_22 - psi0_2 - alpha
-                # beta, alpha, betas_alphas, i
-                self._store_if_valid(beta_dl, alpha, betas_dl, alphas_dl)
-                self._store_if_valid(beta_ur, alpha, betas_ur, alphas_ur)
-                self._store_if_valid(beta_dr, alpha, betas_dr, alphas_dr)
-                self._store_if_valid(beta_ul, alpha, betas_ul, alphas_ul)
+        branches = self._beta_branches(
+            alphas,
+            self._phiB,
+            self._phiD,
+            self._density_ratio,
+            self._lambdaB,
+            self._lambdaD,
+        )
+        valids = []
+        for beta in branches:
+            valid = ~np.isnan(beta)
+            valids.append(
+                (np.degrees(beta[valid]).tolist(), np.degrees(alphas[valid]).tolist())
+            )
+        (betas_dl, alphas_dl), (betas_ur, alphas_ur) = valids[:2]
+        (betas_dr, alphas_dr), (betas_ul, alphas_ul) = valids[2:]
         betas_up = betas_ul + betas_ur[::-1]
         alphas_up = alphas_ul + alphas_ur[::-1]
         betas_down = betas_dl[::-1] + betas_dr
@@ -150,161 +249,11 @@ class EccwPlot(EccwCompute):
                 values.append(value)
                 others.append(other)
 
-    def _draw_arrow(self, angle, x, y, solution, gamma=True):
-        xL, yL = self._arrow_L * cos(angle), self._arrow_L * sin(angle)
-        dum_l = sqrt(self._arrow_gap ** 2.0 + self._arrow_L ** 2.0) / 2.0
-        dum_angle = atan(self._arrow_gap / self._arrow_L)
-        if solution is "B":
-            dx = dum_l * cos(angle - dum_angle)
-            dy = dum_l * sin(angle - dum_angle)
-            way = "right" if gamma else "left"
-        else:
-            dx = dum_l * cos(angle + dum_angle)
-            dy = dum_l * sin(angle + dum_angle)
-            way = "left" if gamma else "right"
-        if gamma:
-            p1 = patches.FancyArrow(
-                x - dx,
-                y - dy,
-                xL,
-                yL,
-                lw=1,
-                head_width=self._arrow_head_width,
-                head_length=self._arrow_head_length,
-                fc="k",
-                ec="k",
-                shape=way,
-                length_includes_head=True,
-            )
-            p2 = patches.FancyArrow(
-                x + dx,
-                y + dy,
-                -xL,
-                -yL,
-                lw=1,
-                head_width=self._arrow_head_width,
-                head_length=self._arrow_head_length,
-                fc="k",
-                ec="k",
-                shape=way,
-                length_includes_head=True,
-            )
-        else:
-            p1 = patches.FancyArrow(
-                x - dx,
-                y + dy,
-                xL,
-                -yL,
-                lw=1,
-                head_width=self._arrow_head_width,
-                head_length=self._arrow_head_length,
-                fc="k",
-                ec="k",
-                shape=way,
-                length_includes_head=True,
-            )
-            p2 = patches.FancyArrow(
-                x + dx,
-                y - dy,
-                -xL,
-                yL,
-                lw=1,
-                head_width=self._arrow_head_width,
-                head_length=self._arrow_head_length,
-                fc="k",
-                ec="k",
-                shape=way,
-                length_includes_head=True,
-            )
-        self.drawing_aera.add_artist(p1)
-        self.drawing_aera.add_artist(p2)
-
-    def _draw_faults(self, a_f, x_f, y_f, xgap_f, ygap_f, ifirst, incr, col="gray"):
-        xt, yt = self._prism_tip
-        i = ifirst
-        while 1:
-            i += incr
-            Ni = [x_f - i * xgap_f, y_f - i * ygap_f]
-            b_f = Ni[1] - a_f * Ni[0]
-            X, Y = [], []
-            # Fault intersection with base
-            try:
-                x = (self._b_basal - b_f) / (a_f - self._a_basal)
-                y = a_f * x + b_f
-                self._append_if_node_in_box(x, y, X, Y)
-            except ZeroDivisionError:
-                pass
-            # Fault intersection with topo
-            x = (self._b_topo - b_f) / (a_f - self._a_topo)
-            y = a_f * x + b_f
-            self._append_if_node_in_box(x, y, X, Y)
-            # Fault intersection with rear arc
-            A = 1 + a_f ** 2.0
-            B = 2.0 * (a_f * (b_f - yt) - xt)
-            C = xt ** 2.0 + (b_f - yt) ** 2.0 - self._L ** 2.0
-            D = B ** 2.0 - 4 * A * C
-            if D >= 0.0:
-                x = (-B - sqrt(D)) / 2.0 / A
-                y = a_f * x + b_f
-                self._append_if_node_in_box(x, y, X, Y)
-                x = (-B + sqrt(D)) / 2.0 / A
-                y = a_f * x + b_f
-                self._append_if_node_in_box(x, y, X, Y)
-            if len(X) < 2:
-                break
-            p = lines.Line2D(X, Y, lw=1, c=col)
-            self.drawing_aera.add_artist(p)
-
-    def _get_gamma_A(self):
-        return (
-            pi / 2.0
-            + self._phiB
-            - 2.0 * self._alpha
-            + self._alpha_prime
-            + asin(sin(self._alpha_prime) / sin(self._phiB))
-        ) / 2.0
-
-    def _get_theta_A(self):
-        return (
-            pi / 2.0
-            + self._phiB
-            + 2.0 * self._alpha
-            - self._alpha_prime
-            - asin(sin(self._alpha_prime) / sin(self._phiB))
-        ) / 2.0
-
-    def _get_gamma_B(self):
-        return (
-            pi / 2.0
-            - self._phiB
-            - 2.0 * self._alpha
-            + self._alpha_prime
-            - asin(sin(self._alpha_prime) / sin(self._phiB))
-        ) / 2.0
-
-    def _get_theta_B(self):
-        return (
-            pi / 2.0
-            - self._phiB
-            + 2.0 * self._alpha
-            - self._alpha_prime
-            + asin(sin(self._alpha_prime) / sin(self._phiB))
-        ) / 2.0
-
-    def _append_if_node_in_box(self, x, y, X, Y):
-        foo = self._padding - self._numtol
-        bar = self._padding + self._numtol
-        if foo <= x <= self._sketch_box_width - bar:
-            if foo <= y <= self._sketch_box_height - bar:
-                X.append(x)
-                Y.append(y)
-
     def _get_curve_settings(self, **kwargs):
         return {
             "c": kwargs.get("color", "k"),
             "lw": kwargs.get("thickness", 2),
             "ls": kwargs.get("style", "-"),
-            "figure": self.figure,
         }
 
     ## Public methods #########################################################
@@ -315,13 +264,29 @@ class EccwPlot(EccwCompute):
         self.axe.grid(True)
 
     def reset_figure(self):
-        if not plt.fignum_exists(self.figure.number):
-            del self.figure
-            self._new_figure()
-        self.axe.clear()
-        self.axe = self.figure.gca()
+        self._artists.clear()
+        if not self._set_up:
+            return  # Set up at next drawing.
+        number = getattr(self._figure, "number", None)  # None out of pyplot.
+        if number is not None and not plt.fignum_exists(number):
+            # Closed: a new pyplot figure is set up at next drawing.
+            self._figure = self._axe = None
+            self._set_up = False
+            return
+        self._axe.clear()
         self.init_figure()
 
+    def redraw(self, *ids, blit=False):
+        """Redraw the figure, or only the artists of given ids if 'blit' is True."""
+        artists = [a for id in ids for a in self._artists[id][2]]
+        self._refresh(artists, blit)
+
+    def remove(self, id):
+        """Remove artists drawn with the given id, if any."""
+        kind, kwargs, artists = self._artists.pop(id, (None, None, []))
+        for artist in artists:
+            artist.remove()
+
     def show(self, block=False):
         plt.show(block=block)
 
@@ -329,9 +294,9 @@ class EccwPlot(EccwCompute):
         self.axe.set_title(title, fontsize=16)
 
     def add_legend(self):
-        self.legend = plt.legend(loc="best", fontsize="10")
+        self.legend = self.axe.legend(loc="best", fontsize="10")
         if self.legend is not None:
-            self.legend.draggable()
+            self.legend.set_draggable(True)
 
     def add_refpoint(self, *args, **kwargs):
         try:
@@ -349,7 +314,8 @@ class EccwPlot(EccwCompute):
         path_effects = [
             pe.PathPatchEffect(edgecolor="k", facecolor=color, linewidth=0.5)
         ]
-        plt.plot(
+        self.remove(kwargs.get("id"))
+        artists = self.axe.plot(
             beta,
             alpha,
             ls="",
@@ -357,8 +323,17 @@ class EccwPlot(EccwCompute):
             ms=size,
             label=label,
             path_effects=path_effects,
-            figure=self.figure,
         )
+        self._register(kwargs.get("id"), "refpoint", kwargs, artists)
+
+    def update_refpoint(self, id, blit=False, draw=True, **kwargs):
+        """Move the reference point of given id to new 'beta' and/or 'alpha'."""
+        stored, artists = self._entry(id, "refpoint")
+        stored.update(kwargs)
+        beta, alpha = np.atleast_1d(stored["beta"]), np.atleast_1d(stored["alpha"])
+        artists[0].set_data(beta, alpha)
+        if draw:
+            self._refresh(artists, blit)
 
     def add_curve(self, **kwargs):
         """Plot complete solution plus a given solution.
@@ -367,9 +342,8 @@ class EccwPlot(EccwCompute):
         inverse = kwargs.get("inverse", dict())
         normal = kwargs.get("normal", dict())
         label = kwargs.get("label", "")
-        alphamax = self._get_alphamax()
-        alphas = np.arange(-alphamax, alphamax, alphamax * 2 / 1e4)
-        bs_up, as_up, bs_dw, as_dw = self._compute_betas_alphas(alphas)
+        self.remove(kwargs.get("id"))
+        bs_up, as_up, bs_dw, as_dw = self._curve_data(**kwargs)
         betas, alphas = bs_up + bs_dw[::-1], as_up + as_dw[::-1]
         if normal or inverse:
             n_settings = self._get_curve_settings(**normal)
@@ -379,7 +353,7 @@ class EccwPlot(EccwCompute):
                 pe.Stroke(linewidth=n_settings["lw"] + 0.5, foreground="k"),
                 pe.Normal(),
             ]
-            plt.plot(
+            artists = self.axe.plot(
                 bs_up, as_up, label=l_norm, path_effects=path_effects, **n_settings
             )
             # Bottom line is inverse mecanism.
@@ -387,15 +361,41 @@ class EccwPlot(EccwCompute):
                 pe.Stroke(linewidth=i_settings["lw"] + 0.5, foreground="k"),
                 pe.Normal(),
             ]
-            plt.plot(bs_dw, as_dw, label=l_inv, path_effects=path_effects, **i_settings)
+            artists += self.axe.plot(
+                bs_dw, as_dw, label=l_inv, path_effects=path_effects, **i_settings
+            )
         else:
             settings = self._get_curve_settings(**kwargs)
             path_effects = [
                 pe.Stroke(linewidth=settings["lw"] + 0.5, foreground="k"),
                 pe.Normal(),
             ]
-            plt.plot(betas, alphas, label=label, path_effects=path_effects, **settings)
+            artists = self.axe.plot(
+                betas, alphas, label=label, path_effects=path_effects, **settings
+            )
+        self._register(kwargs.get("id"), "curve", kwargs, artists)
+
+    def update_curve(self, id, blit=False, draw=True):
+        """Redraw the curve of given id from current parameters."""
+        kwargs, artists = self._entry(id, "curve")
+        bs_up, as_up, bs_dw, as_dw = self._curve_data(**kwargs)
+        if len(artists) == 2:
+            artists[0].set_data(bs_up, as_up)
+            artists[1].set_data(bs_dw, as_dw)
+        else:
+            artists[0].set_data(bs_up + bs_dw[::-1], as_up + as_dw[::-1])
+        if draw:
+            self._refresh(artists, blit)
 
+    def _curve_data(self, **kwargs) -> tuple:
+        """Return betas and alphas [deg] of upper and lower parts of the curve.
+
+        Bounding and central points of the curve are updated on the way.
+        """
+        alphamax = self._get_alphamax()
+        alphas = self._sample_alphas(kwargs.get("tolerance", self._curve_tolerance))
+        bs_up, as_up, bs_dw, as_dw = self._compute_betas_alphas(alphas)
+        betas, alphas = bs_up + bs_dw[::-1], as_up + as_dw[::-1]
         # Get bounding and central points (used by sketch).
         b, a = self._get_centroid(betas, alphas)
         self._point_center = (b, a)
@@ -406,11 +406,10 @@ class EccwPlot(EccwCompute):
         self._point_bottom = (bs_dw[i], -degrees(alphamax))
         self._point_left = (bs_up[0], as_up[0])
         self._point_right = (bs_up[-1], as_up[-1])
+        return bs_up, as_up, bs_dw, as_dw
 
     def add_point(self, **kwargs):
-        beta = kwargs.get("beta", None)
-        alpha = kwargs.get("alpha", None)
-        sketch = kwargs.get("sketch", False)
+        self.remove(kwargs.get("id"))
         # line = kwargs.get('line', True)
         settings = {
             "linestyle": "",
@@ -422,9 +421,38 @@ class EccwPlot(EccwCompute):
                     edgecolor="k", facecolor=kwargs.get("color", "k"), linewidth=0.5
                 )
             ],
-            "figure": self.figure,
         }
-        betas, alphas = [], []
+        betas, alphas, sketches = self._point_data(**kwargs)
+        artists = self.axe.plot(betas, alphas, **settings) + sketches
+        self._register(kwargs.get("id"), "point", kwargs, artists)
+
+    def update_point(self, id, blit=False, draw=True, **kwargs):
+        """Redraw the point(s) of given id from current parameters.
+
+        Named parameters replace the ones given to add_point, as 'beta' or
+        'alpha'. Sketches of points are drawn again.
+        """
+        stored, artists = self._entry(id, "point")
+        stored.update(kwargs)
+        animated = artists[0].get_animated()
+        for sketch in artists[1:]:
+            sketch.remove()
+        betas, alphas, sketches = self._point_data(**stored)
+        for sketch in sketches:
+            sketch.set_animated(animated)
+        artists[0].set_data(betas, alphas)
+        artists[1:] = sketches
+        if draw:
+            self._refresh(artists, blit)
+
+    def _point_data(self, **kwargs) -> tuple:
+        """Return betas and alphas of points and sketches drawn at them."""
+        beta = kwargs.get("beta", None)
+        alpha = kwargs.get("alpha", None)
+        sketch = kwargs.get("sketch", False)
+        # Sketches belong to the point, not to its id.
+        kwargs = {key: value for key, value in kwargs.items() if key != "id"}
+        betas, alphas, sketches = [], [], []
         pinf, minf = float("inf"), float("-inf")
         if beta is not None:
             a_min = kwargs.get("alpha_min", minf)
@@ -438,7 +466,7 @@ class EccwPlot(EccwCompute):
             if sketch is True:
                 for alpha in alphas:
                     self.alpha = alpha
-                    self.add_sketch(**kwargs)
+                    sketches.append(self.add_sketch(**kwargs))
         elif alpha is not None:
             b_min = kwargs.get("beta_min", minf)
             b_max = kwargs.get("beta_max", pinf)
@@ -451,8 +479,8 @@ class EccwPlot(EccwCompute):
             if sketch is True:
                 for beta in betas:
                     self.beta = beta
-                    self.add_sketch(**kwargs)
-        plt.plot(betas, alphas, **settings)
+                    sketches.append(self.add_sketch(**kwargs))
+        return betas, alphas, [s for s in sketches if s is not None]
 
     def add_line(self, **kwargs):
         beta = kwargs.get("beta", None)
@@ -462,7 +490,6 @@ class EccwPlot(EccwCompute):
             "lw": 2.0,
             "c": (0.8, 0.8, 0.8, 1),
             "zorder": -10,
-            "figure": self.figure,
         }
         xmin, xmax = self.axe.get_xlim()
         ymin, ymax = self.axe.get_ylim()
@@ -471,172 +498,102 @@ class EccwPlot(EccwCompute):
             a_min = kwargs.get("alpha_min", minf)
             a_max = kwargs.get("alpha_max", pinf)
             if a_min == minf and a_max == pinf:
-                plt.axvline(beta, **setting)
+                self.axe.axvline(beta, **setting)
             elif a_min == minf:
                 x = (a_max - xmin) / (xmax - xmin) - 0.1
-                plt.axvline(beta, xmax=x, **setting)
-                plt.plot((beta, beta), (xmin, a_max), **setting)
+                self.axe.axvline(beta, xmax=x, **setting)
+                self.axe.plot((beta, beta), (xmin, a_max), **setting)
             elif a_max == pinf:
                 x = (a_min - xmin) / (xmax - xmin) + 0.1
-                plt.axvline(beta, xmin=x, **setting)
-                plt.plot((beta, beta), (a_min, xmax), **setting)
+                self.axe.axvline(beta, xmin=x, **setting)
+                self.axe.plot((beta, beta), (a_min, xmax), **setting)
             else:
-                plt.plot((beta, beta), (a_min, a_max), **setting)
+                self.axe.plot((beta, beta), (a_min, a_max), **setting)
         if alpha is not None:
             b_min = kwargs.get("beta_min", minf)
             b_max = kwargs.get("beta_max", pinf)
             if b_min == minf and b_max == pinf:
-                plt.axhline(alpha, **setting)
+                self.axe.axhline(alpha, **setting)
             elif b_min == minf:
                 x = (b_max - xmin) / (xmax - xmin) - 0.1
-                plt.axhline(alpha, xmax=x, **setting)
-                plt.plot((xmin, b_max), (alpha, alpha), **setting)
+                self.axe.axhline(alpha, xmax=x, **setting)
+                self.axe.plot((xmin, b_max), (alpha, alpha), **setting)
             elif b_max == pinf:
                 x = (b_min - xmin) / (xmax - xmin) + 0.1
-                plt.axhline(alpha, xmin=x, **setting)
-                plt.plot((b_min, xmax), (alpha, alpha), **setting)
+                self.axe.axhline(alpha, xmin=x, **setting)
+                self.axe.plot((b_min, xmax), (alpha, alpha), **setting)
             else:
-                plt.plot((b_min, b_max), (alpha, alpha), **setting)
+                self.axe.plot((b_min, b_max), (alpha, alpha), **setting)
 
     def add_sketch(self, **kwargs):
         """Draw section sketch at current value [beta, alpha].
         Draw also:
         * potential preferential fault network;
         * slip directions on fault network.
+
+        Return the AnnotationBbox of the sketch, None if there is no prism.
         """
+        self.remove(kwargs.get("id"))
+        ab = self._sketch(**kwargs)
+        self._register(kwargs.get("id"), "sketch", kwargs, [ab] if ab else [])
+        return ab
+
+    def update_sketch(self, id, blit=False, draw=True):
+        """Draw again the sketch of given id at current value [beta, alpha]."""
+        kwargs, artists = self._entry(id, "sketch")
+        animated = any(artist.get_animated() for artist in artists)
+        for artist in artists:
+            artist.remove()
+        ab = self._sketch(**kwargs)
+        artists[:] = [ab] if ab else []
+        for artist in artists:
+            artist.set_animated(animated)
+        if draw:
+            self._refresh(artists, blit)
+
+    def _sketch(self, **kwargs) -> "AnnotationBbox or None":
         self.sketch_size_factor = kwargs.get("sketch_size_factor", 1.0)
         # Renaming is cheapper than multiple access.
         alpha, beta = self._alpha, self._beta
         a_deg, b_deg = self.alpha, self.beta
-        padding = self._padding
-        # Surface of prism : arbitrary set, allows a cst looking.
+        if not alpha + beta > 0.0:
+            # alpha + beta <= 0. means there is no prism !
+            return None
+        # Identify wich part of critical enveloppe is concerned.
+        (alpha1,), (alpha2,) = self.compute_alpha(deg=False)
+        bottom = alpha <= alpha1 + (alpha2 - alpha1) / 2.0  # -> inverse faults
+        left = b_deg < (self._point_bottom if bottom else self._point_top)[0]
+        geometry = sketch.geometry(
+            alpha,
+            beta,
+            self._phiB,
+            self._sign,
+            bottom,
+            left,
+            self._density_ratio,
+            self._lambdaB,
+            self._sketch_size_factor,
+            self._padding,
+        )
+        self.drawing_aera = self._sketch_area(geometry)
         # Box distance from enveloppe.
         box_dist_from_curve = (self._point_top[1] - self._point_bottom[1]) / 10.0
-        try:
-            L = sqrt(
-                self._sketch_surface
-                / sin((alpha + beta) / 2.0)
-                * cos((alpha + beta) / 2.0)
-            )
-        except ZeroDivisionError:
-            # alpha + beta == 0. means there is no prism !
-            return
-        self._L = L
-        # Init sketching aera ans draw background of prism.
-        # Prism is a basal and a topo line, so discribed by 3 points.
-        if alpha < 0.0:
-            x1 = padding + 2.0 * L * sin((alpha + beta) / 2.0) * sin(
-                (beta - alpha) / 2.0
-            )
-            y1 = padding
-        elif beta < 0.0:
-            x1, y1 = padding, padding + L * sin(-beta)
-        else:
-            x1, y1 = padding + L * (1.0 - cos(beta)), padding
-        x2, y2 = x1 + L * cos(beta), y1 + L * sin(beta)
-        x3, y3 = x2 - L * cos(alpha), y2 + L * sin(alpha)
-        self._prism_tip = (x2, y2)
-        # Prism is also discribed by two lines.
-        # Slope of vectors [1-2] and [2-3]
-        self._a_basal, self._a_topo = tan(beta), -tan(alpha)
-        # Initial ordinates
-        self._b_basal = y2 - self._a_basal * x2
-        self._b_topo = y2 - self._a_topo * x2
-        self._sketch_box_width = x2 + padding
-        self._sketch_box_height = max(y3, y2) - min(y1, y2) + 2 * padding
-        # Content of annotationbox
-        self.drawing_aera = DrawingArea(
-            self._sketch_box_width, self._sketch_box_height, 0.0, 0.0
-        )
-        # Fill the prism
-        XY = [[x1, y1], [x2, y2]]
-        for angle in np.arange(alpha, -beta, -(alpha + beta) / 1.0e2):
-            XY.append([x2 - L * cos(angle), y2 + L * sin(angle)])
-        p = patches.Polygon(XY, edgecolor="none", facecolor="w")
-        self.drawing_aera.add_artist(p)
-        # Identify wich part of critical enveloppe is concerned.
         slope = abs(
             atan((self._point_center[1] - a_deg) / (self._point_center[0] - b_deg))
         )
-        dist_from_curve_b = box_dist_from_curve * cos(slope)
-        dist_from_curve_a = box_dist_from_curve * sin(slope)
-        (alpha1,), (alpha2,) = self.compute_alpha(deg=False)
-        a_mid = alpha1 + (alpha2 - alpha1) / 2.0
-        if alpha <= a_mid:  # bottom part -> inverse faults
-            if b_deg < self._point_bottom[0]:  # bottom left quadrant
-                quadrant, solution = "BL", "B"
-            else:  # bottom right quadrant
-                quadrant, solution = "BR", "A"
-        else:  # upper part -> normal faults
-            if b_deg < self._point_top[0]:  # Top left quadrant
-                quadrant, solution = "TL", "A"
-            else:  # Top right quadrant
-                quadrant, solution = "TR", "B"
-        if solution == "A":
-            g = self._get_gamma_A()
-            t = self._get_theta_A()
-        else:
-            g = self._get_gamma_B()
-            t = self._get_theta_B()
-        if quadrant == "TL":
-            box_alignment, xshift, yshift = (1.0, 0.0), -1.0, 1.0
-        elif quadrant == "TR":
-            box_alignment, xshift, yshift = (0.0, 0.0), 1.0, 1.0
-        elif quadrant == "BL":
-            box_alignment, xshift, yshift = (1.0, 1.0), -1.0, -1.0
-        elif quadrant == "BR":
-            box_alignment, xshift, yshift = (0.0, 1.0), 1.0, -1.0
-
-        # Fault network.
-        xgap = self._fault_gap * cos((beta - alpha) / 2.0)
-        ygap = self._fault_gap * sin((beta - alpha) / 2.0)
-        L_A, L_B, angle = L / 3.0, L * 2.0 / 3.0, alpha - (alpha + beta) / 2.0
-        # Gamma oriented faults
-        L_g = L_A if quadrant in ["TL", "BL"] else L_B
-        x_g, y_g = x2 - L_g * cos(angle), y2 + L_g * sin(angle)
-        xgap_g = xgap / sin(g - (beta - alpha) / 2.0)
-        ygap_g = ygap / sin(g - (beta - alpha) / 2.0)
-        a_g = tan(g)
-        self._draw_faults(a_g, x_g, y_g, xgap_g, ygap_g, -1, 1)
-        self._draw_faults(a_g, x_g, y_g, xgap_g, ygap_g, 0, -1)
-        # Theta oriented faults
-        L_t = L_B if quadrant in ["TL", "BL"] else L_A
-        x_t, y_t = x2 - L_t * cos(angle), y2 + L_t * sin(angle)
-        xgap_t = xgap / sin(t + (beta - alpha) / 2.0)
-        ygap_t = ygap / sin(t + (beta - alpha) / 2.0)
-        a_t = -tan(t)  # Fault slope theta
-        self._draw_faults(a_t, x_t, y_t, xgap_t, ygap_t, -1, 1)
-        self._draw_faults(a_t, x_t, y_t, xgap_t, ygap_t, 0, -1)
-
-        # Prism limits.
-        # Drawed above faults to mask faults tips.
-        p = lines.Line2D([x1, x2, x3], [y1, y2, y3], lw=2, color="gray")
-        self.drawing_aera.add_artist(p)
-
-        # Arrows.
-        # Gamma oriented inverse arrows.
-        self._draw_arrow(g, x_g, y_g, solution, gamma=True)
-        # Theta oriented inverse arrows.
-        self._draw_arrow(t, x_t, y_t, solution, gamma=False)
-        # arrows base
-        x, y = x1 + L * cos(beta) / 2.0, y1 + L * sin(beta) / 2.0
-        if self.context == "Compression":
-            solution = "B"
-        else:
-            solution = "A"
-        self._draw_arrow(beta, x, y, solution, gamma=True)
-
+        xshift = -1.0 if left else 1.0
+        yshift = -1.0 if bottom else 1.0
         # Set and display annotation box.
         ab = AnnotationBbox(
             self.drawing_aera,
             [b_deg, a_deg],
             xybox=(
-                b_deg + xshift * dist_from_curve_b,
-                a_deg + yshift * dist_from_curve_a,
+                b_deg + xshift * box_dist_from_curve * cos(slope),
+                a_deg + yshift * box_dist_from_curve * sin(slope),
             ),
             xycoords="data",
             boxcoords=("data", "data"),
-            box_alignment=box_alignment,
+            box_alignment=(float(left), float(bottom)),
             bboxprops=dict(boxstyle="round", fc=(0.9, 0.9, 0.9), ec="none"),
             arrowprops=dict(
                 arrowstyle="wedge,tail_width=2.",
@@ -647,6 +604,37 @@ class EccwPlot(EccwCompute):
             ),
         )
         self.axe.add_artist(ab).draggable()
+        return ab
+
+    def _sketch_area(self, geometry: sketch.SketchGeometry) -> DrawingArea:
+        """Render the geometry of one sketch (see sketch.geometry)."""
+        area = DrawingArea(*geometry.box, 0.0, 0.0)
+        # Fill the prism
+        area.add_artist(
+            patches.Polygon(geometry.prism, edgecolor="none", facecolor="w")
+        )
+        # Fault network.
+        area.add_artist(LineCollection(geometry.faults, linewidths=1, colors="gray"))
+        # Prism limits.
+        # Drawed above faults to mask faults tips.
+        area.add_artist(lines.Line2D(*geometry.limits.T, lw=2, color="gray"))
+        # Arrows.
+        size = sketch.scales(self._sketch_size_factor)
+        arrows = [
+            patches.FancyArrow(
+                *arrow,
+                lw=1,
+                head_width=size.arrow_head_width,
+                head_length=size.arrow_head_length,
+                fc="k",
+                ec="k",
+                shape="right" if right else "left",
+                length_includes_head=True,
+            )
+            for arrow, right in zip(geometry.arrows, geometry.right)
+        ]
+        area.add_artist(PatchCollection(arrows, match_original=True))
+        return area
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*
+
+"""
+Elements dedicated to decide in closed form if a solution may exist.
+
+These are necessary conditions, checked before any root solve: a parameter set
+rejected here has no physical solution, a parameter set accepted may still
+have none. Functions work with floats as well as with arrays broadcast
+together. Angles are in radians, phiD signed by context as in EccwCompute.
+"""
+
+import numpy as np
+from math import pi
+
+
+def params_domain(phiB, phiD, density_ratio, delta_lambdaB, delta_lambdaD):
+    """Vectorized counterpart of check_params: True where parameters are sane."""
+    return (
+        ~(abs(phiD) > phiB)
+        & (0.0 <= delta_lambdaD)
+        & (delta_lambdaD < 1 - density_ratio)
+        & (0.0 <= delta_lambdaB)
+        & (delta_lambdaB <= 1 - density_ratio)
+    )
+
+
+def alphamax(phiB, density_ratio, lambdaB):
+    """Maximum surface slope of the critical enveloppe."""
+    return np.arctan((1 - lambdaB) / (1 - density_ratio) * np.tan(phiB))
+
+
+def _meets_periodic(lo, hi, center, half):
+    """True where [lo, hi] meets one of the intervals [center ± half] + k.pi."""
+    k = np.ceil((lo - center - half) / pi)
+    return k * pi + center - half <= hi
+
+
+def feasible_alpha(beta, phiB, phiD, density_ratio, lambdaB, taper_min, numtol):
+    """Tell where a physical alpha may exist.
+
+    The taper alpha + beta is bounded by taper_min and pi/2 - phiD. Modulo pi,
+    alpha_prime lies in [-phiB, phiB] only if |alpha| <= alphamax, or if alpha
+    is steep enough for the fluid pressure ratio lambdaB_D2 to exceed 1.
+    """
+    lo = taper_min - beta
+    hi = pi / 2.0 - phiD + numtol - beta
+    margin = 1e-6  # Keeps roots found at the very bounds.
+    # Same as alphamax, but beyond pi/2 when phiB is (and so covering all).
+    amax = np.arctan2((1 - lambdaB) * np.sin(phiB), (1 - density_ratio) * np.cos(phiB))
+    # lambdaB_D2 >= 1 where cos(alpha)² <= ratio.
+    ratio = (lambdaB - density_ratio) / (1 - density_ratio)
+    steep = np.arcsin(np.sqrt(ratio))
+    return (lo < hi) & (
+        _meets_periodic(lo, hi, 0.0, amax + margin)
+        | ((ratio > 0.0) & _meets_periodic(lo, hi, pi / 2.0, steep + margin))
+    )
+
+
+def feasible_phiB(alpha, beta, phiD, taper_min, numtol):
+    """Tell where a physical phiB may exist: the taper must be valid."""
+    taper = alpha + beta
+    return (taper_min < taper) & (taper < pi / 2.0 - phiD + numtol)
+
+
+def feasible_phiD(alpha, beta, phiB, alpha_prime, sign, taper_min, numtol):
+    """Tell where a physical phiD may exist.
+
+    alpha_prime must lie in [-phiB, phiB], and the taper must be valid for some
+    phiD of the context, with |phiD| <= phiB.
+    """
+    taper = alpha + beta
+    taper_max = pi / 2.0 + phiB * (sign < 0) + numtol
+    return (abs(alpha_prime) <= phiB) & (taper_min < taper) & (taper < taper_max)
+
+
+def feasible(compute, variable: str) -> bool:
+    """Tell if 'variable' may have a physical solution.
+
+    'compute' is an EccwCompute instance holding the other parameters, and
+    'variable' is 'alpha', 'phiB' or 'phiD'.
+    """
+    c = compute
+    if variable == "alpha":
+        out = feasible_alpha(
+            c._beta,
+            c._phiB,
+            c._phiD,
+            c._density_ratio,
+            c._lambdaB,
+            c._taper_min,
+            c._numtol,
+        )
+    elif variable == "phiB":
+        out = feasible_phiB(c._alpha, c._beta, c._phiD, c._taper_min, c._numtol)
+    elif variable == "phiD":
+        out = feasible_phiD(
+            c._alpha,
+            c._beta,
+            c._phiB,
+            c._alpha_prime,
+            c._sign,
+            c._taper_min,
+            c._numtol,
+        )
+    else:
+        raise ValueError(
+            c._error_message("variable", "value", "'alpha', 'phiB' or 'phiD'")
+        )
+    return bool(out)
+
+
+def feasible_many(name: str, p: dict, sign: int, taper_min: float, numtol: float):
+    """Vectorized feasible, from a dict of parameters as given by _params_many."""
+    if name == "alpha":
+        return feasible_alpha(
+            p["beta"],
+            p["phiB"],
+            p["phiD"],
+            p["density_ratio"],
+            p["lambdaB"],
+            taper_min,
+            numtol,
+        )
+    if name == "phiB":
+        return feasible_phiB(p["alpha"], p["beta"], p["phiD"], taper_min, numtol)
+    ratio = p["density_ratio"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lambdaB_D2 = ratio + (p["lambdaB"] - ratio) / np.cos(p["alpha"]) ** 2.0
+        alpha_prime = np.arctan((1 - ratio) / (1 - lambdaB_D2) * np.tan(p["alpha"]))
+    return feasible_phiD(
+        p["alpha"], p["beta"], p["phiB"], alpha_prime, sign, taper_min, numtol
+    )
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*
+
+"""
+Elements dedicated to solve many sets of parameters on several processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import ceil
+from os import cpu_count
+
+from eccw.eccw_compute import BaseEccwCompute, EccwCompute, EccwState
+
+
+def _as_state(params) -> EccwState:
+    """Convert a set of parameters to an EccwState.
+
+    'params' is an EccwState, an instance of EccwCompute (or any subclass), or
+    a dict of named parameters as awaited by EccwCompute.
+    """
+    if isinstance(params, EccwState):
+        return params
+    if isinstance(params, BaseEccwCompute):
+        return params.state()
+    return EccwCompute(**params).state()
+
+
+def _compute(solve_for: str, state: EccwState) -> tuple:
+    """Solve 'solve_for' for one set of parameters, in a worker."""
+    return EccwCompute.from_state(state).compute(solve_for)
+
+
+def map_compute(params_iterable, solve_for: str, workers=None, chunksize=None):
+    """Solve 'solve_for' for each set of parameters of 'params_iterable'.
+
+    Sets of parameters are EccwState, EccwCompute instances or dicts of named
+    parameters (see _as_state). They are solved in 'workers' processes
+    (default is the number of CPUs), sent by chunks of 'chunksize' sets (default
+    spreads sets in 4 chunks per worker). With workers=1, sets are solved in
+    the current process.
+
+    Return the list of results of EccwCompute.compute(solve_for), in the order
+    of 'params_iterable'. The first error raised by a solve is raised again.
+    """
+    states = [_as_state(params) for params in params_iterable]
+    if solve_for not in EccwCompute._main_params_list:
+        raise ValueError(
+            f"map_compute() gets wrong value for 'solve_for': must be in "
+            f"{EccwCompute._main_params_list}"
+        )
+    workers = workers or cpu_count() or 1
+    if workers == 1 or len(states) < 2:
+        return [_compute(solve_for, state) for state in states]
+    if chunksize is None:
+        chunksize = max(1, ceil(len(states) / workers / 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(partial(_compute, solve_for), states, chunksize=chunksize)
+        )
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*
+
+"""
+Elements dedicated to render many figures to files on several processes.
+
+Figures are drawn by the Agg backend through the object oriented Figure API:
+no pyplot figure is opened, so nothing accumulates in pyplot's figure manager.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from eccw.eccw_explore import EccwExplore
+from eccw.eccw_plot import EccwPlot
+
+
+class RenderSpec(
+    namedtuple(
+        "RenderSpec",
+        ["path", "params", "calls", "kind", "figsize", "dpi"],
+        defaults=((), "plot", None, 100),
+    )
+):
+    """Specification of a figure to render in a file.
+
+    * path: file the figure is saved in, format given by its extension;
+    * params: dict of named parameters of the drawing instance;
+    * calls: sequence of (method name, dict of named arguments) called in turn
+      on the drawing instance, as ("add_curve", {}) or ("add_point",
+      dict(beta=10, sketch=True));
+    * kind: 'plot' draws with an EccwPlot (add_* methods), 'explore' with an
+      EccwExplore (draw_* methods, 'runtime_var' given as 'alpha', 'phiB' or
+      'phiD');
+    * figsize: size of figure in inches, default depends on kind;
+    * dpi: resolution of figure.
+    """
+
+    __slots__ = ()
+
+    _figsizes = {"plot": (8, 6), "explore": (10, 9)}
+    _prefixes = {"plot": "add_", "explore": "draw_"}
+
+    def check(self) -> "RenderSpec":
+        """Raise ValueError if kind or a called method is unknown, return self."""
+        if self.kind not in self._prefixes:
+            raise ValueError(
+                f"RenderSpec gets wrong value for 'kind': must be in "
+                f"{list(self._prefixes)}"
+            )
+        prefix = self._prefixes[self.kind]
+        for name, kwargs in self.calls:
+            if not name.startswith(prefix):
+                raise ValueError(
+                    f"RenderSpec of kind {self.kind!r} can only call {prefix}* "
+                    f"methods, not {name!r}"
+                )
+        return self
+
+
+def _as_spec(spec) -> RenderSpec:
+    if isinstance(spec, dict):
+        return RenderSpec(**spec)
+    return RenderSpec(*spec)
+
+
+def _new_figure(spec: RenderSpec) -> Figure:
+    figure = Figure(figsize=spec.figsize or spec._figsizes[spec.kind])
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _draw(spec: RenderSpec, figure: Figure) -> None:
+    """Draw the calls of spec in figure."""
+    if spec.kind == "plot":
+        foo = EccwPlot(figure=figure, **spec.params)
+        for name, kwargs in spec.calls:
+            getattr(foo, name)(**kwargs)
+        return
+    foo = EccwExplore(**spec.params)
+    for name, kwargs in spec.calls:
+        kwargs = dict(kwargs, figure=figure)
+        if isinstance(kwargs.get("runtime_var"), str):
+            kwargs["runtime_var"] = getattr(foo, "_runtime_" + kwargs["runtime_var"])
+        getattr(foo, name)(**kwargs)
+
+
+def render_one(spec: RenderSpec) -> str:
+    """Draw the figure of spec, save it and release it. Return its path."""
+    figure = _new_figure(spec)
+    try:
+        _draw(spec, figure)
+        figure.savefig(spec.path, dpi=spec.dpi)
+    finally:
+        figure.clear()
+    return spec.path
+
+
+def render(specs, workers=None) -> list:
+    """Render the figures of an iterable of RenderSpec (or dicts) in files.
+
+    Figures are rendered in 'workers' processes (default is the number of
+    CPUs), each one saved as soon as drawn, then released: a process holds
+    one figure at a time. With workers=1, figures are rendered in the current
+    process.
+
+    Return the list of paths, in the order of 'specs'. The first error raised
+    by a rendering is raised again.
+    """
+    specs = [_as_spec(spec).check() for spec in specs]
+    workers = workers or cpu_count() or 1
+    if workers == 1 or len(specs) < 2:
+        return [render_one(spec) for spec in specs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render_one, specs))
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*
+
+"""
+Elements dedicated to the geometry of section sketches of the wedge.
+
+Only numpy is used, so that geometries can be computed in any process and
+rendered elsewhere (see EccwPlot.add_sketch). Functions work with floats as well
+as with arrays broadcast together, one sketch per element. Angles are in
+radians, lengths in points of the sketch box, origin at its lower left corner.
+"""
+
+import numpy as np
+from collections import namedtuple
+from math import pi, nan
+
+
+_faults_max = 1000  # Maximum number of faults on each side of a family.
+_numtol = 1e-15  # Tolerance on sketch boxes, as BaseEccwCompute._numtol.
+
+Scales = namedtuple(
+    "Scales",
+    [
+        "surface",
+        "fault_gap",
+        "arrow_L",
+        "arrow_gap",
+        "arrow_head_width",
+        "arrow_head_length",
+    ],
+)
+
+
+def scales(size_factor: float = 1.0) -> Scales:
+    """Return sizes of sketch elements for a given size factor."""
+    # Surface of sketched prism: arbitrary set, allows a cst looking.
+    surface = 5000.0 * size_factor
+    fault_gap = surface / np.sqrt(surface) / 4.0
+    arrow_L = fault_gap * 2.0 / 3.0
+    return Scales(
+        surface, fault_gap, arrow_L, arrow_L / 2.0, arrow_L / 3.0, arrow_L / 2.0
+    )
+
+
+class SketchGeometry(
+    namedtuple(
+        "SketchGeometry",
+        ["box", "prism", "limits", "faults", "owners", "arrows", "right"],
+    )
+):
+    """Geometry of sketches, as returned by geometry.
+
+    For sketches of shape S:
+
+    * box: (S, 2) array of width and height of the sketch box;
+    * prism: (S, 103, 2) array of the polygon filling the prism;
+    * limits: (S, 3, 2) array of the points of the prism limits: base end,
+      tip and topo end;
+    * faults: (n, 2, 2) array of segments of fault networks of all sketches;
+    * owners: (n,) array of flat index in S of the sketch of each fault;
+    * arrows: (S, 6, 4) array of arrows of slip as (x, y, dx, dy), two on
+      gamma faults, two on theta faults and two along the base;
+    * right: (S, 6) boolean array, True for arrows with their half head on
+      the right (as FancyArrow's shape), else on the left.
+    """
+
+    __slots__ = ()
+
+    @property
+    def shape(self) -> tuple:
+        return self.box.shape[:-1]
+
+    def take(self, index: int) -> "SketchGeometry":
+        """Return the geometry of the sketch of given flat index."""
+        shape = self.shape
+        box, prism, limits, arrows, right = (
+            np.reshape(a, (-1,) + a.shape[len(shape) :])[index]
+            for a in (self.box, self.prism, self.limits, self.arrows, self.right)
+        )
+        mine = self.owners == index
+        owners = np.zeros(np.count_nonzero(mine), dtype=int)
+        return SketchGeometry(
+            box, prism, limits, self.faults[mine], owners, arrows, right
+        )
+
+
+def _convert_alpha(alpha, density_ratio, lambdaB):
+    """Vectorized EccwCompute._convert_alpha, from lambdaB as Yuan, 2015."""
+    lambdaB_D2 = density_ratio + (lambdaB - density_ratio) / np.cos(alpha) ** 2.0
+    return np.arctan((1 - density_ratio) / (1 - lambdaB_D2) * np.tan(alpha))
+
+
+def fault_angles(alpha, phiB, alpha_prime, solution_A) -> tuple:
+    """Return angles (gamma, theta) of the two fault networks.
+
+    solution_A selects the solution A or B of the orientations of faults.
+    """
+    asin = np.arcsin(np.sin(alpha_prime) / np.sin(phiB))
+    gamma_A = (pi / 2.0 + phiB - 2.0 * alpha + alpha_prime + asin) / 2.0
+    theta_A = (pi / 2.0 + phiB + 2.0 * alpha - alpha_prime - asin) / 2.0
+    gamma_B = (pi / 2.0 - phiB - 2.0 * alpha + alpha_prime - asin) / 2.0
+    theta_B = (pi / 2.0 - phiB + 2.0 * alpha - alpha_prime + asin) / 2.0
+    return (
+        np.where(solution_A, gamma_A, gamma_B),
+        np.where(solution_A, theta_A, theta_B),
+    )
+
+
+def _slip_arrows(angle, x, y, solution_B, gamma: bool, arrow_L, arrow_gap) -> tuple:
+    """Return the two arrows of slip on a fault at (x, y), and their shape.
+
+    Arrows are a (..., 2, 4) array of (x, y, dx, dy), shapes a (..., 2)
+    boolean array, True for half heads on the right.
+    """
+    xL, yL = arrow_L * np.cos(angle), arrow_L * np.sin(angle)
+    dum_l = np.sqrt(arrow_gap ** 2.0 + arrow_L ** 2.0) / 2.0
+    dum_angle = np.arctan(arrow_gap / arrow_L)
+    shift = np.where(solution_B, angle - dum_angle, angle + dum_angle)
+    dx, dy = dum_l * np.cos(shift), dum_l * np.sin(shift)
+    right = solution_B == gamma
+    if gamma:
+        p1 = (x - dx, y - dy, xL, yL)
+        p2 = (x + dx, y + dy, -xL, -yL)
+    else:
+        p1 = (x - dx, y + dy, xL, -yL)
+        p2 = (x + dx, y - dy, -xL, yL)
+    arrows = np.stack(np.broadcast_arrays(*p1, *p2), axis=-1)
+    shape = arrows.shape[:-1] + (2, 4)
+    right = np.broadcast_to(right, arrows.shape[:-1])
+    return arrows.reshape(shape), np.stack((right, right), axis=-1)
+
+
+def _fault_segments(tip, basal, topo, L, box, padding, a_f, x_f, y_f, gap_f):
+    """Return segments of fault families within sketch boxes, and their mask.
+
+    A family is given by the slope a_f of faults, a point (x_f, y_f) of one of
+    them and the gap (xgap_f, ygap_f) to the next one. Faults are kept on both
+    sides of the given one while they meet the prism limits at two points in
+    the sketch box. Families are stacked on the last axis of a_f, x_f, y_f and
+    gap_f, the other arguments being for each sketch.
+
+    Return a (..., 2, 2N+1, 2, 2) array of segments, and the boolean mask of
+    the ones kept.
+    """
+    (xt, yt), (a_basal, b_basal), (a_topo, b_topo) = tip, basal, topo
+    width, height = box[..., 0], box[..., 1]
+    xgap_f, ygap_f = gap_f
+    # Enough faults to cross the boxes given their spacing, but flat prisms.
+    with np.errstate(invalid="ignore"):
+        spacing = abs(ygap_f - a_f * xgap_f) / np.sqrt(1.0 + a_f ** 2.0)
+        N = np.nanmax(np.hypot(width, height)[..., None] / spacing, initial=0.0)
+    N = int(np.ceil(min(N, _faults_max))) + 1
+    i = np.arange(-N, N + 1)
+    a_f, x_f, y_f, xgap_f, ygap_f = (
+        np.asarray(v)[..., None] for v in (a_f, x_f, y_f, xgap_f, ygap_f)
+    )
+    b_f = (y_f - i * ygap_f) - a_f * (x_f - i * xgap_f)
+    a_f, b_f = a_f[..., None], b_f[..., None]
+    xt, yt, a_basal, b_basal, a_topo, b_topo, L, width, height = (
+        np.asarray(v)[..., None, None, None]
+        for v in (xt, yt, a_basal, b_basal, a_topo, b_topo, L, width, height)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Fault intersections with base and topo.
+        x_base = (b_basal - b_f) / (a_f - a_basal)
+        x_topo = (b_topo - b_f) / (a_f - a_topo)
+        # Fault intersections with rear arc.
+        A = 1 + a_f ** 2.0
+        B = 2.0 * (a_f * (b_f - yt) - xt)
+        C = xt ** 2.0 + (b_f - yt) ** 2.0 - L ** 2.0
+        sqrt_D = np.sqrt(B ** 2.0 - 4 * A * C)
+        X = np.concatenate(
+            (x_base, x_topo, (-B - sqrt_D) / 2.0 / A, (-B + sqrt_D) / 2.0 / A),
+            axis=-1,
+        )
+        Y = a_f * X + b_f
+        low, high = padding - _numtol, padding + _numtol
+        inside = (low <= X) & (X <= width - high)
+        inside &= (low <= Y) & (Y <= height - high)
+    # Walking away from the given fault, stop at the first one out of box.
+    valid = inside.sum(axis=-1) >= 2
+    up = np.logical_and.accumulate(valid[..., N:], axis=-1)
+    down = np.logical_and.accumulate(valid[..., N - 1 :: -1], axis=-1)
+    keep = np.concatenate((down[..., ::-1], up), axis=-1)
+    # Intersections are aligned: a fault goes from the first to the last.
+    x0 = np.where(inside, X, np.inf).min(axis=-1, keepdims=True)
+    x1 = np.where(inside, X, -np.inf).max(axis=-1, keepdims=True)
+    x = np.concatenate((x0, x1), axis=-1)
+    return np.stack((x, a_f * x + b_f), axis=-1), keep
+
+
+def geometry(
+    alpha,
+    beta,
+    phiB,
+    sign,
+    bottom,
+    left,
+    density_ratio=0.0,
+    lambdaB=0.0,
+    size_factor: float = 1.0,
+    padding: float = 10.0,
+) -> SketchGeometry:
+    """Return the geometry of section sketches at (beta, alpha).
+
+    sign is +1 in compression and -1 in extension, density_ratio and lambdaB
+    parametrize fluids as in EccwCompute. 'bottom' and 'left' locate sketches
+    on the critical enveloppe, and so select the solution of orientations of
+    faults: 'bottom' where alpha is the lower (inverse faults) solution,
+    'left' where beta is lower than the one of the lowest point (if 'bottom')
+    or highest point (if not) of the enveloppe.
+
+    Geometry is NaN where there is no prism (alpha + beta <= 0).
+    """
+    arrays = np.broadcast_arrays(
+        alpha, beta, phiB, sign, bottom, left, density_ratio, lambdaB
+    )
+    alpha, beta, phiB, sign, bottom, left, density_ratio, lambdaB = arrays
+    size = scales(size_factor)
+    taper = (alpha + beta) / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        L = np.sqrt(size.surface / np.sin(taper) * np.cos(taper))
+    L = np.where(taper > 0.0, L, nan)
+    # Prism is a basal and a topo line, so discribed by 3 points.
+    x1 = np.where(
+        alpha < 0.0,
+        padding + 2.0 * L * np.sin(taper) * np.sin((beta - alpha) / 2.0),
+        np.where(beta < 0.0, padding, padding + L * (1.0 - np.cos(beta))),
+    )
+    y1 = np.where((alpha >= 0.0) & (beta < 0.0), padding + L * np.sin(-beta), padding)
+    x2, y2 = x1 + L * np.cos(beta), y1 + L * np.sin(beta)
+    x3, y3 = x2 - L * np.cos(alpha), y2 + L * np.sin(alpha)
+    box = np.stack(
+        (x2 + padding, np.maximum(y3, y2) - np.minimum(y1, y2) + 2 * padding), -1
+    )
+    limits = np.stack((np.stack((x1, x2, x3), -1), np.stack((y1, y2, y3), -1)), -1)
+    # Prism filled up to its rear arc, end included.
+    step = -(alpha + beta) / 1.0e2
+    angles = alpha[..., None] + np.arange(101) * step[..., None]
+    arc = np.stack(
+        (
+            x2[..., None] - L[..., None] * np.cos(angles),
+            y2[..., None] + L[..., None] * np.sin(angles),
+        ),
+        axis=-1,
+    )
+    prism = np.concatenate((limits[..., :2, :], arc), axis=-2)
+
+    # Fault network.
+    solution_A = bottom != left
+    alpha_prime = _convert_alpha(alpha, density_ratio, lambdaB)
+    g, t = fault_angles(alpha, phiB, alpha_prime, solution_A)
+    xgap = size.fault_gap * np.cos((beta - alpha) / 2.0)
+    ygap = size.fault_gap * np.sin((beta - alpha) / 2.0)
+    L_A, L_B, angle = L / 3.0, L * 2.0 / 3.0, alpha - taper
+    # Gamma oriented faults
+    L_g = np.where(left, L_A, L_B)
+    x_g, y_g = x2 - L_g * np.cos(angle), y2 + L_g * np.sin(angle)
+    xgap_g = xgap / np.sin(g - (beta - alpha) / 2.0)
+    ygap_g = ygap / np.sin(g - (beta - alpha) / 2.0)
+    # Theta oriented faults
+    L_t = np.where(left, L_B, L_A)
+    x_t, y_t = x2 - L_t * np.cos(angle), y2 + L_t * np.sin(angle)
+    xgap_t = xgap / np.sin(t + (beta - alpha) / 2.0)
+    ygap_t = ygap / np.sin(t + (beta - alpha) / 2.0)
+    # Slopes and initial ordinates of basal and topo lines.
+    a_basal, a_topo = np.tan(beta), -np.tan(alpha)
+    segments, keep = _fault_segments(
+        (x2, y2),
+        (a_basal, y2 - a_basal * x2),
+        (a_topo, y2 - a_topo * x2),
+        L,
+        box,
+        padding,
+        np.stack((np.tan(g), -np.tan(t)), axis=-1),
+        np.stack((x_g, x_t), axis=-1),
+        np.stack((y_g, y_t), axis=-1),
+        (np.stack((xgap_g, xgap_t), axis=-1), np.stack((ygap_g, ygap_t), axis=-1)),
+    )
+    keep = keep.reshape(-1, keep.shape[-2] * keep.shape[-1])
+    owners = np.nonzero(keep)[0]
+    faults = segments.reshape(keep.shape + (2, 2))[keep]
+
+    # Arrows along gamma faults, theta faults and base.
+    x, y = x1 + L * np.cos(beta) / 2.0, y1 + L * np.sin(beta) / 2.0
+    arrows, right = zip(
+        _slip_arrows(g, x_g, y_g, ~solution_A, True, size.arrow_L, size.arrow_gap),
+        _slip_arrows(t, x_t, y_t, ~solution_A, False, size.arrow_L, size.arrow_gap),
+        _slip_arrows(beta, x, y, sign > 0, True, size.arrow_L, size.arrow_gap),
+    )
+    arrows = np.concatenate(arrows, axis=-2)
+    return SketchGeometry(
+        box, prism, limits, faults, owners, arrows, np.concatenate(right, axis=-1)
+    )
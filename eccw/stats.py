@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*
+
+"""
+Elements dedicated to gather statistics about solves.
+"""
+
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+
+
+class SolveStats(
+    namedtuple(
+        "SolveStats",
+        [
+            "variable",
+            "state",
+            "seed",
+            "iterations",
+            "residual_evaluations",
+            "jacobian_evaluations",
+            "residual",
+            "time",
+            "reason",
+        ],
+    )
+):
+    """Statistics of one solve of EccwCompute.
+
+    * variable: name of the solved parameter, 'alpha', 'phiB' or 'phiD';
+    * state: EccwState of the parameters of the solve;
+    * seed: initial values (variable, psiD, psi0) [rad];
+    * iterations: number of iterations;
+    * residual_evaluations, jacobian_evaluations: number of evaluations of the
+      function to root and of its Jacobian;
+    * residual: max norm of the function to root at the last iterate;
+    * time: wall time [s];
+    * reason: None if converged, else the cause of the failure.
+    """
+
+    __slots__ = ()
+
+    @property
+    def converged(self) -> bool:
+        return self.reason is None
+
+
+class StatsCollector(object):
+    """Gather SolveStats of all the solves made while it is collecting.
+
+    See collect_stats.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def add(self, stats: SolveStats) -> None:
+        self.records.append(stats)
+
+    def failures(self) -> list:
+        """Return the SolveStats of the solves which did not converge."""
+        return [r for r in self.records if r.reason is not None]
+
+    def summary(self) -> dict:
+        """Return aggregated statistics of the gathered solves."""
+        records = self.records
+        iterations = [r.iterations for r in records]
+        return {
+            "solves": len(records),
+            "failures": sum(r.reason is not None for r in records),
+            "reasons": Counter(r.reason for r in records if r.reason),
+            "iterations": sum(iterations),
+            "max_iterations": max(iterations, default=0),
+            "residual_evaluations": sum(r.residual_evaluations for r in records),
+            "jacobian_evaluations": sum(r.jacobian_evaluations for r in records),
+            "time": sum(r.time for r in records),
+        }
+
+
+_collector = None  # Process-wide StatsCollector, None when disabled.
+
+
+@contextmanager
+def collect_stats():
+    """Gather statistics of all solves of the process within a with statement.
+
+    ::
+
+        >>> with collect_stats() as stats:
+        ...     foo.compute("phiD")
+        >>> stats.summary()
+
+    Nested collections are independent: the outer one resumes on exit of the
+    inner one.
+    """
+    global _collector
+    outer, _collector = _collector, StatsCollector()
+    try:
+        yield _collector
+    finally:
+        _collector = outer
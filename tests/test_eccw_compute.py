@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 # -*-coding:utf-8 -*
 
+import pickle
+import subprocess
+import sys
 import unittest
 
-from eccw import EccwCompute
+import numpy as np
+
+from eccw import ConvergenceError, EccwCompute
+from eccw.parallel import map_compute
+from eccw.stats import collect_stats
 
 
 class TestEccwCompute(unittest.TestCase):
@@ -90,5 +97,508 @@ class TestEccwCompute(unittest.TestCase):
     #     self.assertAlmostEqual(phiD1, 29.6651, places=3)
     #     self.assertAlmostEqual(phiD2, 10.0, places=3)
 
+
+class TestComputeBetaMany(unittest.TestCase):
+
+    def _assert_same_as_scalar(self, foo, alphas):
+        branches = foo.compute_beta_many(alpha=alphas)
+        for i, alpha in enumerate(alphas):
+            foo.alpha = alpha
+            inverse, normal = foo.compute_beta()
+            many_inverse = branches.inverse[:, i]
+            many_normal = branches.normal[:, i]
+            np.testing.assert_allclose(
+                sorted(inverse), sorted(many_inverse[~np.isnan(many_inverse)]))
+            np.testing.assert_allclose(
+                sorted(normal), sorted(many_normal[~np.isnan(many_normal)]))
+
+    def test_compression(self):
+        foo = EccwCompute(phiB=30, phiD=10, context="c")
+        self._assert_same_as_scalar(foo, np.linspace(-29, 29, 59))
+
+    def test_extension_fluids(self):
+        foo = EccwCompute(phiB=30, phiD=10, context="e",
+                          rho_f=1000, rho_sr=3500,
+                          delta_lambdaB=0.5, delta_lambdaD=0.3)
+        self._assert_same_as_scalar(foo, np.linspace(-9, 9, 37))
+
+    def test_broadcast(self):
+        foo = EccwCompute(phiB=30, phiD=10, context="c")
+        branches = foo.compute_beta_many(alpha=[[-20], [20]], phiD=[5, 10, 40])
+        self.assertEqual(branches.dl.shape, (2, 3))
+        self.assertEqual(branches.valid.shape, (4, 2, 3))
+        # phiD > phiB is masked instead of raised.
+        self.assertFalse(branches.valid[:, :, 2].any())
+        self.assertAlmostEqual(branches.ul[1, 1], -3.5809, places=3)
+        self.assertAlmostEqual(branches.ur[1, 1], 43.2589, places=3)
+
+
+class TestComputeMany(unittest.TestCase):
+
+    def _assert_same_as_scalar(self, foo, flag, **kwargs):
+        inverse, normal = getattr(foo, "compute_%s_many" % flag)(**kwargs)
+        n = len(next(iter(kwargs.values())))
+        for i in range(n):
+            foo.set_params(**{key: value[i] for key, value in kwargs.items()})
+            for expected, result in zip(foo.compute(flag), (inverse[i], normal[i])):
+                np.testing.assert_allclose(
+                    expected, result[~np.isnan(result)], atol=1e-6)
+
+    def test_alpha(self):
+        foo = EccwCompute(phiB=30, phiD=10, context="c")
+        self._assert_same_as_scalar(
+            foo, "alpha", beta=[-5, 0, 10, 20], phiD=[10, 10, 5, 25])
+
+    def test_phiB(self):
+        foo = EccwCompute(phiD=10, context="c")
+        self._assert_same_as_scalar(
+            foo, "phiB", alpha=[3.43653, 11.6], beta=[0, -1.5], phiD=[10, 24.84])
+
+    def test_phiD(self):
+        foo = EccwCompute(phiB=30, context="c")
+        self._assert_same_as_scalar(
+            foo, "phiD", alpha=[3.43653, 11.6, -20.13, 21.86],
+            beta=[0, -1.5, 80.84, 2.58])
+
+    def test_current_value_of_solved_parameter_is_ignored(self):
+        # phiB=30 < phiD and phiD=20 > phiB would not be sane parameters.
+        foo = EccwCompute(phiB=30, phiD=30.13, context="c")
+        inverse, normal = foo.compute_phiB_many(alpha=[21.78], beta=[0.923])
+        self.assertTrue(np.isnan(inverse).all())
+        self.assertAlmostEqual(normal[0, 0], 30.6865, places=3)
+        foo = EccwCompute(phiB=8, phiD=20, context="c")
+        inverse, normal = foo.compute_phiD_many(alpha=[5], beta=[3])
+        self.assertAlmostEqual(inverse[0, 0], 6.6592, places=3)
+        self.assertAlmostEqual(normal[0, 0], 3.3046, places=3)
+
+    def test_shape_and_off_domain(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=-20, context="c")
+        inverse, normal = foo.compute_phiD_many(alpha=[[31, 3.43653]], beta=0)
+        self.assertEqual(inverse.shape, (1, 2, 2))
+        self.assertTrue(np.isnan(inverse[0, 0]).all())
+        self.assertTrue(np.isnan(normal[0, 0]).all())
+        self.assertAlmostEqual(inverse[0, 1, 0], 10.000, places=3)
+        self.assertAlmostEqual(normal[0, 1, 0], 1.1495, places=3)
+        with self.assertRaises(TypeError):
+            foo.compute_alpha_many(alpha=10)
+
+
+class TestJacobian(unittest.TestCase):
+
+    def test_against_finite_differences(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=3, alpha=5, context="c",
+                          rho_f=1000, rho_sr=3000,
+                          delta_lambdaB=0.3, delta_lambdaD=0.2)
+        X = np.array([0.3, 0.4, -0.2])
+        for runtime_var in (foo._runtime_alpha, foo._runtime_phiB,
+                            foo._runtime_phiD):
+            F = foo._function_to_root(X, runtime_var)
+            M = np.stack([
+                (foo._function_to_root(X + foo._h * dX, runtime_var) - F) / foo._h
+                for dX in np.eye(3)
+            ], axis=-1)
+            np.testing.assert_allclose(foo._jacobian(X, runtime_var), M, atol=1e-4)
+
+    def test_damped_fallback(self):
+        # Full Newton steps wander away from these roots.
+        foo = EccwCompute(phiB=10.229, phiD=5.444, alpha=10.888, beta=16.661,
+                          context="c")
+        inverse, (phiB,) = foo.compute_phiB()
+        self.assertEqual(inverse, ())
+        self.assertAlmostEqual(phiB, 11.0861, places=3)
+        foo = EccwCompute(phiB=6.18, phiD=0.24, alpha=2.05, beta=6.33,
+                          context="e")
+        inverse, (phiB,) = foo.compute_phiB()
+        self.assertEqual(inverse, ())
+        self.assertAlmostEqual(phiB, 9.1747, places=3)
+
+    def test_damped_fallback_many(self):
+        foo = EccwCompute(context="c")
+        inverse, normal = foo.compute_phiB_many(
+            alpha=[10.888, 21.86], beta=[16.661, 2.58], phiD=[5.444, 10])
+        self.assertTrue(np.isnan(inverse).all())
+        np.testing.assert_allclose(normal[:, 0], [11.0861, 25.1640], atol=1e-3)
+
+    def test_phiB_aliases(self):
+        # Newton's method reaches pi - phiB, or no solution, from the seeds.
+        fluids = dict(rho_f=1000, rho_sr=2500, delta_lambdaB=0.0554,
+                      delta_lambdaD=0.2703)
+        foo = EccwCompute(phiB=11.2476, alpha=8.29597, beta=0.84603,
+                          phiD=1.0438, context="c", **fluids)
+        (), (phiB,) = foo.compute_phiB()
+        self.assertAlmostEqual(phiB, 60.7347, places=2)
+        foo = EccwCompute(phiB=23.1456, alpha=14.18345, beta=-4.15235,
+                          phiD=13.71543, context="c")
+        self.assertEqual(len(foo.compute_phiB()[1]), 1)
+        self.assertAlmostEqual(foo.compute_phiB()[1][0], 14.22544, places=4)
+        foo = EccwCompute(context="c", **fluids)
+        inverse, normal = foo.compute_phiB_many(
+            alpha=[8.29597, 14.18345], beta=[0.84603, -4.15235],
+            phiD=[1.0438, 13.71543], rho_f=[1000, 0], delta_lambdaB=[0.0554, 0],
+            delta_lambdaD=[0.2703, 0])
+        self.assertTrue(np.isnan(inverse).all())
+        self.assertTrue(np.isnan(normal[:, 1]).all())
+        np.testing.assert_allclose(normal[:, 0], [60.7347, 14.22544], atol=3e-3)
+
+    def test_many(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=3, alpha=5, context="e")
+        X = np.array([[0.3, 0.4, -0.2], [-0.1, 1.2, 0.7]])
+        names = set(foo._many_params_list)
+        p = {k: np.ravel(v) for k, v in foo._params_many(names).items()}
+        for name in ("alpha", "phiB", "phiD"):
+            runtime_var = getattr(foo, "_runtime_" + name)
+            M = foo._jacobian_many(X, name, p)
+            for i in range(len(X)):
+                np.testing.assert_allclose(M[i], foo._jacobian(X[i], runtime_var))
+
+    def test_scalar_kernels(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=3, alpha=5, context="e",
+                          rho_f=1000, rho_sr=3000,
+                          delta_lambdaB=0.3, delta_lambdaD=0.2)
+        X = np.array([0.3, 0.4, -0.2])
+        for runtime_var in (foo._runtime_alpha, foo._runtime_phiB,
+                            foo._runtime_phiD):
+            out = foo._kernel(runtime_var)(*X)
+            np.testing.assert_allclose(
+                out[:3], foo._function_to_root(X, runtime_var), atol=1e-15)
+            np.testing.assert_allclose(
+                np.reshape(out[3:], (3, 3)), foo._jacobian(X, runtime_var),
+                atol=1e-14)
+
+
+class TestComputeAlphaBrent(unittest.TestCase):
+
+    def test_compression(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        (a1,), (a2,) = foo.compute_alpha(method="brent")
+        self.assertAlmostEqual(a1, 3.4365, places=3)
+        self.assertAlmostEqual(a2, 23.9463, places=3)
+        branches = foo.compute_alpha_branches()
+        self.assertEqual([b for _, b in branches], ["dl", "ul"])
+
+    def test_compression_fluids(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c",
+                          rho_f=1000, rho_sr=3500,
+                          delta_lambdaB=0.5, delta_lambdaD=0.3)
+        (a1,), (a2,) = foo.compute_alpha(method="brent")
+        self.assertAlmostEqual(a1, 3.8353, places=3)
+        self.assertAlmostEqual(a2, 6.7608, places=3)
+
+    def test_against_newton(self):
+        for context in ("c", "e"):
+            for beta in (-10, 0, 10, 30):
+                foo = EccwCompute(phiB=35, phiD=20, beta=beta, context=context)
+                newton = foo.compute_alpha()
+                brent = foo.compute_alpha(method="brent")
+                for x, y in zip(newton, brent):
+                    for value in x:
+                        self.assertTrue(any(abs(value - v) < 1e-6 for v in y))
+
+    def test_unknown_method(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        with self.assertRaises(ValueError):
+            foo.compute_alpha(method="foo")
+
+
+class TestCategorize(unittest.TestCase):
+
+    def test_against_compute_beta(self):
+        for context in ("c", "e"):
+            foo = EccwCompute(phiB=35, phiD=20, beta=5, alpha=0, context=context)
+            inverse, normal = foo.compute_alpha()
+            for category, alphas in enumerate((inverse, normal)):
+                for alpha in alphas:
+                    foo.alpha = alpha
+                    betas = foo.compute_beta()[category]
+                    self.assertTrue(any(abs(b - foo.beta) < 1e-6 for b in betas))
+                foo.alpha = 0
+
+    def test_phiD_sign(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, alpha=3, context="e")
+        self.assertEqual(foo._categorize((0.1, 0.0, 0.0), foo._runtime_phiD),
+                         (False, False))
+
+
+class TestCache(unittest.TestCase):
+
+    def test_disabled(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        foo.compute_alpha()
+        self.assertEqual(foo.cache_info(), (0, 0, 0, 0))
+
+    def test_hits_and_misses(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, alpha=3, context="c")
+        foo.enable_cache(maxsize=2)
+        ref = foo.compute_alpha()
+        foo.alpha = 5  # Not an input of compute_alpha.
+        foo.phiD = 10.0
+        self.assertEqual(foo.compute("alpha"), ref)
+        self.assertEqual(foo.cache_info(), (1, 1, 2, 1))
+        foo.compute_alpha(deg=False)
+        foo.compute_beta()
+        self.assertEqual(foo.cache_info(), (1, 3, 2, 2))
+        foo.compute_alpha()  # Evicted.
+        self.assertEqual(foo.cache_info().misses, 4)
+        foo.cache_clear()
+        self.assertEqual(foo.cache_info(), (0, 0, 2, 0))
+
+    def test_solved_parameter(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, alpha=3.43653, context="c")
+        foo.enable_cache()
+        ref = foo.compute_phiB()
+        foo.phiB = 35  # Not an input of compute_phiB.
+        self.assertEqual(foo.compute_phiB(), ref)
+        branches = foo.compute_alpha_branches()
+        foo.alpha = 5
+        self.assertEqual(foo.compute_alpha_branches(), branches)
+        self.assertEqual(foo.cache_info()[:2], (2, 2))
+
+
+class TestSweep(unittest.TestCase):
+
+    def test_against_compute(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, alpha=3, context="c")
+        betas = np.arange(-10, 40, 0.5)
+        for beta, result in zip(betas, foo.sweep("beta", betas)):
+            bar = EccwCompute(phiB=30, phiD=10, beta=beta, context="c")
+            for x, y in zip(bar.compute_alpha(), result):
+                for value in x:
+                    self.assertTrue(any(abs(value - v) < 1e-6 for v in y))
+        self.assertEqual(foo.beta, 0)
+
+    def test_restore_on_close(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, alpha=3, context="c")
+        sweep = foo.sweep("alpha", [1, 2, 3, 4], solve_for="phiD")
+        next(sweep)
+        self.assertAlmostEqual(foo.alpha, 1)
+        sweep.close()
+        self.assertAlmostEqual(foo.alpha, 3)
+
+    def test_wrong_names(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        with self.assertRaises(ValueError):
+            next(foo.sweep("alpha", [1], solve_for="alpha"))
+        with self.assertRaises(ValueError):
+            next(foo.sweep("context", ["e"]))
+
+
+class TestState(unittest.TestCase):
+
+    def test_pickle(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=3, context="e", rho_f=1000,
+                          rho_sr=3000, delta_lambdaB=0.3, delta_lambdaD=0.1)
+        bar = pickle.loads(pickle.dumps(foo))
+        self.assertEqual(bar.state()[2:], foo.state()[2:])
+        self.assertEqual(bar.context, "Extension")
+        self.assertEqual(bar.compute_alpha(), foo.compute_alpha())
+
+    def test_map_compute(self):
+        params = [dict(phiB=30, phiD=10, beta=beta, context="c")
+                  for beta in range(-10, 40, 5)]
+        results = map_compute(params, "alpha", workers=2)
+        self.assertEqual(
+            results, [EccwCompute(**kw).compute_alpha() for kw in params])
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_compute_only(self):
+        code = ("import sys; from eccw import EccwCompute; "
+                "print(sorted({'matplotlib', 'setuptools', 'pkg_resources'}"
+                " & set(sys.modules)))")
+        out = subprocess.run([sys.executable, "-c", code], check=True,
+                             stdout=subprocess.PIPE, universal_newlines=True)
+        self.assertEqual(out.stdout.strip(), "[]")
+
+
+class TestStats(unittest.TestCase):
+
+    def test_last_stats(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        foo.compute_alpha()
+        stats = foo.last_stats
+        self.assertEqual(stats.variable, "alpha")
+        self.assertEqual(stats.state[2:], foo.state()[2:])
+        self.assertTrue(stats.converged)
+        self.assertLess(stats.residual, foo._numtol)
+        self.assertEqual(stats.residual_evaluations, stats.iterations + 1)
+
+    def test_collect(self):
+        foo = EccwCompute(phiB=30, phiD=20, beta=10, alpha=-9, context="e")
+        foo.compute_alpha()
+        with collect_stats() as stats:
+            foo.compute_alpha()
+            with self.assertRaises(RuntimeError):
+                foo.compute_phiB()
+        foo.compute_alpha()
+        summary = stats.summary()
+        self.assertEqual(summary["solves"], 3)
+        self.assertEqual(summary["failures"], 1)
+        self.assertEqual(stats.failures()[0].reason, "stagnation")
+        self.assertEqual(stats.failures()[0].variable, "phiB")
+
+    def test_damped_fallback(self):
+        foo = EccwCompute(phiB=10.229, phiD=5.444, alpha=10.888, beta=16.661,
+                          context="c")
+        seed = foo._seeds("phiB", foo._alpha, foo._beta, foo._phiD)[0]
+        with self.assertRaises(ConvergenceError):
+            foo._solve_Newton_kernel(seed, foo._runtime_phiB)
+        newton = foo._solve_counts
+        foo._solve_Newton_damped(seed, foo._runtime_phiB)
+        damped = foo._solve_counts
+        foo._solve(seed, foo._runtime_phiB)
+        stats = foo.last_stats
+        self.assertEqual(
+            (stats.iterations, stats.residual_evaluations,
+             stats.jacobian_evaluations, stats.residual),
+            tuple(a + b for a, b in zip(newton[:3], damped[:3])) + damped[3:])
+
+    def test_collected_state(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        with collect_stats() as stats:
+            foo.compute_alpha()
+            state = foo.state()
+        foo.beta = 10
+        self.assertEqual(list(stats)[-1].state, state)
+        self.assertEqual(foo.last_stats.state, foo.state())
+
+
+class TestTrajectory(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        foo.compute_alpha()
+        self.assertIsNone(foo.path)
+        self.assertIsNone(foo.iter_conv)
+
+    def test_full_trace(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        foo.enable_trajectory()
+        foo._solve((0.0, 0.0, 0.0), foo._runtime_alpha)
+        self.assertEqual(foo.iter_conv, foo.last_stats.iterations)
+        self.assertEqual(len(foo.path), foo.iter_conv + 1)
+        self.assertEqual(foo.path[0], (0.0, 0.0, 0.0))
+
+    def test_ring_buffer(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, context="c")
+        foo.enable_trajectory()
+        X = foo._solve((0.0, 0.0, 0.0), foo._runtime_alpha)
+        full = foo.path
+        foo.enable_trajectory(maxlen=2)
+        foo._solve((0.0, 0.0, 0.0), foo._runtime_alpha)
+        self.assertEqual(foo.path, full[-2:])
+        self.assertEqual(foo.path[-1], X)
+        self.assertEqual(foo.iter_conv, len(full) - 1)
+
+
+class TestConvergenceError(unittest.TestCase):
+
+    def test_fast_failure(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=-20, alpha=31, context="c")
+        for name in ("phiB", "phiD"):
+            seed = foo._seeds(name, foo._alpha, foo._beta, foo._phiD)[0]
+            with self.assertRaises(ConvergenceError) as context:
+                foo._solve(seed, getattr(foo, "_runtime_" + name))
+            error = context.exception
+            self.assertIsInstance(error, RuntimeError)
+            self.assertIn(error.reason, ("nan", "divergence", "stagnation"))
+            self.assertLess(error.iterations, 100)
+            self.assertEqual(len(error.X), 3)
+            self.assertEqual(foo.last_stats.reason, error.reason)
+
+    def test_steady_divergence(self):
+        # Full Newton steps drive the residual from 0.45 up to 99.
+        foo = EccwCompute(phiB=30, phiD=10, beta=0, alpha=26, context="c")
+        seed = foo._seeds("phiB", foo._alpha, foo._beta, foo._phiD)[1]
+        with self.assertRaises(ConvergenceError) as context:
+            foo._solve_Newton_kernel(seed, foo._runtime_phiB)
+        self.assertEqual(context.exception.reason, "stagnation")
+        self.assertLessEqual(context.exception.iterations, 5)
+        # Damped steps from the same seed reach the root.
+        phiB, _, _ = foo._solve(seed, foo._runtime_phiB)
+        self.assertAlmostEqual(np.degrees(phiB), 32.3927, places=3)
+        self.assertLessEqual(foo.last_stats.iterations, 15)
+
+    def test_roundoff_plateau(self):
+        # The residual can not go below 5e-14, over the "exact" tolerance.
+        foo = EccwCompute(phiB=30, phiD=5, beta=20, alpha=-9, context="e")
+        seed = foo._seeds("phiB", foo._alpha, foo._beta, foo._phiD)[1]
+        phiB, _, _ = foo._solve_Newton_kernel(seed, foo._runtime_phiB)
+        iterations, _, _, residual = foo._solve_counts
+        self.assertLess(residual, foo._roundoff)
+        self.assertLessEqual(iterations, 8 + foo._stagnation)
+        self.assertAlmostEqual(np.degrees(foo._test_phiB(phiB)), 11.4396, places=4)
+
+    def test_pickle(self):
+        error = ConvergenceError("message", (1.0, 2.0, 3.0), "nan", 4)
+        other = pickle.loads(pickle.dumps(error))
+        self.assertEqual(str(other), "message")
+        self.assertEqual((other.X, other.reason, other.iterations),
+                         ((1.0, 2.0, 3.0), "nan", 4))
+
+
+class TestFeasibility(unittest.TestCase):
+
+    def test_no_solve_off_domain(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=-20, alpha=31, context="c")
+        bar = EccwCompute(phiB=30, phiD=10, beta=60, alpha=25, context="c")
+        with collect_stats() as stats:
+            self.assertEqual(foo.compute_phiD(), ((), ()))  # alpha > phiB
+            self.assertEqual(bar.compute_phiB(), ((), ()))  # Taper too steep.
+        self.assertEqual(len(stats), 0)
+
+    def test_feasible_alpha(self):
+        from eccw import feasibility
+
+        foo = EccwCompute(phiB=30, phiD=10, context="c",
+                          rho_f=1000, rho_sr=3500,
+                          delta_lambdaB=0.5, delta_lambdaD=0.3)
+        for beta in range(-90, 180, 5):
+            foo.beta = beta
+            if not feasibility.feasible(foo, "alpha"):
+                self.assertEqual(foo.compute_alpha(method="brent"), ((), ()))
+
+    def test_many(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=-20, context="c")
+        alphas = np.linspace(-40, 40, 33)
+        inverse, normal = foo.compute_phiD_many(alpha=alphas)
+        for alpha, inv, nor in zip(alphas, inverse, normal):
+            foo.alpha = alpha
+            try:
+                expected = foo.compute_phiD()
+            except RuntimeError:
+                continue
+            np.testing.assert_allclose(inv[~np.isnan(inv)], expected[0])
+            np.testing.assert_allclose(nor[~np.isnan(nor)], expected[1])
+
+
+class TestPrecision(unittest.TestCase):
+
+    def test_tiers(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=20, alpha=10, context="c")
+        self.assertEqual(foo.precision, "exact")
+        for flag in ("alpha", "phiB", "phiD"):
+            exact = foo.compute(flag)
+            for precision, tol in (("fast", 1e-4), ("standard", 1e-8)):
+                result = foo.compute(flag, precision=precision)
+                for values, expected in zip(result, exact):
+                    np.testing.assert_allclose(values, expected, rtol=0, atol=tol)
+        self.assertEqual(foo.precision, "exact")
+
+    def test_per_instance(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=20, precision="fast")
+        self.assertEqual(foo.compute("alpha"), foo.compute("alpha", "fast"))
+        self.assertEqual(pickle.loads(pickle.dumps(foo)).precision, "fast")
+        with self.assertRaises(ValueError):
+            foo.precision = "rough"
+
+    def test_cache(self):
+        foo = EccwCompute(phiB=30, phiD=10, beta=20)
+        foo.enable_cache()
+        foo.compute_alpha()
+        foo.compute_alpha(precision="fast")
+        self.assertEqual(foo.cache_info().misses, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
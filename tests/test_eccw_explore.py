@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*
+
+import itertools
+import unittest
+
+import numpy as np
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+from eccw import EccwExplore
+
+
+class TestMatrixOfFunctionToRoot(unittest.TestCase):
+
+    def test_same_as_scalar(self):
+        foo = EccwExplore(phiB=30, phiD=10, alpha=5, beta=10, context="c",
+                          rho_f=1000, rho_sr=3500,
+                          delta_lambdaB=0.5, delta_lambdaD=0.3)
+        X, PSID, PSI0 = np.linspace(-1, 1, 4), np.linspace(-1, 1, 5), [0.1, 0.2]
+        for runtime_var in (foo._runtime_alpha, foo._runtime_phiB,
+                            foo._runtime_phiD):
+            matrix = foo._matrix_of_function_to_root(X, PSID, PSI0, runtime_var)
+            self.assertEqual(matrix.shape, (4, 5, 2))
+            for (i, x), (j, psiD), (k, psi0) in itertools.product(
+                enumerate(X), enumerate(PSID), enumerate(PSI0)
+            ):
+                F = foo._function_to_root((x, psiD, psi0), runtime_var)
+                self.assertAlmostEqual(matrix[i, j, k], np.mean(np.abs(F)),
+                                       places=12)
+
+    def test_projections(self):
+        foo = EccwExplore(phiB=30, phiD=20, beta=10, context="c")
+        foo._slab_size = 100  # Several slabs, some of them partial.
+        X, PSID, PSI0 = np.linspace(-1.5, 1.5, 13), np.linspace(-1, 1, 7), [0.1, 0.2]
+        matrix = foo._matrix_of_function_to_root(X, PSID, PSI0, foo._runtime_alpha)
+        mins, args = foo._projections_of_function_to_root(
+            X, PSID, PSI0, foo._runtime_alpha, argmin=True
+        )
+        for axis in range(3):
+            np.testing.assert_array_equal(mins[axis], matrix.min(axis=axis))
+            np.testing.assert_array_equal(args[axis], matrix.argmin(axis=axis))
+
+
+class TestSeedAtlas(unittest.TestCase):
+
+    def test_roots(self):
+        foo = EccwExplore(phiB=30, phiD=10, beta=0, context="c")
+        grid = np.linspace(-1.5, 1.5, 7)
+        atlas = foo.seed_atlas(foo._runtime_alpha, grid, grid, grid)
+        self.assertEqual(atlas.label.shape, (7, 7, 7))
+        self.assertEqual(atlas.iterations.shape, (7, 7, 7))
+        (a1,), (a2,) = foo.compute_alpha(deg=False)
+        inverse = atlas.roots[atlas.inverse, 0]
+        normal = atlas.roots[atlas.normal, 0]
+        np.testing.assert_allclose(inverse, [a1])
+        np.testing.assert_allclose(normal, [a2])
+        # Seeds of the solver reach a root of the atlas.
+        seed = np.searchsorted(grid, 0.0)
+        self.assertTrue(atlas.converged[seed, seed, seed])
+        self.assertFalse(atlas.diverged.any())
+
+    def test_draw_in_figure(self):
+        foo = EccwExplore(phiB=30, phiD=10, beta=0, context="c")
+        grid = np.linspace(-1.5, 1.5, 7)
+        atlas = foo.seed_atlas(foo._runtime_alpha, grid, grid, grid)
+        fignums = plt.get_fignums()
+        figure = Figure()
+        foo.draw_seed_atlas(atlas, figure=figure)
+        self.assertEqual(plt.get_fignums(), fignums)
+        mesh = figure.axes[0].collections[0]
+        self.assertEqual(mesh.get_cmap().N, 3)  # Two roots and others.
+
+
+class TestMapSolution(unittest.TestCase):
+
+    def test_restores_trajectory(self):
+        def interrupted(*args):
+            raise KeyboardInterrupt
+
+        foo = EccwExplore(phiB=30, phiD=10, beta=0, context="c")
+        foo._solve_for_map_solution = interrupted
+        with self.assertRaises(KeyboardInterrupt):
+            foo.draw_map_solution(foo._runtime_alpha, (0, 0, 0), (1, 1, 1))
+        self.assertIsNone(foo.trajectory)
+
+
+if __name__ == '__main__':
+    unittest.main()
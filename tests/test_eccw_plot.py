@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*
+
+import os
+import tempfile
+import unittest
+from math import degrees
+
+import numpy as np
+from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.figure import Figure
+
+from eccw import EccwPlot, sketch
+from eccw.render import RenderSpec, render
+
+
+class TestPlotUpdate(unittest.TestCase):
+
+    def setUp(self):
+        self.foo = EccwPlot(phiB=30, phiD=10, context="c")
+        self.foo.reset_figure()
+
+    def test_update_curve(self):
+        foo = self.foo
+        foo.add_curve(id="curve")
+        foo.phiB = 40
+        foo.update_curve("curve")
+        (line,) = foo._artists["curve"][2]
+        bs_up, as_up, bs_dw, as_dw = foo._curve_data()
+        np.testing.assert_array_equal(line.get_xdata(), bs_up + bs_dw[::-1])
+        np.testing.assert_array_equal(line.get_ydata(), as_up + as_dw[::-1])
+
+    def test_update_point_blit(self):
+        foo = self.foo
+        foo.add_curve()
+        foo.add_point(id="point", beta=20, sketch=True)
+        foo.figure.canvas.draw()
+        foo.update_point("point", beta=10, blit=True)
+        line, *sketches = foo._artists["point"][2]
+        foo.beta = 10
+        inverse, normal = foo.compute_alpha()
+        np.testing.assert_allclose(line.get_ydata(), inverse + normal)
+        self.assertEqual(len(sketches), 2)
+        self.assertTrue(all(a.get_animated() for a in [line] + sketches))
+
+    def test_remove(self):
+        foo = self.foo
+        foo.add_refpoint(id="ref", beta=0, alpha=0)
+        foo.update_refpoint("ref", beta=5)
+        self.assertEqual(list(foo._artists["ref"][2][0].get_xdata()), [5])
+        with self.assertRaises(ValueError):
+            foo.update_curve("ref")
+        foo.remove("ref")
+        with self.assertRaises(KeyError):
+            foo.update_refpoint("ref", beta=5)
+
+
+class TestSketch(unittest.TestCase):
+
+    def test_collections(self):
+        foo = EccwPlot(phiB=30, phiD=10, beta=20, alpha=-9.7921, context="c")
+        foo.reset_figure()
+        foo.add_curve()
+        ab = foo.add_sketch()
+        children = ab.offsetbox.get_children()
+        (faults,) = [c for c in children if isinstance(c, LineCollection)]
+        (arrows,) = [c for c in children if isinstance(c, PatchCollection)]
+        self.assertEqual(len(arrows.get_paths()), 6)
+        segments = np.array(faults.get_segments())
+        self.assertGreater(len(segments), 4)
+        self.assertTrue((segments >= foo._padding - 1e-9).all())
+        self.assertTrue((segments[..., 0] <= ab.offsetbox.width).all())
+        self.assertTrue((segments[..., 1] <= ab.offsetbox.height).all())
+
+    def test_geometry_many(self):
+        alpha = np.radians([[-9.7921, 20.0], [3.4365, 23.9463]])
+        beta = np.radians([[20.0, -3.5809], [0.0, 0.0]])
+        bottom = np.array([[True, False], [True, False]])
+        left = np.array([[False, True], [False, False]])
+        many = sketch.geometry(alpha, beta, np.radians(30.0), 1, bottom, left)
+        self.assertEqual(many.shape, (2, 2))
+        self.assertEqual(many.prism.shape, (2, 2, 103, 2))
+        for index, (a, b, bo, le) in enumerate(
+            zip(alpha.ravel(), beta.ravel(), bottom.ravel(), left.ravel())
+        ):
+            one = sketch.geometry(a, b, np.radians(30.0), 1, bo, le)
+            self.assertEqual(one.shape, ())
+            taken = many.take(index)
+            for x, y in zip(one, taken):
+                np.testing.assert_allclose(x, y, rtol=1e-12)
+
+    def test_geometry_no_prism(self):
+        geometry = sketch.geometry(-0.1, 0.05, 0.5, -1, False, True)
+        self.assertTrue(np.isnan(geometry.box).all())
+        self.assertEqual(len(geometry.faults), 0)
+
+
+class TestDeferredFigure(unittest.TestCase):
+
+    def test_no_figure_for_data(self):
+        fignums = plt.get_fignums()
+        foo = EccwPlot(phiB=30, phiD=10, context="c")
+        foo._curve_data()
+        foo.reset_figure()
+        self.assertEqual(plt.get_fignums(), fignums)
+
+    def test_attach_to_axes(self):
+        figure = Figure()
+        axe = figure.add_subplot(2, 1, 2)
+        foo = EccwPlot(phiB=30, phiD=10, context="c", axe=axe)
+        foo.add_curve()
+        self.assertIs(foo.figure, figure)
+        self.assertIs(foo.axe, axe)
+        self.assertEqual(len(axe.lines), 1)
+        foo.reset_figure()
+        self.assertEqual(len(axe.lines), 0)
+        self.assertTrue(axe.get_xlabel())
+
+
+class TestRender(unittest.TestCase):
+
+    def test_render(self):
+        fignums = plt.get_fignums()
+        with tempfile.TemporaryDirectory() as folder:
+            specs = [
+                RenderSpec(
+                    os.path.join(folder, f"{phiD}.png"),
+                    dict(phiB=30, phiD=phiD),
+                    [("add_curve", {}), ("add_point", dict(beta=10, sketch=True))],
+                )
+                for phiD in (5, 10)
+            ]
+            paths = render(specs, workers=1)
+            self.assertEqual(paths, [spec.path for spec in specs])
+            for path in paths:
+                self.assertGreater(os.path.getsize(path), 0)
+        self.assertEqual(plt.get_fignums(), fignums)
+
+    def test_wrong_call(self):
+        with self.assertRaises(ValueError):
+            render([("foo.png", dict(phiB=30), [("compute", {})])])
+        with self.assertRaises(ValueError):
+            render([("foo.png", dict(phiB=30), [], "map")])
+
+
+class TestCurveSampling(unittest.TestCase):
+
+    def _assert_sampling(self, foo, tolerance):
+        alphas = foo._sample_alphas(tolerance)
+        params = (foo._phiB, foo._phiD, foo._density_ratio)
+        params += (foo._lambdaB, foo._lambdaD)
+        betas = np.array(foo._beta_branches(alphas, *params))
+        # Both ends of the curve are reached.
+        alphamax = foo._get_alphamax()
+        np.testing.assert_allclose(alphas[[0, -1]], [-alphamax, alphamax])
+        self.assertTrue((~np.isnan(betas[:, [0, -1]])).any(axis=0).all())
+        # Chords deviate from the curve by less than tolerance.
+        t = np.linspace(0.0, 1.0, 17)[1:-1]
+        fine = alphas[:-1, None] + t * np.diff(alphas)[:, None]
+        fine_betas = np.array(foo._beta_branches(fine.ravel(), *params))
+        fine_betas = fine_betas.reshape(4, *fine.shape)
+        chords = betas[:, :-1, None] + t * np.diff(betas)[..., None]
+        self.assertLessEqual(np.nanmax(abs(fine_betas - chords)),
+                             np.radians(tolerance))
+        return alphas
+
+    def test_tolerance(self):
+        for context in ("c", "e"):
+            foo = EccwPlot(phiB=30, phiD=10, context=context)
+            for tolerance in (1e-1, 1e-2, 1e-3):
+                alphas = self._assert_sampling(foo, tolerance)
+                self.assertLess(alphas.size, 1000)
+
+    def test_add_curve(self):
+        foo = EccwPlot(phiB=30, phiD=10, context="c")
+        foo.reset_figure()
+        foo.add_curve(id="coarse", tolerance=1e-1)
+        foo.add_curve(id="fine")
+        (coarse,) = foo._artists["coarse"][2]
+        (fine,) = foo._artists["fine"][2]
+        self.assertLess(len(coarse.get_xdata()), len(fine.get_xdata()))
+        self.assertLess(len(fine.get_xdata()), 1000)
+        alphamax = degrees(foo._get_alphamax())
+        self.assertAlmostEqual(max(fine.get_ydata()), alphamax, places=9)
+        self.assertAlmostEqual(min(fine.get_ydata()), -alphamax, places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()